@@ -0,0 +1,70 @@
+"""
+Cost of moving a large molecule between QCSchema and RDKit: setting a conformer atom by atom or in bulk, and
+converting a gradient element by element or as a whole array.
+
+    python devtools/scripts/bench_rdkit_conversion.py --repeats 5
+"""
+
+import argparse
+import time
+
+import numpy as np
+from qcelemental.models.v2 import Molecule
+from rdkit import Chem
+
+import qcengine as qcng
+from qcengine.units import ureg
+
+parser = argparse.ArgumentParser(
+    description="Times the RDKit conformer and gradient conversions of a ~5000 atom cluster."
+)
+parser.add_argument("--repeats", type=int, default=5, help="The number of calls of which the fastest is kept")
+args = parser.parse_args()
+
+
+def best_time(func, nrepeats):
+    best = float("inf")
+    for _ in range(nrepeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# a ~5000 atom fragment from a grid of stock propane molecules 6 A apart
+propane = qcng.get_molecule("propane", return_dict=True)
+natom = len(propane["symbols"])
+shifts = np.array([[x, y, z] for x in range(8) for y in range(8) for z in range(7)]) * 6.0 / 0.52917721
+cluster = Molecule(
+    symbols=propane["symbols"] * len(shifts),
+    geometry=(np.reshape(propane["geometry"], (1, -1, 3)) + shifts[:, None, :]).reshape(-1, 3),
+    connectivity=[(a + i * natom, b + i * natom, o) for i in range(len(shifts)) for a, b, o in propane["connectivity"]],
+    fix_com=True,
+    fix_orientation=True,
+)
+bohr2ang = ureg.conversion_factor("bohr", "angstrom")
+
+
+def per_atom_conformer():
+    conf = Chem.Conformer(len(cluster.symbols))
+    for line in range(len(cluster.symbols)):
+        conf.SetAtomPosition(line, tuple(bohr2ang * cluster.geometry[line]))
+
+
+def bulk_conformer():
+    conf = Chem.Conformer(len(cluster.symbols))
+    conf.SetPositions(cluster.geometry * bohr2ang)
+
+
+gradient = list(np.random.default_rng(0).random(3 * len(cluster.symbols)))
+
+print(f"{len(cluster.symbols)} atoms")
+print("conformer, per atom    {:8.2f} ms".format(best_time(per_atom_conformer, args.repeats) * 1e3))
+if hasattr(Chem.Conformer, "SetPositions"):
+    print("conformer, bulk        {:8.2f} ms".format(best_time(bulk_conformer, args.repeats) * 1e3))
+print(
+    "gradient, per element  {:8.2f} ms".format(best_time(lambda: [x * bohr2ang for x in gradient], args.repeats) * 1e3)
+)
+print(
+    "gradient, whole array  {:8.2f} ms".format(best_time(lambda: np.asarray(gradient) * bohr2ang, args.repeats) * 1e3)
+)
@@ -0,0 +1,44 @@
+"""
+Throughput of a PyTorch-based program for 1, 4, and 16 concurrent jobs dividing a node's cores among them.
+
+    python devtools/scripts/bench_torch_threads.py --program torchani --method ANI2x --ncores 16
+"""
+
+import argparse
+import time
+
+import numpy as np
+from qcelemental.models.v2 import AtomicInput, Molecule
+
+import qcengine as qcng
+
+parser = argparse.ArgumentParser(description="Times compute_many over 1, 4, and 16 workers sharing a node.")
+parser.add_argument("--program", type=str, default="torchani", help="The PyTorch-based program to run")
+parser.add_argument("--method", type=str, default="ANI2x", help="The model of the program")
+parser.add_argument("--molecule", type=str, default="eneyne", help="The molecule from qcng.get_molecule to run")
+parser.add_argument("--ncores", type=int, default=16, help="The cores of the node to divide among the jobs")
+parser.add_argument("--ninputs", type=int, default=64, help="The number of gradients to compute for each count")
+args = parser.parse_args()
+
+rng = np.random.default_rng(0)
+molecule = qcng.get_molecule(args.molecule, return_dict=True)
+inputs = [
+    AtomicInput(
+        molecule=Molecule(
+            **{
+                **molecule,
+                "geometry": np.array(molecule["geometry"]) + rng.normal(0, 0.01, np.shape(molecule["geometry"])),
+            }
+        ),
+        specification={"driver": "gradient", "model": {"method": args.method}},
+    )
+    for _ in range(args.ninputs)
+]
+
+print("{:>6} {:>14} {:>12} {:>14}".format("jobs", "ncores / job", "wall (s)", "inputs / s"))
+for njobs in [1, 4, 16]:
+    task_config = {"ncores": max(1, args.ncores // njobs), "jobs_per_node": njobs}
+    start = time.perf_counter()
+    rets = qcng.compute_many(inputs, args.program, task_config=task_config, max_workers=njobs, raise_error=True)
+    wall = time.perf_counter() - start
+    print("{:>6} {:>14} {:>12.2f} {:>14.1f}".format(njobs, task_config["ncores"], wall, len(rets) / wall))
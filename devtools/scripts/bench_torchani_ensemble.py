@@ -0,0 +1,38 @@
+"""
+Per-call latency of a TorchANI ensemble with shared AEVs against calling each member on its own.
+
+    python devtools/scripts/bench_torchani_ensemble.py --method ANI2x --repeats 20
+"""
+
+import argparse
+import time
+
+import torch
+
+import qcengine as qcng
+
+parser = argparse.ArgumentParser(description="Times shared-AEV and member-by-member TorchANI ensemble evaluation.")
+parser.add_argument("--method", type=str, default="ANI2x", help="The TorchANI model to time")
+parser.add_argument("--repeats", type=int, default=20, help="The number of calls of which the fastest is kept")
+args = parser.parse_args()
+
+
+def latency(func, nrepeats):
+    best = float("inf")
+    for _ in range(nrepeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+harness = qcng.get_program("torchani")
+model = harness.get_model(args.method)
+
+print("{:<10} {:>12} {:>12}".format("molecule", "shared (ms)", "looped (ms)"))
+with torch.no_grad():
+    for name in ["hydrogen", "water", "ethane", "propane", "eneyne"]:
+        species, coordinates = harness.batch_tensors(model, [qcng.get_molecule(name, return_dict=False)])
+        shared = latency(lambda: model((species, coordinates)), args.repeats)
+        looped = latency(lambda: model.looped_members(species, coordinates), args.repeats)
+        print("{:<10} {:>12.2f} {:>12.2f}".format(name, shared * 1e3, looped * 1e3))
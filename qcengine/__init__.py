@@ -8,13 +8,25 @@ __git_revision__ = "(no longer provided)"
 del version
 
 # isort: off
-from . import config, exceptions
-from .compute import compute, compute_procedure
+from . import config, discovery, exceptions, result_cache, session
+from .compute import compute, compute_async, compute_batch, compute_many, compute_procedure
 from .config import get_config
 from .extras import get_information
-from .mdi_server import MDIServer
 from .procedures import get_procedure, list_all_procedures, list_available_procedures
 from .programs import get_program, list_all_programs, list_available_programs, register_program, unregister_program
-from .stock_mols import get_molecule
+from .session import open_session
 
 # isort: on
+
+# Rarely needed and imported on first access, see `__getattr__`
+_lazy_attributes = {"MDIServer": ".mdi_server", "get_molecule": ".stock_mols"}
+
+
+def __getattr__(name: str):
+    if name in _lazy_attributes:
+        from importlib import import_module
+
+        value = getattr(import_module(_lazy_attributes[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,22 +4,38 @@ Integrates the computes together
 import os
 import sys
 import warnings
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed as futures_as_completed
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import qcelemental
 
-from .config import get_config
+from .config import get_config, get_node_descriptor
 from .exceptions import InputError, RandomError
-from .procedures import get_procedure
+from .procedures import get_procedure, list_all_procedures
 from .programs import get_program
-from .util import QCEL_V1V2_SHIM_CODE, compute_wrapper, environ_context, handle_output_metadata
+from .programs.model import harness_lock
+from .result_cache import get_result_cache
+from .scratch import scratch_context
+from .util import (
+    QCEL_V1V2_SHIM_CODE,
+    apply_capture_policy,
+    apply_scratch_annotation,
+    compute_wrapper,
+    environ_context,
+    handle_output_metadata,
+    task_environ_context,
+)
 
 if TYPE_CHECKING:
+    import numpy as np
     from pydantic.main import BaseModel
     from qcelemental.models.v2 import FailedOperation
 
+    from .config import TaskConfig
 
-__all__ = ["compute", "compute_procedure"]
+
+__all__ = ["compute", "compute_async", "compute_batch", "compute_many", "compute_procedure"]
 
 
 def _process_failure_and_return(model, return_dict, raise_error):
@@ -34,6 +50,87 @@ def _process_failure_and_return(model, return_dict, raise_error):
         return False
 
 
+def _prepare_compute(
+    input_data: Union[Dict[str, Any], "BaseModel"],
+    program: str,
+    task_config: Optional[Dict[str, Any]],
+    return_version: int,
+    return_dict: bool,
+    metadata: Dict[str, Any],
+) -> Tuple[Any, "BaseModel", "TaskConfig"]:
+    """Finds the harness, validates the input, and forms the TaskConfig shared by `compute` and `compute_async`.
+
+    The schema version to return is placed in ``metadata["return_version"]`` as soon as it is known.
+    """
+
+    # Grab the executor harness
+    # check membership rather than catching the InputError, whose traceback formatting is not free
+    if program.lower() in list_all_procedures():
+        executor = get_procedure(program)
+    else:
+        executor = get_program(program)
+
+    # Build the model and validate
+    # * calls model_wrapper with the (Atomic|Optimization|etc)Input for which the harness was designed
+    # * upon return, input_data is a model of the type (e.g., Atomic) and version (e.g., 1 or 2) the harness prefers: all v2.
+    input_data, input_schema_version = executor.build_input_model(input_data, return_input_schema_version=True)
+    return_version = input_schema_version if return_version == -1 else return_version
+    metadata["return_version"] = return_version
+
+    # V1V2TEST if return_version == 1:
+    if sys.version_info >= (3, 14) and return_version == 1:  # forbidden by pydantic ...
+
+        _MSG314 = (
+            f"QCSchema v1 models (this: {input_data.schema_name}) cannot be instantiated in this environment. "
+            + "Reason: pydantic.v1 is unavailable on Python 3.14+. You can: "
+            + "(a) use Python <3.14; or "
+            + "(b) use QCSchema v2 (either input or ask for output with `return_version=2`; "
+            + " note that QCSchema v2 not finalized until QCElemental v0.60); or "
+            + "(c) ask for a QCSchema v1 dictionary back rather than the model with `return_dict=True` "
+            + " while setting envvar `QCNG_USE_V1V2_SHIM=1` to acknowledge this is brittle."
+        )
+
+        # V1V2TEST if input_data.schema_name == "qcschema_atomic_input":
+        if (
+            return_dict is True and input_data.schema_name == "qcschema_atomic_input"
+        ):  # ... but we have a workaround ...
+
+            if bool(os.environ.get("QCNG_USE_V1V2_SHIM", False)):  # ... if choose to use it
+                # return_version = -12 = QCEL_V1V2_SHIM_CODE signals to use the shim classes that represent certain
+                #   QCSchema v1 layouts (QCSk v1 only exist in pydantic.v1 API) in pydantic v2 API.
+                #   We never want to release these into the wild so only available if returning
+                #   dict and only for Atomic models (i.e., shims not avail for TD, MBE; shim avail for Opt but not enabled here).
+                metadata["return_version"] = QCEL_V1V2_SHIM_CODE
+            else:
+                # reset retver so that FailedOp w/_MSG314 can be constructed
+                metadata["return_version"] = 2
+                raise RuntimeError(_MSG314)
+        else:
+            # reset retver so that FailedOp w/_MSG314 can be constructed
+            metadata["return_version"] = 2
+            raise RuntimeError(_MSG314)
+
+    # Build out task_config
+    if task_config is None:
+        task_config = {}
+    input_engine_options = {}
+    if "_qcengine_local_config" in input_data.specification.extras:
+        # strip the options on a copy as a validated input may be the caller's own model
+        extras = dict(input_data.specification.extras)
+        input_engine_options = extras.pop("_qcengine_local_config")
+        specification = input_data.specification.model_copy(update={"extras": extras})
+        input_data = input_data.model_copy(update={"specification": specification})
+    task_config = {**task_config, **input_engine_options}
+    config = get_config(task_config=task_config)
+
+    # Serve repeated atomic computations from the opt-in result cache
+    result_cache = get_result_cache()
+    if result_cache is not None:
+        executor = result_cache.wrap(executor)
+
+    return executor, input_data, config
+
+
 def compute(
     input_data: Union[Dict[str, Any], "BaseModel"],  # TODO Input base class
     program: str,
@@ -151,73 +248,85 @@ def compute(
 
     """
 
-    try:
-        # models, v1 or v2
-        output_data = input_data.model_copy()
-    except AttributeError:
-        # dicts
-        output_data = input_data.copy()  # lgtm [py/multiple-definition]
+    # models, v1 or v2, are frozen so can be shared; dicts are filled in place on error so are copied
+    output_data = input_data.copy() if isinstance(input_data, dict) else input_data
 
     with compute_wrapper(capture_output=False, raise_error=raise_error) as metadata:
-        # Grab the executor harness
-        try:
-            executor = get_procedure(program)
-        except InputError:
-            executor = get_program(program)
+        executor, input_data, config = _prepare_compute(
+            input_data, program, task_config, return_version, return_dict, metadata
+        )
+        return_version = metadata["return_version"]
 
-        # Build the model and validate
-        # * calls model_wrapper with the (Atomic|Optimization|etc)Input for which the harness was designed
-        # * upon return, input_data is a model of the type (e.g., Atomic) and version (e.g., 1 or 2) the harness prefers: all v2.
-        input_data, input_schema_version = executor.build_input_model(input_data, return_input_schema_version=True)
-        return_version = input_schema_version if return_version == -1 else return_version
-
-        # V1V2TEST if return_version == 1:
-        if sys.version_info >= (3, 14) and return_version == 1:  # forbidden by pydantic ...
-
-            _MSG314 = (
-                f"QCSchema v1 models (this: {input_data.schema_name}) cannot be instantiated in this environment. "
-                + "Reason: pydantic.v1 is unavailable on Python 3.14+. You can: "
-                + "(a) use Python <3.14; or "
-                + "(b) use QCSchema v2 (either input or ask for output with `return_version=2`; "
-                + " note that QCSchema v2 not finalized until QCElemental v0.60); or "
-                + "(c) ask for a QCSchema v1 dictionary back rather than the model with `return_dict=True` "
-                + " while setting envvar `QCNG_USE_V1V2_SHIM=1` to acknowledge this is brittle."
-            )
+        # Set environment parameters and execute
+        with environ_context(config=config), scratch_context(config):
 
-            # V1V2TEST if input_data.schema_name == "qcschema_atomic_input":
-            if (
-                return_dict is True and input_data.schema_name == "qcschema_atomic_input"
-            ):  # ... but we have a workaround ...
-
-                if bool(os.environ.get("QCNG_USE_V1V2_SHIM", False)):  # ... if choose to use it
-                    # return_version = -12 = QCEL_V1V2_SHIM_CODE signals to use the shim classes that represent certain
-                    #   QCSchema v1 layouts (QCSk v1 only exist in pydantic.v1 API) in pydantic v2 API.
-                    #   We never want to release these into the wild so only available if returning
-                    #   dict and only for Atomic models (i.e., shims not avail for TD, MBE; shim avail for Opt but not enabled here).
-                    return_version = QCEL_V1V2_SHIM_CODE
-                else:
-                    # reset retver so that FailedOp w/_MSG314 can be constructed
-                    return_version = 2
-                    raise RuntimeError(_MSG314)
-            else:
-                # reset retver so that FailedOp w/_MSG314 can be constructed
-                return_version = 2
-                raise RuntimeError(_MSG314)
+            # Handle optional retries
+            for x in range(config.retries + 1):
+                try:
+                    with harness_lock(executor):
+                        output_data = executor.compute(input_data, config)
+                    output_data = apply_capture_policy(output_data, config)
+                    output_data = apply_scratch_annotation(output_data)
+                    break
+                except RandomError as e:
+                    if return_version >= 2:
+                        output_data = input_data
+
+                    if x == config.retries:
+                        raise e
+                    else:
+                        metadata["retries"] += 1
+                except Exception:
+                    if return_version >= 2:
+                        output_data = input_data
+                    raise
 
-        # Build out task_config
-        if task_config is None:
-            task_config = {}
-        input_engine_options = input_data.specification.extras.pop("_qcengine_local_config", {})
-        task_config = {**task_config, **input_engine_options}
-        config = get_config(task_config=task_config)
+    return handle_output_metadata(
+        output_data,
+        metadata,
+        raise_error=raise_error,
+        return_dict=return_dict,
+        convert_version=metadata.get("return_version", return_version),
+    )
 
-        # Set environment parameters and execute
-        with environ_context(config=config):
+
+async def compute_async(
+    input_data: Union[Dict[str, Any], "BaseModel"],
+    program: str,
+    raise_error: bool = False,
+    task_config: Optional[Dict[str, Any]] = None,
+    return_dict: bool = False,
+    return_version: int = -1,
+) -> Union["BaseModel", "FailedOperation", Dict[str, Any]]:
+    """Executes a single CMS program given a QCSchema input, awaiting the harness.
+
+    Parameters and return are as for :func:`compute`. Harnesses that launch external executables
+    through :func:`~qcengine.util.execute_async` are awaited natively, so many such jobs can be
+    supervised from one event loop. All other harnesses run in the loop's default executor.
+
+    Rather than modifying ``os.environ``, the threading variables from the TaskConfig are
+    handed to child processes of this task alone, so concurrent tasks do not interfere.
+
+    """
+
+    # models, v1 or v2, are frozen so can be shared; dicts are filled in place on error so are copied
+    output_data = input_data.copy() if isinstance(input_data, dict) else input_data
+
+    with compute_wrapper(capture_output=False, raise_error=raise_error) as metadata:
+        executor, input_data, config = _prepare_compute(
+            input_data, program, task_config, return_version, return_dict, metadata
+        )
+        return_version = metadata["return_version"]
+
+        # Set environment parameters for this task's processes and execute
+        with task_environ_context(config=config), scratch_context(config):
 
             # Handle optional retries
             for x in range(config.retries + 1):
                 try:
-                    output_data = executor.compute(input_data, config)
+                    output_data = await executor.compute_async(input_data, config)
+                    output_data = apply_capture_policy(output_data, config)
+                    output_data = apply_scratch_annotation(output_data)
                     break
                 except RandomError as e:
                     if return_version >= 2:
@@ -233,10 +342,252 @@ def compute(
                     raise
 
     return handle_output_metadata(
-        output_data, metadata, raise_error=raise_error, return_dict=return_dict, convert_version=return_version
+        output_data,
+        metadata,
+        raise_error=raise_error,
+        return_dict=return_dict,
+        convert_version=metadata.get("return_version", return_version),
     )
 
 
+def _compute_many_task_config(
+    program: str, task_config: Optional[Dict[str, Any]], max_workers: Optional[int], ninputs: int
+) -> Tuple[int, Dict[str, Any]]:
+    """Determines the number of workers and the per-worker task_config for :func:`compute_many`."""
+
+    task_config = {} if task_config is None else task_config.copy()
+
+    # resolved as in `_prepare_compute`
+    try:
+        if program.lower() in list_all_procedures():
+            executor = get_procedure(program)
+        else:
+            executor = get_program(program)
+    except Exception:
+        # let each compute call encode the failure
+        return 1, task_config
+
+    # procedures do not declare parallelism, treat them like threaded programs
+    thread_parallel = getattr(executor, "thread_parallel", True)
+
+    if max_workers is None:
+        if "jobs_per_node" in task_config:
+            max_workers = int(task_config["jobs_per_node"])
+        elif thread_parallel:
+            max_workers = get_node_descriptor().jobs_per_node
+        else:
+            # a serial program can have every core of the node to itself
+            max_workers = get_config(task_config={**task_config, "jobs_per_node": 1}).ncores
+    max_workers = max(1, min(max_workers, ninputs))
+
+    # split the node among the workers, get_config divides both cores and memory
+    task_config["jobs_per_node"] = max_workers
+    if not thread_parallel:
+        task_config.setdefault("ncores", 1)
+
+    return max_workers, task_config
+
+
+def _compute_many_worker(index: int, input_data: Any, program: str, kwargs: Dict[str, Any]) -> Tuple[int, Any]:
+    return index, compute(input_data, program, **kwargs)
+
+
+def _compute_many_completed(
+    inputs: List[Any], program: str, max_workers: int, kwargs: Dict[str, Any]
+) -> Iterator[Tuple[int, Any]]:
+    if max_workers == 1:
+        for index, input_data in enumerate(inputs):
+            yield _compute_many_worker(index, input_data, program, kwargs)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_compute_many_worker, index, input_data, program, kwargs)
+            for index, input_data in enumerate(inputs)
+        ]
+        try:
+            for future in futures_as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def compute_many(
+    inputs: Iterable[Union[Dict[str, Any], "BaseModel"]],
+    program: str,
+    raise_error: bool = False,
+    task_config: Optional[Dict[str, Any]] = None,
+    return_dict: bool = False,
+    return_version: int = -1,
+    max_workers: Optional[int] = None,
+    as_completed: bool = False,
+) -> Union[List[Union["BaseModel", "FailedOperation", Dict[str, Any]]], Iterator[Tuple[int, Any]]]:
+    """Executes many QCSchema inputs with a single CMS program over a pool of worker processes.
+
+    Each input is run through :func:`compute` in a worker process, so the usual
+    environment handling (``OMP_NUM_THREADS``, etc.) and retry logic apply per input.
+    The node resources from :func:`~qcengine.get_config` are divided among the workers
+    as if ``jobs_per_node`` were the number of workers.
+
+    Parameters
+    ----------
+    inputs
+        QCSchema input specifications in dictionary or model form.
+    program
+        The CMS program or procedure with which to execute the inputs.
+    raise_error
+        See :func:`compute`. With ``as_completed=False``, the first error raised is propagated.
+    task_config
+        A dictionary of local configuration options corresponding to a TaskConfig object.
+        If ``jobs_per_node`` is present, it sets the default number of workers.
+    return_dict
+        See :func:`compute`.
+    return_version
+        See :func:`compute`.
+    max_workers
+        The number of worker processes. By default, the node's ``jobs_per_node`` for programs that
+        are ``thread_parallel`` and one worker per core (each with ``ncores=1``) for those that are not.
+        Never more than the number of inputs. With a single worker, inputs are run in this process.
+    as_completed
+        If ``True``, return an iterator of ``(index, result)`` tuples in completion order
+        rather than a list of results in input order.
+
+    Returns
+    -------
+    results
+        A list of results in the order of ``inputs`` or, for ``as_completed=True``, an iterator of
+        ``(index, result)`` tuples. The results are those that :func:`compute` would return.
+
+    Notes
+    -----
+    Workers are separate processes, so harnesses that are not ``thread_safe`` are never entered
+    concurrently within one interpreter. Programs registered at runtime through
+    :func:`~qcengine.register_program` are only visible to workers on platforms that fork.
+
+    """
+    inputs = list(inputs)
+    nworkers, worker_config = _compute_many_task_config(program, task_config, max_workers, len(inputs))
+
+    kwargs = {
+        "raise_error": raise_error,
+        "task_config": worker_config,
+        "return_dict": return_dict,
+        "return_version": return_version,
+    }
+    completed = _compute_many_completed(inputs, program, nworkers, kwargs)
+
+    if as_completed:
+        return completed
+
+    results = [None] * len(inputs)
+    for index, result in completed:
+        results[index] = result
+    return results
+
+
+def compute_batch(
+    inputs: Iterable[Union[Dict[str, Any], "BaseModel"]],
+    program: str,
+    raise_error: bool = False,
+    task_config: Optional[Dict[str, Any]] = None,
+    return_dict: bool = False,
+    return_version: int = -1,
+    *,
+    geometries: Optional["np.ndarray"] = None,
+) -> List[Union["BaseModel", "FailedOperation", Dict[str, Any]]]:
+    """Executes many QCSchema atomic inputs with one in-process program, handing them to its harness at once.
+
+    Harnesses of machine-learned potentials and force fields (e.g., TorchANI, MACE, AIMNET2, RDKit) evaluate
+    such a batch in one pass; others run its inputs one after another. Each input is validated and its result
+    finalized as by :func:`compute`, so an invalid input fails alone, while an error from the harness fails
+    all inputs of its batch. Inputs with different task configurations are run as separate batches.
+
+    Parameters
+    ----------
+    inputs
+        QCSchema ``AtomicInput`` specifications in dictionary or model form.
+    program
+        The CMS program with which to execute the inputs. Procedures are not batched.
+    raise_error, task_config, return_dict, return_version
+        See :func:`compute`. Retries are not made.
+    geometries
+        Many geometries, of shape ``(n, natom, 3)`` in bohr, at which to run the molecule of a single input.
+        The results carry copies of the molecule with these geometries.
+
+    Returns
+    -------
+    results
+        The results, in the order of `inputs` or of `geometries`. Their wall time is that of their batch.
+
+    """
+    if program.lower() in list_all_procedures():
+        raise InputError(f"compute_batch runs programs, not the procedure {program}.")
+
+    inputs = list(inputs)
+    if geometries is not None and len(inputs) != 1:
+        raise InputError("compute_batch takes geometries for a single input only.")
+
+    # Validate each input on its own, as compute would, expanding a single input over geometries
+    jobs = []
+    for input_data in inputs:
+        # models, v1 or v2, are frozen so can be shared; dicts are filled in place on error so are copied
+        output_data = input_data.copy() if isinstance(input_data, dict) else input_data
+        expanded = None
+        with compute_wrapper(capture_output=False, raise_error=raise_error) as metadata:
+            executor, input_data, config = _prepare_compute(
+                input_data, program, task_config, return_version, return_dict, metadata
+            )
+            # batches bypass the result cache, so work with the harness itself
+            harness = getattr(executor, "harness", executor)
+            expanded = harness._geometry_inputs([input_data], geometries)
+
+        if expanded is None:
+            jobs.append({"output_data": output_data, "input_data": None, "metadata": metadata})
+            continue
+        for input_data in expanded:
+            output_data = input_data if geometries is not None else output_data
+            jobs.append(
+                {
+                    "output_data": output_data,
+                    "input_data": input_data,
+                    "metadata": dict(metadata),
+                    "harness": harness,
+                    "config": config,
+                }
+            )
+
+    # One harness call for each task configuration, in input order within it
+    batches = {}
+    for job in jobs:
+        if job["input_data"] is not None:
+            batches.setdefault(job["config"].model_dump_json(), []).append(job)
+
+    for batch in batches.values():
+        harness, config = batch[0]["harness"], batch[0]["config"]
+        with compute_wrapper(capture_output=False, raise_error=raise_error) as metadata:
+            with environ_context(config=config), scratch_context(config), harness_lock(harness):
+                outputs = harness.compute_batch([job["input_data"] for job in batch], config)
+            for job, output_data in zip(batch, outputs):
+                job["output_data"] = apply_capture_policy(output_data, config)
+
+        for job in batch:
+            if not metadata["success"] and job["metadata"]["return_version"] >= 2:
+                job["output_data"] = job["input_data"]
+            job["metadata"].update(metadata)
+
+    return [
+        handle_output_metadata(
+            job["output_data"],
+            job["metadata"],
+            raise_error=raise_error,
+            return_dict=return_dict,
+            convert_version=job["metadata"].get("return_version", return_version),
+        )
+        for job in jobs
+    ]
+
+
 def compute_procedure(*args, **kwargs):
     from qcelemental.models.common_models import _qcsk_v2_default_v1_importpathschange
 
@@ -4,33 +4,150 @@ Creates globals for the qcengine module
 
 import fnmatch
 import getpass
+import json
 import logging
 import os
 import socket
-from typing import Any, Dict, Optional, Union
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Literal, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .extras import get_information
 
-__all__ = ["get_config", "get_provenance_augments", "global_repr", "NodeDescriptor"]
+__all__ = ["get_config", "clear_config_cache", "get_provenance_augments", "global_repr", "NodeDescriptor"]
 
 # Start a globals dictionary with small starting values
 _global_values = None
+_cpu_values = {}
 NODE_DESCRIPTORS = {}
 LOGGER = logging.getLogger("QCEngine")
 LOGGER.setLevel(logging.CRITICAL)
 
+# Resolved NodeDescriptors per hostname and recently built TaskConfigs, see `clear_config_cache`
+_node_cache = {}
+_config_cache = OrderedDict()
+_config_cache_size = 256
+_config_lock = threading.Lock()
+
+# Globals that are only needed for provenance and are slow to discover
+_CPU_GLOBALS = ("cpu_brand", "cpuinfo")
+
+
+def get_cache_directory() -> Optional[str]:
+    """
+    Directory for QCEngine's on-disk caches, ``$QCNG_CACHE_DIR`` or ``~/.qcarchive``. Setting
+    ``QCNG_CACHE_DIR`` to an empty string turns the caches off.
+    """
+    path = os.environ.get("QCNG_CACHE_DIR", os.path.join("~", ".qcarchive"))
+    return os.path.expanduser(path) if path else None
+
+
+def _boot_id() -> str:
+    try:
+        with open("/proc/sys/kernel/random/boot_id", "r") as handle:
+            return handle.read().strip()
+    except OSError:
+        import psutil
+
+        return str(int(psutil.boot_time()))
+
+
+def _proc_cpu_brand() -> Optional[str]:
+    """The ``model name`` of the first processor in /proc/cpuinfo, where the kernel reports one."""
+    try:
+        with open("/proc/cpuinfo", "r") as handle:
+            for line in handle:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return None
+
+
+def _cached_cpu_info() -> Dict[str, Any]:
+    """
+    Output of ``cpuinfo.get_cpu_info()``, which may spawn subprocesses and take about a second, cached on
+    disk for the current boot of this host.
+    """
+    import cpuinfo
+
+    hostname = socket.gethostname()
+    host = f"{hostname}:{_boot_id()}"
+
+    directory = get_cache_directory()
+    path = None if directory is None else os.path.join(directory, "qcengine_cpuinfo.json")
+
+    cache = {}
+    if path is not None:
+        try:
+            with open(path, "r") as handle:
+                cache = json.load(handle)
+        except (OSError, ValueError):
+            pass
+        if not isinstance(cache, dict):
+            cache = {}
+
+    if isinstance(cache.get(host), dict):
+        return cache[host]
+
+    info = cpuinfo.get_cpu_info()
+
+    if path is not None:
+        # Home directories are often shared across a cluster, so keep other hosts but not past boots
+        cache = {k: v for k, v in cache.items() if not k.startswith(f"{hostname}:")}
+        cache[host] = info
+        tmp_path = f"{path}.{os.getpid()}"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, "w") as handle:
+                json.dump(cache, handle)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            LOGGER.info(f"Could not write the CPU information cache {path}: {exc}")
+
+    return info
+
+
+def _get_cpu_global(key: str) -> Any:
+    if key not in _cpu_values:
+        if key == "cpu_brand":
+            brand = _proc_cpu_brand()
+            if brand:
+                _cpu_values["cpu_brand"] = brand
+                return brand
+
+        info = _cached_cpu_info()
+        _cpu_values["cpuinfo"] = info
+        if "cpu_brand" not in _cpu_values:
+            try:
+                _cpu_values["cpu_brand"] = info["brand_raw"]
+            except KeyError:
+                # Remove this if py-cpuinfo is pinned to >=6.0.0
+                _cpu_values["cpu_brand"] = info.get("brand", "(unknown)")
+
+    return _cpu_values[key]
+
 
 # Generic globals
 def get_global(key: Optional[str] = None) -> Union[str, Dict[str, Any]]:
-    import cpuinfo
+    """
+    The global value of `key`, or all of them if `key` is ``None``.
+
+    The CPU brand and ``cpuinfo`` are discovered only once requested, by key or by the call without one,
+    which includes ``cpuinfo`` and so is as slow as the first ``get_global("cpuinfo")``. Ask for a key to
+    avoid that.
+    """
     import psutil
 
     # TODO (wardlt): Implement a means of getting CPU information from compute nodes on clusters for MPI tasks
     #  The QC code runs on a different node than the node running this Python function, which may have different info
 
+    if key in _CPU_GLOBALS:
+        return _get_cpu_global(key)
+
     global _global_values
     if _global_values is None:
         _global_values = {}
@@ -54,15 +171,8 @@ def get_global(key: Optional[str] = None) -> Union[str, Dict[str, Any]]:
         _global_values["ncores"] = cpu_cnt
         _global_values["nnodes"] = 1
 
-        _global_values["cpuinfo"] = cpuinfo.get_cpu_info()
-        try:
-            _global_values["cpu_brand"] = _global_values["cpuinfo"]["brand_raw"]
-        except KeyError:
-            # Remove this if py-cpuinfo is pinned to >=6.0.0
-            _global_values["cpu_brand"] = _global_values["cpuinfo"].get("brand", "(unknown)")
-
     if key is None:
-        return _global_values.copy()
+        return {**_global_values, **{k: _get_cpu_global(k) for k in _CPU_GLOBALS}}
     else:
         return _global_values[key]
 
@@ -90,6 +200,22 @@ class NodeDescriptor(BaseModel):
     jobs_per_node: int = 1
     retries: int = 0
 
+    # Scratch management
+    scratch_pool: int = Field(
+        0,
+        description="Number of empty scratch directories to keep ready for reuse. When non-zero, or with "
+        "``scratch_tmpfs``, scratch directories are taken from a pool and emptied in a background thread, which "
+        "saves metadata operations on parallel filesystems for short jobs.",
+    )
+    scratch_tmpfs: Optional[str] = Field(
+        None,
+        description="RAM-backed directory (e.g., ``/dev/shm``, or ``auto`` to detect it) for the scratch of programs "
+        "whose recorded scratch usage is below ``scratch_tmpfs_max``.",
+    )
+    scratch_tmpfs_max: float = Field(
+        0.25, description="Largest scratch usage in GiB of a program to use ``scratch_tmpfs``."
+    )
+
     # Cluster options
     is_batch_node: bool = Field(
         False,
@@ -160,6 +286,21 @@ class TaskConfig(BaseSettings):
     use_mpiexec: bool = False  # Whether it is necessary to use MPI to run an executable
     cores_per_rank: int = Field(1, description="Number of cores per MPI rank")
     scratch_messy: bool = Field(False, description="Leave scratch directory and contents on disk after completion.")
+    capture_policy: Literal["full", "tail", "head_tail", "discard_on_success"] = Field(
+        "full",
+        description="How much of the stdout and stderr of a successful result to keep: all of it, the last or the "
+        "first and last ``capture_size`` bytes, or none.",
+    )
+    capture_size: int = Field(2**20, description="Bytes of output kept at each retained end by ``capture_policy``.")
+    scratch_pool: int = Field(0, description="Number of empty scratch directories to keep ready, see NodeDescriptor")
+    scratch_tmpfs: Optional[str] = Field(None, description="RAM-backed scratch for small jobs, see NodeDescriptor")
+    scratch_tmpfs_max: float = Field(0.25, description="Largest scratch usage in GiB to use ``scratch_tmpfs``.")
+    model_cache_size: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Number of models, force fields, or OpenMM Systems and Contexts that in-process harnesses keep "
+        "loaded. The harness's default if None.",
+    )
 
     model_config = SettingsConfigDict(
         extra="forbid",
@@ -241,17 +382,25 @@ def get_node_descriptor(hostname: Optional[str] = None) -> NodeDescriptor:
     if hostname is None:
         hostname = get_global("hostname")
 
+    # The match depends only on the names and patterns of NODE_DESCRIPTORS in order, so it holds while they do.
+    #   The matched entry is looked up afresh, as it may have been replaced under the same name.
+    fingerprint = tuple((name, node.hostname_pattern) for name, node in NODE_DESCRIPTORS.items())
+    cached = _node_cache.get(hostname)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[2] if cached[1] is None else NODE_DESCRIPTORS[cached[1]]
+
     # Find a match
     for name, node in NODE_DESCRIPTORS.items():
 
         if fnmatch.fnmatch(hostname, node.hostname_pattern):
-            config = node
+            match, config = name, node
             break
     else:
-        config = NodeDescriptor(
+        match, config = None, NodeDescriptor(
             name="default", hostname_pattern="*", memory=get_global("memory"), ncores=get_global("ncores")
         )
 
+    _node_cache[hostname] = (fingerprint, match, config)
     return config
 
 
@@ -274,12 +423,8 @@ def read_qcengine_task_environment() -> Dict[str, Any]:
     Reads the qcengine task-related environment variables and returns a dictionary of the values.
     """
 
-    ret = {}
-    for k, v in os.environ.items():
-        if k.startswith("QCENGINE_"):
-            ret[k[9:].lower()] = v
-
-    return ret
+    # Only look up the values of matching keys, decoding them all is most of the cost of `get_config`
+    return {k[9:].lower(): os.environ[k] for k in os.environ if k.startswith("QCENGINE_")}
 
 
 def get_config(*, hostname: Optional[str] = None, task_config: Dict[str, Any] = None) -> TaskConfig:
@@ -292,14 +437,43 @@ def get_config(*, hostname: Optional[str] = None, task_config: Dict[str, Any] =
 
     task_config_env = read_qcengine_task_environment()
     task_config = {**task_config_env, **parse_environment(task_config)}
+    node = get_node_descriptor(hostname)
+
+    # The overrides already include all QCENGINE_* variables, so with the node they determine the result
+    key = (node.model_dump_json(), tuple(sorted(task_config.items())))
+    try:
+        hash(key)
+    except TypeError:
+        key = None
+
+    if key is not None:
+        with _config_lock:
+            cached = _config_cache.get(key)
+            if cached is not None:
+                _config_cache.move_to_end(key)
+                return cached.model_copy()
+
+    ret = _build_config(node, task_config)
+
+    if key is not None:
+        with _config_lock:
+            _config_cache[key] = ret
+            while len(_config_cache) > _config_cache_size:
+                _config_cache.popitem(last=False)
+
+    return ret.model_copy()
 
+
+def _build_config(node: NodeDescriptor, task_config: Dict[str, Any]) -> TaskConfig:
     config = {}
 
     # Node data
-    node = get_node_descriptor(hostname)
     ncores = node.ncores or get_global("ncores")
     config["scratch_directory"] = task_config.pop("scratch_directory", node.scratch_directory)
     config["retries"] = task_config.pop("retries", node.retries)
+    config["scratch_pool"] = task_config.pop("scratch_pool", node.scratch_pool)
+    config["scratch_tmpfs"] = task_config.pop("scratch_tmpfs", node.scratch_tmpfs)
+    config["scratch_tmpfs_max"] = task_config.pop("scratch_tmpfs_max", node.scratch_tmpfs_max)
 
     # Jobs per node
     jobs_per_node = int(task_config.pop("jobs_per_node", None) or node.jobs_per_node)
@@ -340,6 +514,18 @@ def get_config(*, hostname: Optional[str] = None, task_config: Dict[str, Any] =
     return TaskConfig(**config)
 
 
+def clear_config_cache() -> None:
+    """
+    Forgets the cached NodeDescriptor matches and TaskConfigs so that `get_config` rebuilds them.
+
+    Changes to ``QCENGINE_*`` environment variables, to the task overrides, and to ``NODE_DESCRIPTORS``,
+    including NodeDescriptors modified in place, are picked up without this.
+    """
+    with _config_lock:
+        _node_cache.clear()
+        _config_cache.clear()
+
+
 def get_provenance_augments() -> Dict[str, str]:
     return {
         "cpu": get_global("cpu_brand"),
@@ -0,0 +1,162 @@
+"""
+A per-process cache of whether harnesses can find their programs, so that repeated lookups in the
+registries skip PATH searches, imports, subprocesses, and server connections, and an on-disk cache
+of program versions shared across processes
+"""
+
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+from .config import LOGGER, get_cache_directory
+
+if TYPE_CHECKING:
+    from .procedures.model import ProcedureHarness
+    from .programs.model import ProgramHarness
+
+__all__ = ["found", "clear_discovery_cache", "set_discovery_ttl", "load_version", "store_version"]
+
+# Seconds that a successful and a failed discovery are trusted for
+_found_ttl = 600.0
+_missing_ttl = 5.0
+
+# (harness type, name) -> (expiry, found, error raised by the probe)
+_cache: Dict[Tuple[type, str], Tuple[float, bool, Optional[Exception]]] = {}
+_lock = threading.Lock()
+
+_VERSION_FILE = "qcengine_versions.json"
+
+
+def found(harness: Union["ProgramHarness", "ProcedureHarness"], raise_error: bool = False) -> bool:
+    """
+    As ``harness.found(raise_error)``, but answered from the cache while the last probe is fresh.
+
+    The harness is always probed with ``raise_error=True`` so that a cached failure can be raised again
+    for callers that ask for it.
+    """
+    key = (type(harness), harness.name.lower())
+    now = time.monotonic()
+
+    with _lock:
+        entry = _cache.get(key)
+
+    if entry is None or entry[0] <= now:
+        try:
+            ret, error = bool(harness.found(raise_error=True)), None
+        except Exception as exc:
+            ret, error = False, exc
+
+        entry = (now + (_found_ttl if ret else _missing_ttl), ret, error)
+        with _lock:
+            _cache[key] = entry
+
+    _, ret, error = entry
+    if raise_error and error is not None:
+        # Drop the traceback of earlier raises so it does not grow with each cache hit
+        raise error.with_traceback(None)
+    return ret
+
+
+def set_discovery_ttl(found: Optional[float] = None, missing: Optional[float] = None) -> None:
+    """
+    Sets how long discovery results are reused, in seconds. A TTL of 0 probes on every lookup.
+
+    Parameters
+    ----------
+    found
+        TTL for programs that were found, 600 s by default.
+    missing
+        TTL for programs that could not be found, 5 s by default, so that newly installed or
+        started programs are picked up quickly.
+    """
+    global _found_ttl, _missing_ttl
+    if found is not None:
+        _found_ttl = found
+    if missing is not None:
+        _missing_ttl = missing
+    clear_discovery_cache()
+
+
+def clear_discovery_cache() -> None:
+    """Forgets all discovery results, for instance after installing a program or changing PATH."""
+    with _lock:
+        _cache.clear()
+
+
+def _version_entry(executable: str, environment: Optional[Dict[str, Any]]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    if not executable:
+        return None
+    try:
+        # the file run, through any symlinks, and the path it was found under
+        stat = os.stat(executable)
+        link = os.lstat(executable)
+    except OSError:
+        return None
+
+    path = os.path.abspath(executable)
+    real_path = os.path.realpath(executable)
+    key = path if path == real_path else f"{path} -> {real_path}"
+    if environment:
+        key += " " + json.dumps(environment, sort_keys=True)
+    return key, {"mtime": stat.st_mtime_ns, "size": stat.st_size, "link_mtime": link.st_mtime_ns}
+
+
+def _read_versions(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "r") as handle:
+            versions = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return versions if isinstance(versions, dict) else {}
+
+
+def load_version(executable: str, environment: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """
+    The version stored for `executable` by :func:`store_version`, if the file has not changed since.
+
+    Parameters
+    ----------
+    executable
+        Path of the program, as found by ``which``.
+    environment
+        Further values that the version depends on, such as installation directories.
+    """
+    directory = get_cache_directory()
+    entry = _version_entry(executable, environment)
+    if directory is None or entry is None:
+        return None
+
+    key, stamp = entry
+    stored = _read_versions(os.path.join(directory, _VERSION_FILE)).get(key)
+    if isinstance(stored, dict) and all(stored.get(k) == v for k, v in stamp.items()):
+        return stored.get("version")
+    return None
+
+
+def store_version(executable: str, version: str, environment: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Stores the `version` of `executable` for other processes, keyed on its path, resolved real path, and
+    `environment`, and stamped with the mtime and size of both, so that it is dropped once the program is
+    changed. The file is ``qcengine_versions.json`` in ``$QCNG_CACHE_DIR``.
+    """
+    directory = get_cache_directory()
+    entry = _version_entry(executable, environment)
+    if directory is None or entry is None:
+        return
+
+    key, stamp = entry
+    path = os.path.join(directory, _VERSION_FILE)
+    tmp_path = f"{path}.{os.getpid()}"
+
+    # Concurrent writers may drop each other's entries, which only costs a probe run later
+    versions = _read_versions(path)
+    versions[key] = {**stamp, "version": version}
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(tmp_path, "w") as handle:
+            json.dump(versions, handle, indent=1)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        LOGGER.info(f"Could not write the version cache {path}: {exc}")
@@ -2,21 +2,22 @@
 Imports the various procedure backends
 """
 
-from typing import Set
+import threading
+from importlib import import_module
+from typing import Dict, Set
 
+from .. import discovery
 from ..exceptions import InputError, ResourceError
-from .berny import BernyProcedure
-from .geometric import GeometricProcedure
 from .model import ProcedureHarness
-from .nwchem_opt import NWChemDriverProcedure
-from .optking import OptKingProcedure
-from .qcmanybody import QCManyBodyProcedure
-from .torsiondrive import TorsionDriveProcedure
 
 __all__ = ["register_procedure", "get_procedure", "list_all_procedures", "list_available_procedures"]
 
 procedures = {}
 
+# Procedures that ship with QCEngine as "module:class" paths, imported and instantiated on first use
+_lazy_procedures: Dict[str, str] = {}
+_registry_lock = threading.RLock()
+
 
 def register_procedure(entry_point: ProcedureHarness) -> None:
     """
@@ -24,12 +25,25 @@ def register_procedure(entry_point: ProcedureHarness) -> None:
     """
 
     name = entry_point.name
-    if name.lower() in procedures.keys():
+    if name.lower() in list_all_procedures():
         raise ValueError("{} is already a registered procedure.".format(name))
 
     procedures[name.lower()] = entry_point
 
 
+def _register_lazy_procedure(name: str, path: str) -> None:
+    _lazy_procedures[name] = path
+
+
+def _load_procedure(name: str) -> None:
+    with _registry_lock:
+        path = _lazy_procedures.get(name)
+        if path is not None:
+            module, cls = path.split(":")
+            procedures[name] = getattr(import_module(module, __package__), cls)()
+            del _lazy_procedures[name]
+
+
 def get_procedure(name: str) -> ProcedureHarness:
     """
     Returns a procedures executor class
@@ -37,11 +51,12 @@ def get_procedure(name: str) -> ProcedureHarness:
 
     name = name.lower()
 
+    _load_procedure(name)
     if name not in procedures:
         raise InputError(f"Procedure {name} is not registered to QCEngine.")
 
     ret = procedures[name]
-    if not ret.found():
+    if not discovery.found(ret):
         raise ResourceError(f"Procedure {name} is registered with QCEngine, but cannot be found.")
 
     return ret
@@ -51,7 +66,7 @@ def list_all_procedures() -> Set[str]:
     """
     List all procedures registered by QCEngine.
     """
-    return set(procedures.keys())
+    return set(procedures.keys()) | set(_lazy_procedures.keys())
 
 
 def list_available_procedures() -> Set[str]:
@@ -60,16 +75,17 @@ def list_available_procedures() -> Set[str]:
     """
 
     ret = set()
-    for k, p in procedures.items():
-        if p.found():
+    for k in list_all_procedures():
+        _load_procedure(k)
+        if discovery.found(procedures[k]):
             ret.add(k)
 
     return ret
 
 
-register_procedure(GeometricProcedure())
-register_procedure(OptKingProcedure())
-register_procedure(BernyProcedure())
-register_procedure(QCManyBodyProcedure())
-register_procedure(NWChemDriverProcedure())
-register_procedure(TorsionDriveProcedure())
+_register_lazy_procedure("geometric", ".geometric:GeometricProcedure")
+_register_lazy_procedure("optking", ".optking:OptKingProcedure")
+_register_lazy_procedure("berny", ".berny:BernyProcedure")
+_register_lazy_procedure("qcmanybody", ".qcmanybody:QCManyBodyProcedure")
+_register_lazy_procedure("nwchemdriver", ".nwchem_opt:NWChemDriverProcedure")
+_register_lazy_procedure("torsiondrive", ".torsiondrive:TorsionDriveProcedure")
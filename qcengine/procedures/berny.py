@@ -5,7 +5,7 @@ from io import StringIO
 from typing import Any, ClassVar, Dict, Union
 
 import numpy as np
-from qcelemental.models.v2 import FailedOperation, Molecule, OptimizationInput, OptimizationResult
+from qcelemental.models.v2 import AtomicInput, FailedOperation, OptimizationInput, OptimizationResult
 from qcelemental.util import which_import
 
 import qcengine
@@ -55,48 +55,50 @@ class BernyProcedure(ProcedureHarness):
         log = logging.getLogger(f"{__name__}.{id(self)}")
         log.addHandler(logging.StreamHandler(log_stream))
         log.setLevel("INFO")
-        input_data = input_model.model_dump()
-
-        geom_qcng = input_data["initial_molecule"]
-        comput = {"specification": input_data["specification"]["specification"], "molecule": geom_qcng}
-        program = input_data["specification"]["specification"][
-            "program"
-        ]  # TODO don't need to collect when compute can work w/o 2nd arg
-        task_config = config.dict()
+        # Build the gradient input once and swap in each new geometry. Both models are already
+        # validated, so the per-step copies skip a model_dump and re-validation.
+        program = (
+            input_model.specification.specification.program
+        )  # TODO don't need to collect when compute can work w/o 2nd arg
+        gradient_input = AtomicInput(
+            molecule=input_model.initial_molecule, specification=input_model.specification.specification
+        )
+        task_config = config.model_dump()
         trajectory = []
-        output_data = input_data.copy()
         try:
             # Pyberny uses angstroms for the Cartesian geometry, but atomic
             # units for everything else, including the gradients (hartree/bohr).
-            geom_berny = berny.Geometry(geom_qcng["symbols"], geom_qcng["geometry"] / berny.angstrom)
-            opt = berny.Berny(geom_berny, logger=log, **input_data["specification"]["keywords"])
+            geom_qcng = input_model.initial_molecule
+            geom_berny = berny.Geometry(geom_qcng.symbols, geom_qcng.geometry / berny.angstrom)
+            opt = berny.Berny(geom_berny, logger=log, **input_model.specification.keywords)
             for geom_berny in opt:
-                geom_qcng["geometry"] = np.stack(geom_berny.coords * berny.angstrom)
+                geom_qcng = geom_qcng.model_copy(update={"geometry": np.stack(geom_berny.coords * berny.angstrom)})
+                comput = gradient_input.model_copy(update={"molecule": geom_qcng})
                 ret = qcengine.compute(comput, program, task_config=task_config)
                 if ret.success:
-                    trajectory.append(ret.dict())
+                    trajectory.append(ret)
                     opt.send((ret.properties.return_energy, ret.return_result))
                 else:
                     # qcengine.compute returned FailedOperation
                     raise UnknownError("Gradient computation failed")
 
         except UnknownError:
-            error = ret.error.dict()  # ComputeError
+            error = ret.error.model_dump()  # ComputeError
         except Exception:
             error = {"error_type": "unknown", "error_message": f"Berny error:\n{traceback.format_exc()}"}
         else:
-            final_molecule = trajectory[-1]["molecule"]
+            final_molecule = trajectory[-1].molecule
             output = {
                 "input_data": input_model,
                 "final_molecule": final_molecule,
                 "properties": {
-                    "nuclear_repulsion_energy": Molecule(**final_molecule).nuclear_repulsion_energy(),
-                    "return_energy": trajectory[-1]["properties"]["return_energy"],
-                    "return_gradient": trajectory[-1]["properties"]["return_gradient"],
+                    "nuclear_repulsion_energy": final_molecule.nuclear_repulsion_energy(),
+                    "return_energy": trajectory[-1].properties.return_energy,
+                    "return_gradient": trajectory[-1].properties.return_gradient,
                     "optimization_iterations": len(trajectory),
                 },
                 "trajectory_results": trajectory,
-                "trajectory_properties": [r["properties"] for r in trajectory],
+                "trajectory_properties": [r.properties for r in trajectory],
                 "provenance": {"creator": "Berny", "routine": "berny.Berny", "version": berny_version},
                 "stdout": log_stream.getvalue(),  # collect logged messages
                 "success": True,
@@ -1,4 +1,5 @@
 import abc
+import asyncio
 import importlib
 from typing import Any, Dict, Tuple, Union
 
@@ -42,6 +43,14 @@ class ProcedureHarness(BaseModel, abc.ABC):
     def compute(self, input_data: "BaseModel", config: "TaskConfig") -> "BaseModel":
         pass
 
+    async def compute_async(self, input_data: "BaseModel", config: "TaskConfig") -> "BaseModel":
+        """Awaitable form of :meth:`compute`, by default run in a worker thread.
+
+        Programs that are not ``thread_safe`` are still run one at a time, as :func:`qcengine.compute`
+        holds their :func:`~qcengine.programs.model.harness_lock`.
+        """
+        return await asyncio.to_thread(self.compute, input_data, config)
+
     @abc.abstractmethod
     def found(self, raise_error: bool = False) -> bool:
         """
@@ -65,10 +74,11 @@ class ProcedureHarness(BaseModel, abc.ABC):
         v1_model = getattr(module_v1, model)
         v2_model = getattr(module_v2, model)
 
-        if isinstance(data, v1_model):
+        if isinstance(data, v2_model):
+            # fast path: already validated, frozen, and in the harness's preferred version
+            return (data, 2) if return_input_schema_version else data
+        elif isinstance(data, v1_model):
             mdl = model_wrapper(data, v1_model)
-        elif isinstance(data, v2_model):
-            mdl = model_wrapper(data, v2_model)
         elif isinstance(data, dict):
             # remember these are user-provided dictionaries, so they'll have the mandatory fields,
             #   like driver, not the helpful discriminator fields like schema_version.
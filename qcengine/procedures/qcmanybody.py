@@ -58,7 +58,8 @@ class QCManyBodyProcedure(ProcedureHarness):
         if isinstance(data, v1_model):
             mdl = model_wrapper(data, v1_model)
         elif v2_model is not None and isinstance(data, v2_model):
-            mdl = model_wrapper(data, v2_model)
+            # fast path: already validated, frozen, and in the harness's preferred version
+            return (data, 2) if return_input_schema_version else data
         elif isinstance(data, dict):
             # remember these are user-provided dictionaries, so they'll have the mandatory fields,
             #   like driver, not the helpful discriminator fields like schema_version.
@@ -1,27 +1,31 @@
-from typing import TYPE_CHECKING, Any, ClassVar, Dict
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Sequence
 
 from qcelemental.models.v2 import AtomicResult, Provenance
 from qcelemental.util import safe_version, which_import
 
 from qcengine.exceptions import InputError
 from qcengine.programs.model import ProgramHarness
+from qcengine.programs.util.model_cache import ModelCache
+from qcengine.programs.util.threads import torch_threads
 
 if TYPE_CHECKING:
+    import numpy as np
     from qcelemental.models.v2 import AtomicInput
 
     from qcengine.config import TaskConfig
+    from qcengine.session import Session
 
 
 class AIMNET2Harness(ProgramHarness):
     """A harness to run AIMNET2 models <https://github.com/isayevlab/AIMNet2>"""
 
-    _CACHE = {}
+    _CACHE: ClassVar[ModelCache] = ModelCache()
 
     _defaults: ClassVar[Dict[str, Any]] = {
         "name": "AIMNET2",
         "scratch": False,
         "thread_safe": True,
-        "thread_parallel": False,
+        "thread_parallel": True,
         "node_parallel": False,
         "managed_memory": False,
     }
@@ -49,82 +53,142 @@ class AIMNET2Harness(ProgramHarness):
         return self.version_cache[which_prog]
 
     def load_model(self, name: str):
-        model_name = name.lower()
-        if model_name in self._CACHE:
-            return self._CACHE[model_name]
+        return self._load_model(name)[0]
 
+    def _load_model(self, name: str):
+        """The model for `name` and whether it was cached."""
         from pyaimnet2 import load_model
 
-        model = load_model(model_name=model_name)
-        self._CACHE[model_name] = model
-        return self._CACHE[model_name]
+        model_name = name.lower()
+        return self._resident(
+            ("model", model_name), lambda: self._CACHE.get(model_name, lambda: load_model(model_name=model_name))
+        )
+
+    def open_session(self, session: "Session") -> None:
+        # load the model up front, so the first computation is as quick as the rest
+        self.load_model(session.specification.model.method)
 
     def compute(self, input_data: "AtomicInput", config: "TaskConfig"):
+        return self.compute_batch([input_data], config)[0]
+
+    def compute_batch(
+        self,
+        inputs: Sequence["AtomicInput"],
+        config: "TaskConfig",
+        *,
+        geometries: Optional["np.ndarray"] = None,
+    ) -> List["AtomicResult"]:
+        """Runs many molecules, each with its own charge, in one padded forward pass per model, reporting
+        gradients for the gradient inputs only. Results are returned in input order. See
+        :meth:`ProgramHarness.compute_batch` for `geometries`."""
         self.found(raise_error=True)
-        import torch
+        self._CACHE.resize(config.model_cache_size)
 
-        from qcengine.units import ureg
+        inputs = self._geometry_inputs(inputs, geometries)
 
         # check we can run on the set of elements
         known_elements = {"H", "B", "C", "N", "O", "F", "Si", "P", "S", "Cl", "As", "Se", "Br", "I"}
-        target_elements = set(input_data.molecule.symbols)
 
-        unknown_elements = target_elements - known_elements
-        if unknown_elements:
-            raise InputError(
-                f"AIMNET2 model {input_data.specification.model.method} does not support elements {unknown_elements}."
-            )
+        groups = {}
+        for index, input_data in enumerate(inputs):
+            unknown_elements = set(input_data.molecule.symbols) - known_elements
+            if unknown_elements:
+                raise InputError(
+                    f"AIMNET2 model {input_data.specification.model.method} does not support elements {unknown_elements}."
+                )
+            if input_data.specification.driver not in ["energy", "gradient"]:
+                raise InputError(
+                    f"AIMNET2 can only compute energy and gradients driver methods. Requested {input_data.specification.driver} not supported."
+                )
+            groups.setdefault(input_data.specification.model.method, []).append(index)
+
+        results = [None] * len(inputs)
+        with torch_threads(config.ncores):
+            for method, indices in groups.items():
+                batch = [inputs[index] for index in indices]
+                for index, result in zip(indices, self._compute_group(batch, method)):
+                    results[index] = result
+        return results
+
+    def _compute_group(self, inputs: List["AtomicInput"], method: str) -> List["AtomicResult"]:
+        import numpy as np
+        import torch
+
+        from qcengine.units import ureg
 
-        method = input_data.specification.model.method
         # load the model using the method as the file name
-        model = self.load_model(name=method)
+        model, cache_hit = self._load_model(name=method)
+
+        # build the required input data, padding smaller molecules with atoms of number 0
+        num_atoms = [len(input_data.molecule.atomic_numbers) for input_data in inputs]
+        max_atoms = max(num_atoms)
+        coord = np.zeros((len(inputs), max_atoms, 3))
+        numbers = np.zeros((len(inputs), max_atoms), dtype=np.int64)
+        for i, input_data in enumerate(inputs):
+            coord[i, : num_atoms[i]] = input_data.molecule.geometry
+            numbers[i, : num_atoms[i]] = input_data.molecule.atomic_numbers
+        coord *= ureg.conversion_factor("bohr", "angstrom")
 
-        # build the required input data
         aimnet_input = {
-            "coord": torch.tensor(
-                [input_data.molecule.geometry * ureg.conversion_factor("bohr", "angstrom")],
-                dtype=torch.float64,
-                device="cpu",
+            "coord": torch.tensor(coord, dtype=torch.float64, device="cpu"),
+            "numbers": torch.tensor(numbers, dtype=torch.long, device="cpu"),
+            "charge": torch.tensor(
+                [input_data.molecule.molecular_charge for input_data in inputs], dtype=torch.float64, device="cpu"
             ),
-            "numbers": torch.tensor([input_data.molecule.atomic_numbers], dtype=torch.long, device="cpu"),
-            "charge": torch.tensor([input_data.molecule.molecular_charge], dtype=torch.float64, device="cpu"),
         }
 
-        if input_data.specification.driver == "gradient":
-            aimnet_input["coord"].requires_grad_(True)
+        # the model differentiates the energy with respect to the coordinates in its forward pass, so forces
+        # come with every evaluation and are only reported for gradients
+        aimnet_input["coord"].requires_grad_(True)
         out = model(aimnet_input)
 
-        ret_data = {
-            "input_data": input_data,
-            "molecule": input_data.molecule,
-            "success": False,
-            "properties": {
-                "return_energy": out["energy"].item() * ureg.conversion_factor("eV", "hartree"),
-                "return_gradient": (
-                    -1.0 * out["forces"][0].detach().numpy() * ureg.conversion_factor("eV / angstrom", "hartree / bohr")
-                ),
-                "calcinfo_natom": len(input_data.molecule.atomic_numbers),
-            },
-            "extras": {},
-        }
-        # update with calculated extras
-        ret_data["extras"]["aimnet2"] = {
-            "charges": out["charges"].detach()[0].cpu().numpy(),
-            "ensemble_charges_std": out["charges_std"].detach()[0].cpu().numpy(),
-            "ensemble_energy_std": out["energy_std"].item(),
-            "ensemble_forces_std": out["forces_std"].detach()[0].cpu().numpy(),
-        }
-        if input_data.specification.driver == "energy":
-            ret_data["return_result"] = ret_data["properties"]["return_energy"]
-        elif input_data.specification.driver == "gradient":
-            ret_data["return_result"] = ret_data["properties"]["return_gradient"]
-        else:
-            raise InputError(
-                f"AIMNET2 can only compute energy and gradients driver methods. Requested {input_data.specification.driver} not supported."
-            )
-
-        ret_data["provenance"] = Provenance(creator="pyaimnet2", version=self.get_version(), routine="load_model")
-
-        ret_data["success"] = True
-
-        return AtomicResult(**ret_data)
+        def per_molecule(key):
+            return out[key].detach().cpu().numpy() if key in out else None
+
+        energies = per_molecule("energy").reshape(-1) * ureg.conversion_factor("eV", "hartree")
+        energies_std = per_molecule("energy_std")
+        charges = per_molecule("charges")
+        charges_std = per_molecule("charges_std")
+        forces_std = per_molecule("forces_std")
+        if any(input_data.specification.driver == "gradient" for input_data in inputs):
+            gradients = -1.0 * per_molecule("forces") * ureg.conversion_factor("eV / angstrom", "hartree / bohr")
+
+        provenance = Provenance(creator="pyaimnet2", version=self.get_version(), routine="load_model")
+        model_cache = self._CACHE.annotation(cache_hit)
+
+        results = []
+        for i, input_data in enumerate(inputs):
+            natom = num_atoms[i]
+            ret_data = {
+                "input_data": input_data,
+                "molecule": input_data.molecule,
+                "success": False,
+                "properties": {
+                    "return_energy": float(energies[i]),
+                    "calcinfo_natom": natom,
+                },
+                "extras": {"qcengine_model_cache": model_cache},
+            }
+            # update with calculated extras, of which models without an ensemble lack the spreads
+            extras = ret_data["extras"]["aimnet2"] = {}
+            if charges is not None:
+                extras["charges"] = charges[i, :natom]
+            if charges_std is not None:
+                extras["ensemble_charges_std"] = charges_std[i, :natom]
+            if energies_std is not None:
+                extras["ensemble_energy_std"] = float(energies_std.reshape(-1)[i])
+            if forces_std is not None:
+                extras["ensemble_forces_std"] = forces_std[i, :natom]
+            if input_data.specification.driver == "gradient":
+                ret_data["properties"]["return_gradient"] = gradients[i, :natom]
+                ret_data["return_result"] = ret_data["properties"]["return_gradient"]
+            else:
+                ret_data["return_result"] = ret_data["properties"]["return_energy"]
+
+            ret_data["provenance"] = provenance
+
+            ret_data["success"] = True
+
+            results.append(AtomicResult(**ret_data))
+
+        return results
@@ -2,39 +2,22 @@
 Imports the various compute backends
 """
 
-from typing import Set
+import threading
+from importlib import import_module
+from typing import Dict, Set
 
+from .. import discovery
 from ..exceptions import InputError, ResourceError
-from .adcc import AdccHarness
-from .aimnet2 import AIMNET2Harness
-from .cfour import CFOURHarness
-from .dftd3 import DFTD3Harness
-from .dftd_ng import DFTD4Harness, SDFTD3Harness
-from .gamess import GAMESSHarness
-from .gcp import GCPHarness, MCTCGCPHarness
-from .mace import MACEHarness
 from .model import ProgramHarness
-from .molpro import MolproHarness
-from .mopac import MopacHarness
-from .mp2d import MP2DHarness
-from .mrchem import MRChemHarness
-from .nwchem import NWChemHarness
-from .openmm import OpenMMHarness
-from .psi4 import Psi4Harness
-from .qchem import QChemHarness
-from .qcore import EntosHarness, QcoreHarness
-from .rdkit import RDKitHarness
-from .terachem import TeraChemHarness
-from .terachem_frontend import TeraChemFrontEndHarness
-from .terachem_pbs import TeraChemPBSHarness
-from .torchani import TorchANIHarness
-from .turbomole import TurbomoleHarness
-from .xtb import XTBHarness
 
 __all__ = ["register_program", "get_program", "list_all_programs", "list_available_programs"]
 
 programs = {}
 
+# Harnesses that ship with QCEngine as "module:class" paths, imported and instantiated on first use
+_lazy_programs: Dict[str, str] = {}
+_registry_lock = threading.RLock()
+
 
 def register_program(entry_point: ProgramHarness) -> None:
     """
@@ -42,7 +25,7 @@ def register_program(entry_point: ProgramHarness) -> None:
     """
 
     name = entry_point.name
-    if name.lower() in programs.keys():
+    if name.lower() in list_all_programs():
         raise ValueError("{} is already a registered program.".format(name))
 
     programs[name.lower()] = entry_point
@@ -53,11 +36,25 @@ def unregister_program(name: str) -> None:
     Unregisters a given program.
     """
 
-    ret = programs.pop(name.lower(), None)
+    with _registry_lock:
+        ret = programs.pop(name.lower(), None) or _lazy_programs.pop(name.lower(), None)
     if ret is None:
         raise KeyError(f"Program {name} is not registered with QCEngine")
 
 
+def _register_lazy_program(name: str, path: str) -> None:
+    _lazy_programs[name] = path
+
+
+def _load_program(name: str) -> None:
+    with _registry_lock:
+        path = _lazy_programs.get(name)
+        if path is not None:
+            module, cls = path.split(":")
+            programs[name] = getattr(import_module(module, __package__), cls)()
+            del _lazy_programs[name]
+
+
 def get_program(name: str, check: bool = True) -> ProgramHarness:
     """
     Returns a program's executor class
@@ -72,13 +69,14 @@ def get_program(name: str, check: bool = True) -> ProgramHarness:
     """
     name = name.lower()
 
+    _load_program(name)
     if name not in programs:
         raise InputError(f"Program {name} is not registered to QCEngine.")
 
     ret = programs[name]
     if check:
         try:
-            ret.found(raise_error=True)
+            discovery.found(ret, raise_error=True)
         except ModuleNotFoundError as err:
             raise ResourceError(f"Program {name} is registered with QCEngine, but cannot be found.") from err
 
@@ -89,7 +87,7 @@ def list_all_programs() -> Set[str]:
     """
     List all programs registered by QCEngine.
     """
-    return set(programs.keys())
+    return set(programs.keys()) | set(_lazy_programs.keys())
 
 
 def list_available_programs() -> Set[str]:
@@ -98,46 +96,49 @@ def list_available_programs() -> Set[str]:
     """
 
     ret = set()
-    for k, p in programs.items():
-        if p.found():
+    for k in list_all_programs():
+        _load_program(k)
+        if discovery.found(programs[k]):
             ret.add(k)
 
     return ret
 
 
 # Quantum
-register_program(AdccHarness())
-register_program(CFOURHarness())
-register_program(EntosHarness())  # Duplicate of Qcore harness to transition the namespace, to be deprecated
-register_program(GAMESSHarness())
-register_program(MRChemHarness())
-register_program(MolproHarness())
-register_program(NWChemHarness())
-register_program(Psi4Harness())
-register_program(QChemHarness())
-register_program(QcoreHarness())
-register_program(TeraChemHarness())
-register_program(TurbomoleHarness())
-register_program(TeraChemFrontEndHarness())
-register_program(TeraChemPBSHarness())
+_register_lazy_program("adcc", ".adcc:AdccHarness")
+_register_lazy_program("cfour", ".cfour:CFOURHarness")
+_register_lazy_program(
+    "entos", ".qcore:EntosHarness"
+)  # Duplicate of Qcore harness to transition the namespace, to be deprecated
+_register_lazy_program("gamess", ".gamess:GAMESSHarness")
+_register_lazy_program("mrchem", ".mrchem:MRChemHarness")
+_register_lazy_program("molpro", ".molpro:MolproHarness")
+_register_lazy_program("nwchem", ".nwchem:NWChemHarness")
+_register_lazy_program("psi4", ".psi4:Psi4Harness")
+_register_lazy_program("qchem", ".qchem:QChemHarness")
+_register_lazy_program("qcore", ".qcore:QcoreHarness")
+_register_lazy_program("terachem", ".terachem:TeraChemHarness")
+_register_lazy_program("turbomole", ".turbomole:TurbomoleHarness")
+_register_lazy_program("terachem_fe", ".terachem_frontend:TeraChemFrontEndHarness")
+_register_lazy_program("terachem_pbs", ".terachem_pbs:TeraChemPBSHarness")
 
 # Semi-empirical
-register_program(MopacHarness())
-register_program(XTBHarness())
+_register_lazy_program("mopac", ".mopac:MopacHarness")
+_register_lazy_program("xtb", ".xtb:XTBHarness")
 
 # AI
-register_program(TorchANIHarness())
-register_program(MACEHarness())
-register_program(AIMNET2Harness())
+_register_lazy_program("torchani", ".torchani:TorchANIHarness")
+_register_lazy_program("mace", ".mace:MACEHarness")
+_register_lazy_program("aimnet2", ".aimnet2:AIMNET2Harness")
 
 # Molecular Mechanics
-register_program(RDKitHarness())
-register_program(OpenMMHarness())
+_register_lazy_program("rdkit", ".rdkit:RDKitHarness")
+_register_lazy_program("openmm", ".openmm:OpenMMHarness")
 
 # Analytical Corrections
-register_program(DFTD3Harness())
-register_program(DFTD4Harness())
-register_program(SDFTD3Harness())
-register_program(GCPHarness())
-register_program(MCTCGCPHarness())
-register_program(MP2DHarness())
+_register_lazy_program("dftd3", ".dftd3:DFTD3Harness")
+_register_lazy_program("dftd4", ".dftd_ng:DFTD4Harness")
+_register_lazy_program("s-dftd3", ".dftd_ng:SDFTD3Harness")
+_register_lazy_program("gcp", ".gcp:GCPHarness")
+_register_lazy_program("mctc-gcp", ".gcp:MCTCGCPHarness")
+_register_lazy_program("mp2d", ".mp2d:MP2DHarness")
@@ -11,7 +11,7 @@ from qcelemental.models.v2 import AtomicInput, AtomicResult, BasisSet, Provenanc
 from qcelemental.util import safe_version, which
 
 from ...exceptions import InputError, UnknownError
-from ...util import execute
+from ...util import execute, execute_async
 from ..model import ProgramHarness
 from ..qcvar_identities_resources import build_atomicproperties, build_out
 from ..util import error_stamp
@@ -51,16 +51,18 @@ class CFOURHarness(ProgramHarness):
         self.found(raise_error=True)
 
         which_prog = which("xcfour")
-        if which_prog not in self.version_cache:
+
+        def probe():
             success, output = execute([which_prog, "ZMAT"], {"ZMAT": "\nHe\n\n"})
+            if not success:
+                raise UnknownError(output["stderr"])
 
-            if success:
-                for line in output["stdout"].splitlines():
-                    if "Version" in line:
-                        branch = " ".join(line.strip().split()[1:])
-                self.version_cache[which_prog] = safe_version(branch)
+            for line in output["stdout"].splitlines():
+                if "Version" in line:
+                    branch = " ".join(line.strip().split()[1:])
+            return safe_version(branch)
 
-        return self.version_cache[which_prog]
+        return self._cached_version(which_prog, probe)
 
     def compute(self, input_model: AtomicInput, config: "TaskConfig") -> AtomicResult:
         self.found(raise_error=True)
@@ -68,6 +70,19 @@ class CFOURHarness(ProgramHarness):
         job_inputs = self.build_input(input_model, config)
         success, dexe = self.execute(job_inputs)
 
+        return self._collect_output(job_inputs, success, dexe, input_model)
+
+    async def compute_async(self, input_model: AtomicInput, config: "TaskConfig") -> AtomicResult:
+        self.found(raise_error=True)
+
+        job_inputs = self.build_input(input_model, config)
+        success, dexe = await self.execute_async(job_inputs)
+
+        return self._collect_output(job_inputs, success, dexe, input_model)
+
+    def _collect_output(
+        self, job_inputs: Dict[str, Any], success: bool, dexe: Dict[str, Any], input_model: AtomicInput
+    ) -> AtomicResult:
         if success:
             dexe["outfiles"]["stdout"] = dexe["stdout"]
             dexe["outfiles"]["stderr"] = dexe["stderr"]
@@ -152,6 +167,19 @@ class CFOURHarness(ProgramHarness):
         )
         return success, dexe
 
+    async def execute_async(
+        self, inputs: Dict[str, Any], *, extra_outfiles=None, extra_commands=None, scratch_name=None, timeout=None
+    ) -> Tuple[bool, Dict]:
+
+        success, dexe = await execute_async(
+            inputs["command"],
+            inputs["infiles"],
+            ["GRD", "FCMFINAL", "DIPOL"],
+            scratch_messy=inputs["scratch_messy"],
+            scratch_directory=inputs["scratch_directory"],
+        )
+        return success, dexe
+
     def parse_output(
         self, outfiles: Dict[str, str], input_model: AtomicInput
     ) -> AtomicResult:  # lgtm: [py/similar-function]
@@ -1,5 +1,6 @@
 """Compute quantum chemistry using Iowa State's GAMESS executable."""
 
+import asyncio
 import copy
 import pprint
 from decimal import Decimal
@@ -9,7 +10,7 @@ from qcelemental.models.v2 import AtomicInput, AtomicResult, BasisSet, Provenanc
 from qcelemental.util import safe_version, which
 
 from ...exceptions import InputError, UnknownError
-from ...util import execute
+from ...util import execute, execute_async
 from ..model import ProgramHarness
 from ..qcvar_identities_resources import build_atomicproperties, build_out
 from ..util import error_stamp
@@ -55,16 +56,18 @@ class GAMESSHarness(ProgramHarness):
         self.found(raise_error=True)
 
         which_prog = which("rungms")
-        if which_prog not in self.version_cache:
+
+        def probe():
             success, output = execute([which_prog, "v.inp"], {"v.inp": ""})
+            if not success:
+                raise UnknownError(output["stderr"])
 
-            if success:
-                for line in output["stdout"].splitlines():
-                    if "GAMESS VERSION" in line:
-                        branch = " ".join(line.strip(" *\t").split()[3:])
-                self.version_cache[which_prog] = safe_version(branch)
+            for line in output["stdout"].splitlines():
+                if "GAMESS VERSION" in line:
+                    branch = " ".join(line.strip(" *\t").split()[3:])
+            return safe_version(branch)
 
-        return self.version_cache[which_prog]
+        return self._cached_version(which_prog, probe)
 
     def compute(self, input_model: AtomicInput, config: "TaskConfig") -> AtomicResult:
         self.found(raise_error=True)
@@ -72,6 +75,20 @@ class GAMESSHarness(ProgramHarness):
         job_inputs = self.build_input(input_model, config)
         success, dexe = self.execute(job_inputs)
 
+        return self._collect_output(job_inputs, success, dexe, input_model)
+
+    async def compute_async(self, input_model: AtomicInput, config: "TaskConfig") -> AtomicResult:
+        self.found(raise_error=True)
+
+        # build_input runs blocking trial executions to settle memory, so keep it off the event loop
+        job_inputs = await asyncio.to_thread(self.build_input, input_model, config)
+        success, dexe = await self.execute_async(job_inputs)
+
+        return self._collect_output(job_inputs, success, dexe, input_model)
+
+    def _collect_output(
+        self, job_inputs: Dict[str, Any], success: bool, dexe: Dict[str, Any], input_model: AtomicInput
+    ) -> AtomicResult:
         if "INPUT HAS AT LEAST ONE SPELLING OR LOGIC MISTAKE" in dexe["stdout"]:
             raise InputError(error_stamp(job_inputs["infiles"]["gamess.inp"], dexe["stdout"], dexe["stderr"]))
 
@@ -205,6 +222,17 @@ class GAMESSHarness(ProgramHarness):
         )
         return success, dexe
 
+    async def execute_async(self, inputs, extra_outfiles=None, extra_commands=None, scratch_name=None, timeout=None):
+
+        success, dexe = await execute_async(
+            inputs["command"],
+            inputs["infiles"],
+            ["gamess.dat"],
+            scratch_messy=inputs["scratch_messy"],
+            scratch_directory=inputs["scratch_directory"],
+        )
+        return success, dexe
+
     def parse_output(self, outfiles: Dict[str, str], input_model: AtomicInput) -> AtomicResult:
 
         # Get the stdout from the calculation (required)
@@ -1,16 +1,21 @@
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Union
+import os
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Sequence, Union
 
 from qcelemental.models.v2 import AtomicResult, FailedOperation, Provenance
 from qcelemental.util import safe_version, which_import
 
 from qcengine.exceptions import InputError
 from qcengine.programs.model import ProgramHarness
+from qcengine.programs.util.model_cache import ModelCache
+from qcengine.programs.util.threads import torch_threads
 from qcengine.units import ureg
 
 if TYPE_CHECKING:
-    from qcelemental.models.v2 import AtomicInput, FailedOperation
+    import numpy as np
+    from qcelemental.models.v2 import AtomicInput, AtomicSpecification, FailedOperation
 
     from qcengine.config import TaskConfig
+    from qcengine.session import Session
 
 
 class MACEHarness(ProgramHarness):
@@ -19,13 +24,14 @@ class MACEHarness(ProgramHarness):
     The models can be found at <https://github.com/ACEsuit/mace-off>
     """
 
-    _CACHE = {}
+    _CACHE: ClassVar[ModelCache] = ModelCache()
+    _DTYPES = ("float32", "float64")
 
     _defaults: ClassVar[Dict[str, Any]] = {
         "name": "MACE",
         "scratch": False,
         "thread_safe": True,
-        "thread_parallel": False,
+        "thread_parallel": True,
         "node_parallel": False,
         "managed_memory": False,
     }
@@ -50,15 +56,31 @@ class MACEHarness(ProgramHarness):
 
         return self.version_cache[which_prog]
 
-    def load_model(self, name: str):
-        """Compile and cache the model to make it faster when calling many times in serial"""
+    def load_model(self, name: str, dtype: str = "float64"):
+        """Compile and cache the model to make it faster when calling many times in serial.
+        The model is placed on the device and converted to `dtype` once, here."""
+        return self._load_model(name, dtype)[0]
+
+    def _load_model(self, name: str, dtype: str = "float64"):
+        """The compiled model, its cutoff, and atomic numbers for `name`, and whether they were cached.
+        Local model files are reloaded when they change on disk, except within a session."""
+        if dtype not in self._DTYPES:
+            raise InputError(f"The mace harness runs models in {self._DTYPES}, not {dtype}.")
+
         model_name = name.lower()
-        if model_name in self._CACHE:
-            return self._CACHE[model_name]
+        if model_name in ["small", "medium", "large"]:
+            key = (model_name, dtype)
+            return self._resident(key, lambda: self._CACHE.get(key, lambda: self._compile_model(name, dtype)))
 
+        path = os.path.abspath(name)
+        key = (path, dtype)
+        return self._resident(key, lambda: self._CACHE.get(key, lambda: self._compile_model(path, dtype), path=path))
+
+    def _compile_model(self, name: str, dtype: str):
         import torch
         from e3nn.util import jit
 
+        model_name = name.lower()
         if model_name in ["small", "medium", "large"]:
             from mace.calculators.foundations_models import mace_off
 
@@ -70,14 +92,53 @@ class MACEHarness(ProgramHarness):
                 raise InputError(
                     "The mace harness can only run local models or a MACE-OFF23 model (`small`, `medium`, `large`)"
                 )
+        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        model = model.to(device=device, dtype=getattr(torch, dtype))
         comp_mod = jit.compile(model)
-        self._CACHE[model_name] = (comp_mod, float(model.r_max), model.atomic_numbers)
-        return self._CACHE[model_name]
+        return comp_mod, float(model.r_max), model.atomic_numbers
 
-    def compute(self, input_data: "AtomicInput", config: "TaskConfig") -> Union["AtomicResult", "FailedOperation"]:
+    @staticmethod
+    def _dtype(specification: "AtomicSpecification") -> str:
+        # float32 is quicker, and precise enough for screening
+        return specification.keywords.get("dtype", "float64")
 
-        self.found(raise_error=True)
+    def open_session(self, session: "Session") -> None:
+        # load the model up front, so the first computation is as quick as the rest
+        self.load_model(session.specification.model.method, self._dtype(session.specification))
 
+    def compute(self, input_data: "AtomicInput", config: "TaskConfig") -> Union["AtomicResult", "FailedOperation"]:
+        return self.compute_batch([input_data], config)[0]
+
+    def compute_batch(
+        self,
+        inputs: Sequence["AtomicInput"],
+        config: "TaskConfig",
+        *,
+        geometries: Optional["np.ndarray"] = None,
+    ) -> List["AtomicResult"]:
+        """Runs many inputs as one graph batch for each model and dtype, returning results in input order.
+        See :meth:`ProgramHarness.compute_batch` for `geometries`."""
+        self.found(raise_error=True)
+        self._CACHE.resize(config.model_cache_size)
+
+        inputs = self._geometry_inputs(inputs, geometries)
+
+        groups = {}
+        for index, input_data in enumerate(inputs):
+            if input_data.specification.driver not in ["energy", "gradient"]:
+                raise InputError("MACE only supports the energy and gradient driver methods.")
+            key = (input_data.specification.model.method, self._dtype(input_data.specification))
+            groups.setdefault(key, []).append(index)
+
+        results = [None] * len(inputs)
+        with torch_threads(config.ncores):
+            for (method, dtype), indices in groups.items():
+                batch = [inputs[index] for index in indices]
+                for index, result in zip(indices, self._compute_group(batch, method, dtype)):
+                    results[index] = result
+        return results
+
+    def _compute_group(self, inputs: List["AtomicInput"], method: str, dtype: str) -> List["AtomicResult"]:
         import mace
         import numpy as np
         import torch
@@ -85,59 +146,72 @@ class MACEHarness(ProgramHarness):
         from mace.data.utils import AtomicNumberTable, Configuration
         from mace.tools.torch_geometric import DataLoader
 
-        torch.set_default_dtype(torch.float64)
-
-        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        # Failure flag
-        ret_data = {"success": False}
-
-        # Build model
-        method = input_data.specification.model.method
-
         # load the torch model which can be a MACE-OFF23 or local model
-        model, r_max, atomic_numbers = self.load_model(name=method)
+        (model, r_max, atomic_numbers), cache_hit = self._load_model(method, dtype)
+        device = next(model.parameters()).device
 
         z_table = AtomicNumberTable([int(z) for z in atomic_numbers])
-        atomic_numbers = input_data.molecule.atomic_numbers
         pbc = (False, False, False)
-        # set the cell as None and mace will automatically create a cell big enough to include all atoms
-        cell = None
-
-        config = Configuration(
-            atomic_numbers=atomic_numbers,
-            positions=input_data.molecule.geometry * ureg.conversion_factor("bohr", "angstrom"),
-            pbc=pbc,
-            cell=cell,
-        )
 
-        data_loader = DataLoader(
-            dataset=[AtomicData.from_config(config, z_table=z_table, cutoff=r_max)],
-            batch_size=1,
-            shuffle=False,
-            drop_last=False,
-        )
-        input_dict = next(iter(data_loader)).to_dict()
-        model.to(device)
-        mace_data = model(input_dict, compute_force=True)
-        ret_data["properties"] = {"return_energy": mace_data["energy"] * ureg.conversion_factor("eV", "hartree")}
-
-        if input_data.specification.driver == "energy":
-            ret_data["return_result"] = ret_data["properties"]["return_energy"].detach().numpy().item()
-        elif input_data.specification.driver == "gradient":
-            ret_data["return_result"] = (
-                np.asarray(-1.0 * mace_data["forces"] * ureg.conversion_factor("eV / angstrom", "hartree / bohr"))
-                .ravel()
-                .tolist()
+        positions = [input_data.molecule.geometry * ureg.conversion_factor("bohr", "angstrom") for input_data in inputs]
+        dataset = [
+            AtomicData.from_config(
+                Configuration(
+                    atomic_numbers=input_data.molecule.atomic_numbers,
+                    positions=geom,
+                    pbc=pbc,
+                    # set the cell as None and mace will automatically create a cell big enough to include all atoms
+                    cell=None,
+                ),
+                z_table=z_table,
+                cutoff=r_max,
             )
+            for input_data, geom in zip(inputs, positions)
+        ]
+
+        # all molecules in one batch of disjoint graphs
+        data_loader = DataLoader(dataset=dataset, batch_size=len(dataset), shuffle=False, drop_last=False)
+        batch = next(iter(data_loader))
+
+        # AtomicData is built in torch's default dtype, so cast the batch to the model's rather than changing the
+        # process-wide default, and take the positions from the geometry so none are rounded through float32
+        torch_dtype = getattr(torch, dtype)
+        batch.apply(lambda tensor: tensor.to(torch_dtype) if tensor.is_floating_point() else tensor)
+        batch.positions = torch.as_tensor(np.concatenate(positions), dtype=torch_dtype)
+        batch = batch.to(device)
+        input_dict = batch.to_dict()
+
+        compute_force = any(input_data.specification.driver == "gradient" for input_data in inputs)
+        mace_data = model(input_dict, compute_force=compute_force)
+
+        energies = mace_data["energy"].detach().cpu().numpy() * ureg.conversion_factor("eV", "hartree")
+        if compute_force:
+            # forces of all atoms in the batch, split per molecule at the graph boundaries
+            forces = mace_data["forces"].detach().cpu().numpy() * ureg.conversion_factor(
+                "eV / angstrom", "hartree / bohr"
+            )
+            forces = np.split(forces, batch.ptr[1:-1].cpu().numpy())
 
-        else:
-            raise InputError("MACE only supports the energy and gradient driver methods.")
+        provenance = Provenance(creator="mace", version=mace.__version__, routine="mace")
+        model_cache = self._CACHE.annotation(cache_hit)
+
+        results = []
+        for i, input_data in enumerate(inputs):
+            ret_data = {"properties": {"return_energy": float(energies[i])}}
+
+            if input_data.specification.driver == "energy":
+                ret_data["return_result"] = ret_data["properties"]["return_energy"]
+            else:
+                ret_data["return_result"] = (-1.0 * forces[i]).ravel().tolist()
+
+            ret_data["input_data"] = input_data
+            ret_data["molecule"] = input_data.molecule
+            ret_data["extras"] = {"qcengine_model_cache": model_cache}
+            ret_data["provenance"] = provenance
+            ret_data["schema_name"] = "qcschema_atomic_result"
+            ret_data["success"] = True
 
-        ret_data["input_data"] = input_data
-        ret_data["molecule"] = input_data.molecule
-        ret_data["provenance"] = Provenance(creator="mace", version=mace.__version__, routine="mace")
-        ret_data["schema_name"] = "qcschema_atomic_result"
-        ret_data["success"] = True
+            # Form up a dict first, then sent to BaseModel to avoid repeat kwargs which don't override each other
+            results.append(AtomicResult(**ret_data))
 
-        # Form up a dict first, then sent to BaseModel to avoid repeat kwargs which don't override each other
-        return AtomicResult(**ret_data)
+        return results
@@ -1,19 +1,57 @@
 import abc
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple, Union
+import threading
+from contextlib import nullcontext
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    ContextManager,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from pydantic import BaseModel, ConfigDict
 
 from qcengine.config import TaskConfig
 from qcengine.exceptions import InputError, KnownErrorException
 
+from ..discovery import load_version, store_version
 from ..util import model_wrapper
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    import numpy as np
     from qcelemental.models.v2 import AtomicInput, AtomicResult, FailedOperation
 
+    from ..session import Session
+
+# One lock per harness class that is not thread-safe, see `harness_lock`
+_harness_locks: Dict[type, threading.RLock] = {}
+_harness_locks_lock = threading.Lock()
+
+
+def harness_lock(harness: Any) -> ContextManager:
+    """Serializes the in-process computations of `harness` if it is not ``thread_safe``, else does nothing.
+
+    The lock is held by the thread running the computation, so it covers computations run in worker threads,
+    e.g., by :func:`qcengine.compute_async` or by procedures, as well as those run directly. A harness wrapped
+    by the result cache shares the lock of the harness itself.
+    """
+    if getattr(harness, "thread_safe", True):
+        return nullcontext()
+    harness = getattr(harness, "harness", harness)
+    with _harness_locks_lock:
+        return _harness_locks.setdefault(type(harness), threading.RLock())
+
 
 class ProgramHarness(BaseModel, abc.ABC):
     """Base class for analytic single-geometry capable harnesses."""
@@ -50,6 +88,98 @@ class ProgramHarness(BaseModel, abc.ABC):
         """
         pass
 
+    async def compute_async(
+        self, input_data: "AtomicInput", config: TaskConfig
+    ) -> Union["AtomicResult", "FailedOperation"]:
+        """Awaitable form of :meth:`compute` with the same behaviors.
+
+        Note:
+            By default, this runs :meth:`compute` in a worker thread. Harnesses that launch executables
+            should override it to await :func:`qcengine.util.execute_async` so no thread is held per job.
+            Harnesses that are not ``thread_safe`` run one computation at a time, see :func:`harness_lock`.
+        """
+        return await asyncio.to_thread(self._locked, self.compute, input_data, config)
+
+    def _locked(self, compute, *args):
+        with harness_lock(self):
+            return compute(*args)
+
+    def compute_batch(
+        self, inputs: Sequence["AtomicInput"], config: TaskConfig, *, geometries: Optional["np.ndarray"] = None
+    ) -> List[Union["AtomicResult", "FailedOperation"]]:
+        """Runs many inputs at once, returning the results in the order of `inputs`.
+
+        Parameters
+        ----------
+        inputs
+            The inputs to run.
+        config
+            The TaskConfig, as for :meth:`compute`.
+        geometries
+            Many geometries of the molecule of a single input, of shape ``(n, natom, 3)`` in bohr. The results
+            carry copies of the molecule with these geometries.
+
+        Note:
+            By default, this runs :meth:`compute` on each input. Harnesses that evaluate batches natively,
+            such as machine-learned potentials, override it with this signature.
+        """
+        return [self.compute(input_data, config) for input_data in self._geometry_inputs(inputs, geometries)]
+
+    def _geometry_inputs(
+        self, inputs: Sequence["AtomicInput"], geometries: Optional["np.ndarray"]
+    ) -> Sequence["AtomicInput"]:
+        """`inputs`, or for `geometries` of shape ``(n, natom, 3)`` in bohr, copies of the single input with them."""
+        if geometries is None:
+            return inputs
+
+        import numpy as np
+
+        if len(inputs) != 1:
+            raise InputError(f"{self.name} batches over geometries of a single input only.")
+        input_data = inputs[0]
+        natom = len(input_data.molecule.symbols)
+        geometries = np.asarray(geometries, dtype=float)
+        if geometries.ndim != 3 or geometries.shape[1:] != (natom, 3):
+            raise InputError(
+                f"{self.name} batches over geometries of shape (n, {natom}, 3) for this molecule, not {geometries.shape}."
+            )
+        # the geometry is the only change, so the copies skip validation
+        return [
+            input_data.model_copy(update={"molecule": input_data.molecule.model_copy(update={"geometry": geom})})
+            for geom in geometries
+        ]
+
+    def open_session(self, session: "Session") -> None:
+        """Loads what the computations of `session` can reuse, ahead of the first one.
+
+        Note:
+            By default, nothing is loaded. The session is active while this runs, so whatever is loaded
+            through :meth:`_resident` is pinned in ``session.state`` for its computations.
+        """
+
+    @classmethod
+    def _resident(cls, key: Hashable, load: Callable[[], Tuple[Any, bool]]) -> Tuple[Any, bool]:
+        """What the active session of this harness holds under `key`, or else `load()`, which it then holds.
+
+        `load` returns the value and whether it was cached, as :meth:`ModelCache.get` does. Models, force
+        fields, and contexts pinned in ``session.state`` stay loaded until the session closes, however the
+        harness's cache evicts them. Outside of a session, this is just `load()`.
+        """
+        from ..session import active_session
+
+        session = active_session()
+        if session is None or not isinstance(session.harness, cls):
+            return load()
+
+        if key in session.state:
+            return session.state[key], True
+        value, hit = load()
+        session.state[key] = value
+        return value, hit
+
+    def close_session(self, session: "Session") -> None:
+        """Releases what :meth:`open_session` loaded. By default, nothing."""
+
     @staticmethod
     @abc.abstractmethod
     def found(raise_error: bool = False) -> bool:
@@ -81,10 +211,11 @@ class ProgramHarness(BaseModel, abc.ABC):
         from qcelemental.models.v1 import AtomicInput as v1_model
         from qcelemental.models.v2 import AtomicInput as v2_model
 
-        if isinstance(data, v1_model):
+        if isinstance(data, v2_model):
+            # fast path: already validated, frozen, and in the harness's preferred version
+            return (data, 2) if return_input_schema_version else data
+        elif isinstance(data, v1_model):
             mdl = model_wrapper(data, v1_model)
-        elif isinstance(data, v2_model):
-            mdl = model_wrapper(data, v2_model)
         elif isinstance(data, dict):
             # remember these are user-provided dictionaries, so they'll have the mandatory fields,
             #   like driver, not the helpful discriminator fields like schema_version.
@@ -122,6 +253,33 @@ class ProgramHarness(BaseModel, abc.ABC):
             Return a valid, safe python version string.
         """
 
+    def _cached_version(
+        self, which_prog: str, probe: Callable[[], Optional[str]], environment: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """The version of `which_prog`, from ``version_cache``, the on-disk cache shared across processes, or `probe`.
+
+        Parameters
+        ----------
+        which_prog
+            Path of the program, as found by ``which``.
+        probe
+            Runs the program and returns its safe version string, or ``None`` if it could not tell, which
+            is returned without being cached.
+        environment
+            Values that the version depends on besides the program file, e.g., the installation that a
+            wrapper script runs.
+        """
+        if which_prog not in self.version_cache:
+            version = load_version(which_prog, environment)
+            if version is None:
+                version = probe()
+                if version is None:
+                    return None
+                store_version(which_prog, version, environment)
+            self.version_cache[which_prog] = version
+
+        return self.version_cache[which_prog]
+
     ## Computers
 
     def build_input(
@@ -164,10 +322,10 @@ class ErrorCorrectionProgramHarness(ProgramHarness, abc.ABC):
     def _compute(self, input_data: "AtomicInput", config: TaskConfig) -> "AtomicResult":
         raise NotImplementedError()
 
-    def compute(self, input_data: "AtomicInput", config: TaskConfig) -> "AtomicResult":
-        # Get the error correction configuration
-        error_policy = input_data.specification.protocols.error_correction
+    async def _compute_async(self, input_data: "AtomicInput", config: TaskConfig) -> "AtomicResult":
+        return await asyncio.to_thread(self._locked, self._compute, input_data, config)
 
+    def compute(self, input_data: "AtomicInput", config: TaskConfig) -> "AtomicResult":
         # Create a local copy of the input data
         local_input_data = input_data
 
@@ -178,37 +336,65 @@ class ErrorCorrectionProgramHarness(ProgramHarness, abc.ABC):
                 result = self._compute(local_input_data, config)
                 break
             except KnownErrorException as e:
-                logger.info(f"Caught a {type(e)} error.")
-
-                # Determine whether this specific type of error is allowed
-                correction_allowed = error_policy.allows(e.error_name)
-                if not correction_allowed:
-                    logger.info(f'Error correction for "{e.error_name}" is not allowed')
-                    raise e
-                logger.info(f'Error correction for "{e.error_name}" is allowed')
-
-                # Check if it has run before
-                # TODO (wardlt): Should we allow errors to be run >1 time?
-                previously_run = e.error_name in observed_errors
-                if previously_run:
-                    logger.info(
-                        "Error has been observed before and mitigation did not fix the issue. Raising exception"
-                    )
-                    raise e
-
-                # Generate and apply the updated keywords
-                keyword_updates = e.create_keyword_update(local_input_data)
-                new_keywords = local_input_data.specification.keywords.copy()
-                new_keywords.update(keyword_updates)
-                local_input_data = input_data.__class__(
-                    **local_input_data.model_dump(exclude={"specification"}),
-                    specification={**local_input_data.specification.model_dump(), "keywords": new_keywords},
-                )
-
-                # Store the error details and mitigations employed
-                observed_errors[e.error_name] = {"details": e.details, "keyword_updates": keyword_updates}
+                local_input_data = self._correct_error(e, input_data, local_input_data, observed_errors)
 
         # Add the errors observed and corrected for, if any
         if len(observed_errors) > 0:
             result.extras["observed_errors"] = observed_errors
         return result
+
+    async def compute_async(self, input_data: "AtomicInput", config: TaskConfig) -> "AtomicResult":
+        local_input_data = input_data
+
+        observed_errors = {}
+        while True:
+            try:
+                result = await self._compute_async(local_input_data, config)
+                break
+            except KnownErrorException as e:
+                local_input_data = self._correct_error(e, input_data, local_input_data, observed_errors)
+
+        if len(observed_errors) > 0:
+            result.extras["observed_errors"] = observed_errors
+        return result
+
+    @staticmethod
+    def _correct_error(
+        e: KnownErrorException,
+        input_data: "AtomicInput",
+        local_input_data: "AtomicInput",
+        observed_errors: Dict[str, Any],
+    ) -> "AtomicInput":
+        """Assess whether the failure is restartable and, if so, return the input with updated keywords."""
+        logger.info(f"Caught a {type(e)} error.")
+
+        # Get the error correction configuration
+        error_policy = input_data.specification.protocols.error_correction
+
+        # Determine whether this specific type of error is allowed
+        correction_allowed = error_policy.allows(e.error_name)
+        if not correction_allowed:
+            logger.info(f'Error correction for "{e.error_name}" is not allowed')
+            raise e
+        logger.info(f'Error correction for "{e.error_name}" is allowed')
+
+        # Check if it has run before
+        # TODO (wardlt): Should we allow errors to be run >1 time?
+        previously_run = e.error_name in observed_errors
+        if previously_run:
+            logger.info("Error has been observed before and mitigation did not fix the issue. Raising exception")
+            raise e
+
+        # Generate and apply the updated keywords
+        keyword_updates = e.create_keyword_update(local_input_data)
+        new_keywords = local_input_data.specification.keywords.copy()
+        new_keywords.update(keyword_updates)
+        local_input_data = input_data.__class__(
+            **local_input_data.model_dump(exclude={"specification"}),
+            specification={**local_input_data.specification.model_dump(), "keywords": new_keywords},
+        )
+
+        # Store the error details and mitigations employed
+        observed_errors[e.error_name] = {"details": e.details, "keyword_updates": keyword_updates}
+
+        return local_input_data
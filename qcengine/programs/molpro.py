@@ -74,31 +74,33 @@ class MolproHarness(ProgramHarness):
     def get_version(self) -> str:
         self.found(raise_error=True)
 
-        name_space = {"molpro_uri": "http://www.molpro.net/schema/molpro-output"}
         which_prog = which("molpro")
-        if which_prog not in self.version_cache:
+
+        def probe():
+            name_space = {"molpro_uri": "http://www.molpro.net/schema/molpro-output"}
             success, output = execute(
                 [which_prog, "version.inp", "-d", ".", "-W", "."],
                 infiles={"version.inp": ""},
                 outfiles=["version.out", "version.xml"],
             )
-
-            if success:
-                tree = ET.ElementTree(ET.fromstring(output["outfiles"]["version.xml"]))
-                root = tree.getroot()
-                version_tree = root.find("molpro_uri:job/molpro_uri:platform/molpro_uri:version", name_space)
-                if version_tree is None:
-                    # some older schema
-                    name_space = {"molpro_uri": "http://www.molpro.net/schema/molpro2006"}
-                    version_tree = root.find("molpro_uri:job//molpro_uri:version", name_space)
-                if version_tree is None:
-                    return safe_version("0.0.0")
-                year = version_tree.attrib["major"]
-                minor = version_tree.attrib["minor"]
-                molpro_version = year + "." + minor
-                self.version_cache[which_prog] = safe_version(molpro_version)
-
-        return self.version_cache[which_prog]
+            if not success:
+                raise UnknownError(output["stderr"])
+
+            tree = ET.ElementTree(ET.fromstring(output["outfiles"]["version.xml"]))
+            root = tree.getroot()
+            version_tree = root.find("molpro_uri:job/molpro_uri:platform/molpro_uri:version", name_space)
+            if version_tree is None:
+                # some older schema
+                name_space = {"molpro_uri": "http://www.molpro.net/schema/molpro2006"}
+                version_tree = root.find("molpro_uri:job//molpro_uri:version", name_space)
+            if version_tree is None:
+                return None
+            year = version_tree.attrib["major"]
+            minor = version_tree.attrib["minor"]
+            molpro_version = year + "." + minor
+            return safe_version(molpro_version)
+
+        return self._cached_version(which_prog, probe) or safe_version("0.0.0")
 
     def compute(self, input_data: "AtomicInput", config: "TaskConfig") -> "AtomicResult":
         """
@@ -1,6 +1,7 @@
 """
 Calls the NWChem executable.
 """
+import asyncio
 import copy
 import hashlib
 import logging
@@ -17,7 +18,7 @@ from qcengine.config import TaskConfig, get_config
 from qcengine.exceptions import UnknownError
 
 from ...exceptions import InputError
-from ...util import create_mpi_invocation, execute, temporary_directory
+from ...util import create_mpi_invocation, execute, execute_async, temporary_directory
 from ..model import ErrorCorrectionProgramHarness
 from ..qcvar_identities_resources import build_atomicproperties, build_out
 from ..util import error_stamp
@@ -97,20 +98,19 @@ class NWChemHarness(ErrorCorrectionProgramHarness):
             command = [which_prog]
         command.append("v.nw")
 
-        if which_prog not in self.version_cache:
+        def probe():
             success, output = execute(command, {"v.nw": ""}, scratch_directory=config.scratch_directory)
-
-            if success:
-                for line in output["stdout"].splitlines():
-                    if "nwchem branch" in line:
-                        branch = line.strip().split()[-1]
-                    if "nwchem revision" in line:
-                        revision = line.strip().split()[-1]
-                self.version_cache[which_prog] = safe_version(branch + "+" + revision)
-            else:
+            if not success:
                 raise UnknownError(output["stderr"])
 
-        return self.version_cache[which_prog]
+            for line in output["stdout"].splitlines():
+                if "nwchem branch" in line:
+                    branch = line.strip().split()[-1]
+                if "nwchem revision" in line:
+                    revision = line.strip().split()[-1]
+            return safe_version(branch + "+" + revision)
+
+        return self._cached_version(which_prog, probe)
 
     def _compute(self, input_model: AtomicInput, config: "TaskConfig") -> AtomicResult:
         """
@@ -121,6 +121,22 @@ class NWChemHarness(ErrorCorrectionProgramHarness):
         job_inputs = self.build_input(input_model, config)
         success, dexe = self.execute(job_inputs)
 
+        return self._collect_output(job_inputs, success, dexe, input_model)
+
+    async def _compute_async(self, input_model: AtomicInput, config: "TaskConfig") -> AtomicResult:
+        self.found(raise_error=True)
+
+        # build_input and the version probe read by parse_output run blocking subprocesses, so keep them
+        #   off the event loop; the version is cached once probed
+        job_inputs = await asyncio.to_thread(self.build_input, input_model, config)
+        await asyncio.to_thread(self.get_version)
+        success, dexe = await self.execute_async(job_inputs)
+
+        return self._collect_output(job_inputs, success, dexe, input_model)
+
+    def _collect_output(
+        self, job_inputs: Dict[str, Any], success: bool, dexe: Dict[str, Any], input_model: AtomicInput
+    ) -> AtomicResult:
         stdin = job_inputs["infiles"]["nwchem.nw"]
         if "There is an error in the input file" in dexe["stdout"]:
             raise InputError(error_stamp(stdin, dexe["stdout"], dexe["stderr"]))
@@ -279,6 +295,21 @@ task python
         )
         return success, dexe
 
+    async def execute_async(
+        self, inputs: Dict[str, Any], *, extra_outfiles=None, extra_commands=None, scratch_name=None, timeout=None
+    ) -> Tuple[bool, Dict]:
+
+        success, dexe = await execute_async(
+            inputs["command"],
+            inputs["infiles"],
+            ["nwchem.hess", "nwchem.grad"],
+            scratch_messy=inputs["scratch_messy"],
+            scratch_exist_ok=True,
+            scratch_name=inputs.get("scratch_name", None),
+            scratch_directory=inputs["scratch_directory"],
+        )
+        return success, dexe
+
     def parse_output(
         self, outfiles: Dict[str, str], input_model: "AtomicInput"
     ) -> AtomicResult:  # lgtm: [py/similar-function]
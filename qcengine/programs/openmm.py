@@ -3,10 +3,11 @@ Calls the OpenMM executable.
 
 Requires RDKit
 """
-import datetime
 import hashlib
 import os
-from typing import TYPE_CHECKING, Any, ClassVar, Dict
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 from qcelemental.models.v2 import AtomicResult, BasisSet, Provenance
@@ -16,18 +17,66 @@ from ..exceptions import InputError
 from ..util import capture_stdout
 from .model import ProgramHarness
 from .rdkit import RDKitHarness
+from .util.model_cache import ModelCache
 
 if TYPE_CHECKING:
-    from qcelemental.models.v2 import AtomicInput
+    from qcelemental.models.v2 import AtomicInput, Molecule
 
     from ..config import TaskConfig
 
 
+class _ContextPool:
+    """Up to `size` Contexts of one System, each lent to one computation at a time.
+
+    A Context is created only when all others are busy, and beyond `size` a computation waits for one.
+    """
+
+    def __init__(self, create: Callable[[], Tuple["openmm.Context", "openmm.Integrator"]], size: int):
+        self.size = size
+        self._create = create
+        # the first is created up front, as the pool is built on a cache miss that needs it
+        self._idle: List[Tuple["openmm.Context", "openmm.Integrator"]] = [create()]
+        self._count = 1
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def context(self) -> Iterator["openmm.Context"]:
+        with self._condition:
+            while not self._idle and self._count >= self.size:
+                self._condition.wait()
+            item = self._idle.pop() if self._idle else None
+            if item is None:
+                self._count += 1
+
+        if item is None:
+            try:
+                item = self._create()
+            except BaseException:
+                with self._condition:
+                    self._count -= 1
+                    self._condition.notify()
+                raise
+
+        try:
+            yield item[0]
+        finally:
+            with self._condition:
+                self._idle.append(item)
+                self._condition.notify()
+
+
 class OpenMMHarness(ProgramHarness):
     """Interface for OpenMM project."""
 
-    _CACHE: ClassVar[Dict] = {}
-    _CACHE_MAX_SIZE: ClassVar[int] = 10
+    # Systems by input hash, and pools of their Contexts by (input hash, threads), see `TaskConfig.model_cache_size`
+    _CACHE: ClassVar[ModelCache] = ModelCache(max_entries=20)
+
+    # Contexts of a System on the same threads held for concurrent computations
+    _CONTEXTS_PER_SYSTEM: ClassVar[int] = 4
+
+    # Estimated bytes of each particle's state in a CPU Context: positions, velocities, forces, and its share of
+    #   the neighbor list, in both precisions. The parameters of the System are charged to the System's own entry.
+    _CONTEXT_BYTES_PER_PARTICLE: ClassVar[int] = 1024
 
     _defaults: ClassVar[Dict[str, Any]] = {
         "name": "OpenMM",
@@ -63,27 +112,15 @@ class OpenMMHarness(ProgramHarness):
     #
     #     return openmm_system
 
-    def _get_cache(self, key):
-        return self._CACHE[key]["value"]
-
-    def _cache_it(self, key, value):
-        """Add to our LRU cache, possibly popping off least used key."""
-        self._CACHE[key] = {"value": value, "last_used": datetime.datetime.utcnow()}
-
-        # if cache is beyond max size, whittle it down by dropping entry least
-        # recently used
-        while len(self._CACHE) > self._CACHE_MAX_SIZE:
-            for i, (key, value) in enumerate(self._CACHE.items()):
-                if i == 0:
-                    oldest = value["last_used"]
-                    oldest_key = key
-                else:
-                    oldest, oldest_key = (
-                        (value["last_used"], key) if (value["last_used"] < oldest) else oldest,
-                        oldest_key,
-                    )
+    @staticmethod
+    def _system_memory(system: "openmm.System") -> int:
+        """Approximate bytes held by `system`, from the size of its serialized form."""
+        try:
+            import openmm
+        except ImportError:
+            from simtk import openmm
 
-            self._CACHE.pop(oldest_key)
+        return len(openmm.XmlSerializer.serialize(system))
 
     @staticmethod
     def found(raise_error: bool = False) -> bool:
@@ -142,84 +179,239 @@ class OpenMMHarness(ProgramHarness):
 
         return self.version_cache[which_prog]
 
+    @staticmethod
+    def _molecule_cmiles(molecule: "Molecule") -> Optional[str]:
+        """The mapped SMILES attached to `molecule` by QCFractal or OpenFF, if any."""
+        if not molecule.extras:
+            return None
+        cmiles = molecule.extras.get("canonical_isomeric_explicit_hydrogen_mapped_smiles", None)
+        if cmiles is None:
+            cmiles = molecule.extras.get("cmiles", {}).get("canonical_isomeric_explicit_hydrogen_mapped_smiles", None)
+        return cmiles
+
+    @staticmethod
+    def _stereo_signature(molecule: "Molecule") -> str:
+        """Signs of the chirality of possible stereocenters and of cis/trans double bonds of `molecule`.
+
+        Stereocenters are atoms with four neighbors, no two of them identical terminal atoms, and their sign is
+        that of the signed volume spanned by the three lowest-numbered neighbors. Double bonds whose ends each
+        carry such distinct substituents are cis or trans by their lowest-numbered substituents. The signs only
+        change when a center inverts or a bond isomerizes, so they are the same for all conformers.
+        """
+        geometry = np.asarray(molecule.geometry).reshape(-1, 3)
+        neighbors = [[] for _ in molecule.symbols]
+        double = []
+        for a, b, order in molecule.connectivity or []:
+            neighbors[a].append(b)
+            neighbors[b].append(a)
+            if order == 2:
+                double.append((min(a, b), max(a, b)))
+
+        def distinct(atoms):
+            # identical terminal substituents, e.g., the hydrogens of a methylene, cannot give stereoisomers
+            ends = [molecule.symbols[atom] for atom in atoms if len(neighbors[atom]) == 1]
+            return len(ends) == len(set(ends))
+
+        centers = [center for center, atoms in enumerate(neighbors) if len(atoms) == 4 and distinct(atoms)]
+        signs = ""
+        if centers:
+            arms = np.array([sorted(neighbors[center])[:3] for center in centers])
+            volumes = np.linalg.det(geometry[arms] - geometry[centers][:, None, :])
+            signs += "".join("+" if volume > 0 else "-" for volume in volumes)
+
+        bonds = []
+        for a, b in sorted(double):
+            sub_a, sub_b = sorted(set(neighbors[a]) - {b}), sorted(set(neighbors[b]) - {a})
+            if sub_a and sub_b and distinct(sub_a) and distinct(sub_b):
+                bonds.append((a, b, sub_a[0], sub_b[0]))
+        if bonds:
+            a, b, sub_a, sub_b = np.array(bonds).T
+            axis = geometry[b] - geometry[a]
+            axis /= np.linalg.norm(axis, axis=1)[:, None]
+            # the substituents' directions perpendicular to the bond point the same way for cis
+            u, v = geometry[sub_a] - geometry[a], geometry[sub_b] - geometry[b]
+            u -= axis * np.sum(u * axis, axis=1)[:, None]
+            v -= axis * np.sum(v * axis, axis=1)[:, None]
+            signs += "".join("c" if dot > 0 else "t" for dot in np.sum(u * v, axis=1))
+
+        return signs
+
+    @staticmethod
+    def _system_key(molecule: "Molecule", method: str, keywords: Dict) -> str:
+        """Hash of the input options that determine the OpenMM System.
+
+        The molecule enters by its symbols, connectivity, charge, and mapped SMILES rather than by a mapped
+        SMILES perceived through RDKit and the OpenFF toolkit, so that cached Systems are found without any
+        toolkit conversions. Without a mapped SMILES, the stereochemistry that the toolkit would perceive from
+        the geometry enters through :meth:`_stereo_signature`, so stereoisomers get Systems of their own.
+        """
+        connectivity = sorted(tuple(bond) for bond in molecule.connectivity or [])
+        cmiles = OpenMMHarness._molecule_cmiles(molecule)
+        hashstring = "|".join(
+            [
+                ",".join(molecule.symbols),
+                repr(connectivity),
+                f"{molecule.molecular_charge:.6f}",
+                str(molecule.molecular_multiplicity),
+                cmiles or OpenMMHarness._stereo_signature(molecule),
+                method,
+                repr(sorted(keywords.items())),
+            ]
+        )
+        return hashlib.sha256(hashstring.encode()).hexdigest()
+
+    @staticmethod
+    def _openff_molecule(molecule: "Molecule") -> "offtop.Molecule":
+        """Converts `molecule` to an Open Force Field `Molecule`, from its mapped SMILES if it has one."""
+        try:
+            from openmm import unit
+        except ImportError:
+            from simtk import unit
+
+        with capture_stdout():
+            from openff.toolkit import topology as offtop
+
+            # try and make the molecule from the cmiles
+            cmiles = OpenMMHarness._molecule_cmiles(molecule)
+            if cmiles is not None:
+                off_mol = offtop.Molecule.from_mapped_smiles(mapped_smiles=cmiles)
+                # add the conformer
+                conformer = unit.Quantity(value=np.array(molecule.geometry), unit=unit.bohr)
+                off_mol.add_conformer(conformer)
+            else:
+                # Process molecule with RDKit
+                rdkit_mol = RDKitHarness._process_molecule_rdkit(molecule)
+
+                # Create an Open Force Field `Molecule` from the RDKit Molecule
+                off_mol = offtop.Molecule(rdkit_mol)
+
+        return off_mol
+
     def _generate_openmm_system(
-        self, molecule: "offtop.Molecule", method: str, keywords: Dict = None
+        self, molecule: "Molecule", method: str, keywords: Dict = None, key: Optional[str] = None
     ) -> "openmm.System":
         """
         Generate an OpenMM System object from the input molecule method and basis.
         """
+        if keywords is None:
+            keywords = {}
+
+        # create a hash based on the input options
+        if key is None:
+            key = self._system_key(molecule, method, keywords)
+
+        return self._load_system(key, molecule, method, keywords)
+
+    def _load_system(self, key: str, molecule: "Molecule", method: str, keywords: Dict) -> "openmm.System":
+        """The System of `key`, converting the molecule only to build a new one."""
+
+        def load():
+            return self._create_system(self._openff_molecule(molecule), method, keywords)
+
+        return self._resident(key, lambda: self._CACHE.get(key, load, memory=self._system_memory))[0]
+
+    @staticmethod
+    def _create_system(molecule: "offtop.Molecule", method: str, keywords: Dict) -> "openmm.System":
         from openmmforcefields.generators import SystemGenerator
 
         try:
-            from openmm import app, unit
+            from openmm import app
         except ImportError:
-            from simtk import unit
             from simtk.openmm import app
 
-        # create a hash based on the input options
-        hashstring = molecule.to_smiles(isomeric=True, explicit_hydrogens=True, mapped=True) + method
-        for value in keywords.values():
-            hashstring += str(value)
-        key = hashlib.sha256(hashstring.encode()).hexdigest()
-
-        # now look for the system?
-        if key in self._CACHE:
-            system = self._get_cache(key)
+        # make the system from the inputs
+        # set up available options for openmm
+        _constraint_types = {"hbonds": app.HBonds, "allbonds": app.AllBonds, "hangles": app.HAngles}
+        _periodic_nonbond_types = {"ljpme": app.LJPME, "pme": app.PME, "ewald": app.Ewald}
+        _non_periodic_nonbond_types = {"nocutoff": app.NoCutoff, "cutoffnonperiodic": app.CutoffNonPeriodic}
+
+        if "constraints" in keywords:
+            constraints = keywords["constraints"]
+            try:
+                forcefield_kwargs = {"constraints": _constraint_types[constraints.lower()]}
+            except (KeyError, AttributeError):
+                raise ValueError(
+                    f"constraint '{constraints}' not supported, valid constraints are {_constraint_types.keys()}"
+                )
         else:
-            # make the system from the inputs
-            # set up available options for openmm
-            _constraint_types = {"hbonds": app.HBonds, "allbonds": app.AllBonds, "hangles": app.HAngles}
-            _periodic_nonbond_types = {"ljpme": app.LJPME, "pme": app.PME, "ewald": app.Ewald}
-            _non_periodic_nonbond_types = {"nocutoff": app.NoCutoff, "cutoffnonperiodic": app.CutoffNonPeriodic}
-
-            if "constraints" in keywords:
-                constraints = keywords["constraints"]
-                try:
-                    forcefield_kwargs = {"constraints": _constraint_types[constraints.lower()]}
-                except (KeyError, AttributeError):
-                    raise ValueError(
-                        f"constraint '{constraints}' not supported, valid constraints are {_constraint_types.keys()}"
-                    )
-            else:
-                forcefield_kwargs = None
-
-            nonbondedmethod = keywords.get("nonbondedMethod", None)
-            if nonbondedmethod is not None:
-                if nonbondedmethod.lower() in _periodic_nonbond_types:
-                    periodic_forcefield_kwargs = {"nonbondedMethod": _periodic_nonbond_types[nonbondedmethod.lower()]}
-                    nonperiodic_forcefield_kwargs = None
-                elif nonbondedmethod.lower() in _non_periodic_nonbond_types:
-                    periodic_forcefield_kwargs = None
-                    nonperiodic_forcefield_kwargs = {
-                        "nonbondedMethod": _non_periodic_nonbond_types[nonbondedmethod.lower()]
-                    }
-                else:
-                    raise ValueError(
-                        f"nonbondedmethod '{nonbondedmethod}' not supported, valid nonbonded methods are periodic: {_periodic_nonbond_types.keys()}"
-                        f" or non_periodic: {_non_periodic_nonbond_types.keys()}."
-                    )
-            else:
-                periodic_forcefield_kwargs = None
+            forcefield_kwargs = None
+
+        nonbondedmethod = keywords.get("nonbondedMethod", None)
+        if nonbondedmethod is not None:
+            if nonbondedmethod.lower() in _periodic_nonbond_types:
+                periodic_forcefield_kwargs = {"nonbondedMethod": _periodic_nonbond_types[nonbondedmethod.lower()]}
                 nonperiodic_forcefield_kwargs = None
+            elif nonbondedmethod.lower() in _non_periodic_nonbond_types:
+                periodic_forcefield_kwargs = None
+                nonperiodic_forcefield_kwargs = {
+                    "nonbondedMethod": _non_periodic_nonbond_types[nonbondedmethod.lower()]
+                }
+            else:
+                raise ValueError(
+                    f"nonbondedmethod '{nonbondedmethod}' not supported, valid nonbonded methods are periodic: {_periodic_nonbond_types.keys()}"
+                    f" or non_periodic: {_non_periodic_nonbond_types.keys()}."
+                )
+        else:
+            periodic_forcefield_kwargs = None
+            nonperiodic_forcefield_kwargs = None
+
+        # now start the system generator
+        system_generator = SystemGenerator(
+            small_molecule_forcefield=method,
+            forcefield_kwargs=forcefield_kwargs,
+            nonperiodic_forcefield_kwargs=nonperiodic_forcefield_kwargs,
+            periodic_forcefield_kwargs=periodic_forcefield_kwargs,
+        )
+        topology = molecule.to_topology()
 
-            # now start the system generator
-            system_generator = SystemGenerator(
-                small_molecule_forcefield=method,
-                forcefield_kwargs=forcefield_kwargs,
-                nonperiodic_forcefield_kwargs=nonperiodic_forcefield_kwargs,
-                periodic_forcefield_kwargs=periodic_forcefield_kwargs,
-            )
-            topology = molecule.to_topology()
+        return system_generator.create_system(topology=topology.to_openmm(), molecules=[molecule])
+
+    @staticmethod
+    def _create_context(
+        system: "openmm.System", nthreads: Optional[str]
+    ) -> Tuple["openmm.Context", "openmm.Integrator"]:
+        try:
+            import openmm
+            from openmm import unit
+        except ImportError:
+            from simtk import openmm, unit
 
-            system = system_generator.create_system(topology=topology.to_openmm(), molecules=[molecule])
-            self._cache_it(key, system)
-        return system
+        # Need an integrator for simulation even if we don't end up using it really
+        integrator = openmm.VerletIntegrator(1.0 * unit.femtoseconds)
+
+        # Set platform to CPU explicitly
+        platform = openmm.Platform.getPlatformByName("CPU")
+
+        if nthreads:
+            properties = {"Threads": str(nthreads)}
+        else:
+            properties = {}
+
+        # the integrator is returned to be kept alive with the context
+        return openmm.Context(system, integrator, platform, properties), integrator
+
+    def _get_context(self, key: str, system: "openmm.System", nthreads: Optional[str]) -> Tuple[_ContextPool, bool]:
+        """
+        The pool of Contexts for the System of `key` on `nthreads` CPU threads, created once and then reused with
+        new positions, and whether it was cached. The pool is charged for all the Contexts it may grow to, each at
+        `_CONTEXT_BYTES_PER_PARTICLE` for every particle of the System.
+        """
+        context_bytes = self._CONTEXT_BYTES_PER_PARTICLE * system.getNumParticles()
+        return self._resident(
+            (key, nthreads),
+            lambda: self._CACHE.get(
+                (key, nthreads),
+                lambda: _ContextPool(lambda: self._create_context(system, nthreads), self._CONTEXTS_PER_SYSTEM),
+                memory=lambda pool: context_bytes * pool.size,
+            ),
+        )
 
     def compute(self, input_model: "AtomicInput", config: "TaskConfig") -> "AtomicResult":
         """
         Runs OpenMM on given structure, inputs, in vacuum.
         """
         self.found(raise_error=True)
+        self._CACHE.resize(config.model_cache_size)
 
         try:
             import openmm
@@ -227,9 +419,6 @@ class OpenMMHarness(ProgramHarness):
         except ImportError:
             from simtk import openmm, unit
 
-        with capture_stdout():
-            from openff.toolkit import topology as offtop
-
         # Failure flag
         ret_data = {"success": False}
 
@@ -244,43 +433,19 @@ class OpenMMHarness(ProgramHarness):
         basis = input_model.specification.model.basis.lower()
         if basis in ["smirnoff", "antechamber"]:
 
-            with capture_stdout():
-                # try and make the molecule from the cmiles
-                cmiles = None
-                if input_model.molecule.extras:
-                    cmiles = input_model.molecule.extras.get("canonical_isomeric_explicit_hydrogen_mapped_smiles", None)
-                    if cmiles is None:
-                        cmiles = input_model.molecule.extras.get("cmiles", {}).get(
-                            "canonical_isomeric_explicit_hydrogen_mapped_smiles", None
-                        )
-
-                if cmiles is not None:
-                    off_mol = offtop.Molecule.from_mapped_smiles(mapped_smiles=cmiles)
-                    # add the conformer
-                    conformer = unit.Quantity(value=np.array(input_model.molecule.geometry), unit=unit.bohr)
-                    off_mol.add_conformer(conformer)
-                else:
-                    # Process molecule with RDKit
-                    rdkit_mol = RDKitHarness._process_molecule_rdkit(input_model.molecule)
-
-                    # Create an Open Force Field `Molecule` from the RDKit Molecule
-                    off_mol = offtop.Molecule(rdkit_mol)
-
             # now we need to create the system
-            openmm_system = self._generate_openmm_system(
-                molecule=off_mol,
-                method=input_model.specification.model.method,
-                keywords=input_model.specification.keywords,
+            key = self._system_key(
+                input_model.molecule, input_model.specification.model.method, input_model.specification.keywords
+            )
+            openmm_system = self._load_system(
+                key,
+                input_model.molecule,
+                input_model.specification.model.method,
+                input_model.specification.keywords,
             )
         else:
             raise InputError("Accepted bases are: {'smirnoff', 'antechamber', }")
 
-        # Need an integrator for simulation even if we don't end up using it really
-        integrator = openmm.VerletIntegrator(1.0 * unit.femtoseconds)
-
-        # Set platform to CPU explicitly
-        platform = openmm.Platform.getPlatformByName("CPU")
-
         # Set number of threads to use
         # if `nthreads` is `None`, OpenMM default of all logical cores on
         # processor will be used
@@ -288,22 +453,15 @@ class OpenMMHarness(ProgramHarness):
         if nthreads is None:
             nthreads = os.environ.get("OPENMM_CPU_THREADS")
 
-        if nthreads:
-            properties = {"Threads": str(nthreads)}
-        else:
-            properties = {}
-
-        # Initialize context
-        context = openmm.Context(openmm_system, integrator, platform, properties)
+        # Reuse a context of this system that no other thread is using
+        pool, cache_hit = self._get_context(key, openmm_system, nthreads)
+        with pool.context() as context:
+            # Set positions straight from the input geometry, which is in the atom order of the System
+            positions = unit.Quantity(value=np.asarray(input_model.molecule.geometry).reshape(-1, 3), unit=unit.bohr)
+            context.setPositions(positions.in_units_of(unit.nanometer))
 
-        # Set positions from our Open Force Field `Molecule`
-        try:
-            context.setPositions(off_mol.conformers[0])
-        except ValueError:
-            context.setPositions(off_mol.conformers[0].to_openmm())
-
-        # Compute the energy of the configuration
-        state = context.getState(getEnergy=True)
+            # Compute the energy of the configuration, and the forces with it for gradients
+            state = context.getState(getEnergy=True, getForces=input_model.specification.driver == "gradient")
 
         # Get the potential as a unit.Quantity, put into units of hartree
         q = state.getPotentialEnergy() / unit.hartree / unit.AVOGADRO_CONSTANT_NA
@@ -315,9 +473,6 @@ class OpenMMHarness(ProgramHarness):
             ret_data["return_result"] = ret_data["properties"]["return_energy"]
 
         elif input_model.specification.driver == "gradient":
-            # Compute the forces
-            state = context.getState(getForces=True)
-
             # Get the gradient as a unit.Quantity with shape (n_atoms, 3)
             gradient = state.getForces(asNumpy=True)
 
@@ -333,7 +488,8 @@ class OpenMMHarness(ProgramHarness):
 
         ret_data["success"] = True
         ret_data["input_data"] = input_model
-        ret_data["molecule"] = input_model.molecule  # should connectivity be added from off_mol?
+        ret_data["molecule"] = input_model.molecule  # should connectivity be added from the OpenFF molecule?
+        ret_data["extras"] = {"qcengine_model_cache": self._CACHE.annotation(cache_hit)}
 
         # Move several pieces up a level
         ret_data["provenance"] = Provenance(creator="openmm", version=openmm.version.short_version, nthreads=nthreads)
@@ -18,7 +18,7 @@ from qcelemental.util import parse_version, safe_version, which
 from qcengine.config import TaskConfig, get_config
 
 from ..exceptions import InputError, UnknownError
-from ..util import disk_files, execute, temporary_directory
+from ..util import disk_files, execute, execute_async, temporary_directory
 from .model import ProgramHarness
 
 NUMBER = r"(?x:" + regex.NUMBER + ")"
@@ -74,7 +74,8 @@ class QChemHarness(ProgramHarness):
         config = get_config()
 
         which_prog = which("qchem")
-        if which_prog not in self.version_cache:
+
+        def probe():
             success, exc = execute(
                 [which_prog, "v.in"],
                 {"v.in": "$rem\n"},
@@ -87,14 +88,12 @@ class QChemHarness(ProgramHarness):
             if not mobj:
                 mobj = re.search(r"Q-Chem version:\s+([\d.]+)\s+", exc["stdout"])
 
-            if mobj:
-                self.version_cache[which_prog] = safe_version(mobj.group(1))
+            # None if "QC not defined" in exc["stdout"], for instance
+            return safe_version(mobj.group(1)) if mobj else None
 
-            # if "QC not defined" in exc["stdout"]:
-            else:
-                return safe_version("0.0.0")
-
-        return self.version_cache[which_prog]
+        # The qchem script runs whichever installation $QC points to
+        installation = {"QC": os.environ.get("QC")}
+        return self._cached_version(which_prog, probe, installation) or safe_version("0.0.0")
 
     def compute(self, input_model: "AtomicInput", config: TaskConfig) -> "AtomicResult":
         """
@@ -114,6 +113,21 @@ class QChemHarness(ProgramHarness):
         # Run qchem
         exe_success, proc = self.execute(job_inputs)
 
+        return self._collect_output(exe_success, proc, input_model)
+
+    async def compute_async(self, input_model: "AtomicInput", config: TaskConfig) -> "AtomicResult":
+        self.found(raise_error=True)
+
+        qceng_ver = "5.1"
+        if parse_version(self.get_version()) < parse_version(qceng_ver):
+            raise TypeError(f"Q-Chem version <{qceng_ver} not supported (found version {self.get_version()})")
+
+        job_inputs = self.build_input(input_model, config)
+        exe_success, proc = await self.execute_async(job_inputs)
+
+        return self._collect_output(exe_success, proc, input_model)
+
+    def _collect_output(self, exe_success: bool, proc: Dict[str, Any], input_model: "AtomicInput") -> "AtomicResult":
         # Determine whether the calculation succeeded
         if exe_success:
             # If execution succeeded, collect results
@@ -142,23 +156,49 @@ class QChemHarness(ProgramHarness):
         For option documentation go look at qcengine/util.execute
         """
 
-        # Collect all input files and update with extra_infiles
-        infiles = inputs["infiles"]
-        if extra_infiles is not None:
-            infiles.update(extra_infiles)
+        infiles, outfiles, commands, binary_files = self._execute_files(
+            inputs, extra_infiles, extra_outfiles, extra_commands
+        )
+        envs = self._get_qc_path()
 
-        binary_files = [os.path.join("savepath", x) for x in ["99.0", "131.0", "132.0"]]
+        with temporary_directory(parent=inputs["scratch_directory"], suffix="_qchem_scratch") as tmpdir:
+            envs["QCSCRATCH"] = tmpdir
+            bdict = {x: None for x in binary_files}
 
-        # Collect all output files and extend with with extra_outfiles
-        outfiles = ["dispatch.out"]
-        if extra_outfiles is not None:
-            outfiles.extend(extra_outfiles)
+            with disk_files({}, bdict, cwd=tmpdir, as_binary=binary_files):
+                exe_success, proc = execute(
+                    commands,
+                    infiles=infiles,
+                    outfiles=outfiles,
+                    scratch_name=scratch_name,
+                    scratch_directory=tmpdir,
+                    scratch_messy=scratch_messy,
+                    timeout=timeout,
+                    environment=envs,
+                )
 
-        # Replace commands with extra_commands if present
-        commands = inputs["commands"] + ["savepath"]
-        if extra_commands is not None:
-            commands = extra_commands
+            proc["outfiles"].update({os.path.split(k)[-1]: v for k, v in bdict.items()})
+
+        return self._check_execution(exe_success, proc)
+
+    async def execute_async(
+        self,
+        inputs: Dict[str, Any],
+        *,
+        extra_infiles: Optional[Dict[str, str]] = None,
+        extra_outfiles: Optional[List[str]] = None,
+        extra_commands: Optional[List[str]] = None,
+        scratch_name: Optional[str] = None,
+        scratch_messy: bool = False,
+        timeout: Optional[int] = None,
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Awaitable counterpart of :meth:`execute`, see qcengine/util.execute_async
+        """
 
+        infiles, outfiles, commands, binary_files = self._execute_files(
+            inputs, extra_infiles, extra_outfiles, extra_commands
+        )
         envs = self._get_qc_path()
 
         with temporary_directory(parent=inputs["scratch_directory"], suffix="_qchem_scratch") as tmpdir:
@@ -166,7 +206,7 @@ class QChemHarness(ProgramHarness):
             bdict = {x: None for x in binary_files}
 
             with disk_files({}, bdict, cwd=tmpdir, as_binary=binary_files):
-                exe_success, proc = execute(
+                exe_success, proc = await execute_async(
                     commands,
                     infiles=infiles,
                     outfiles=outfiles,
@@ -179,6 +219,36 @@ class QChemHarness(ProgramHarness):
 
             proc["outfiles"].update({os.path.split(k)[-1]: v for k, v in bdict.items()})
 
+        return self._check_execution(exe_success, proc)
+
+    @staticmethod
+    def _execute_files(
+        inputs: Dict[str, Any],
+        extra_infiles: Optional[Dict[str, str]],
+        extra_outfiles: Optional[List[str]],
+        extra_commands: Optional[List[str]],
+    ) -> Tuple[Dict[str, str], List[str], List[str], List[str]]:
+        # Collect all input files and update with extra_infiles
+        infiles = inputs["infiles"]
+        if extra_infiles is not None:
+            infiles.update(extra_infiles)
+
+        binary_files = [os.path.join("savepath", x) for x in ["99.0", "131.0", "132.0"]]
+
+        # Collect all output files and extend with with extra_outfiles
+        outfiles = ["dispatch.out"]
+        if extra_outfiles is not None:
+            outfiles.extend(extra_outfiles)
+
+        # Replace commands with extra_commands if present
+        commands = inputs["commands"] + ["savepath"]
+        if extra_commands is not None:
+            commands = extra_commands
+
+        return infiles, outfiles, commands, binary_files
+
+    @staticmethod
+    def _check_execution(exe_success: bool, proc: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
         if (proc["outfiles"]["dispatch.out"] is None) or (
             "Thank you very much for using Q-Chem" not in proc["outfiles"]["dispatch.out"]
         ):
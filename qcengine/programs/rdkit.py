@@ -2,7 +2,8 @@
 Calls the RDKit package.
 """
 
-from typing import TYPE_CHECKING, Any, ClassVar, Dict
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Sequence, Tuple
 
 from qcelemental.models.v2 import AtomicResult, Provenance
 from qcelemental.util import safe_version, which_import
@@ -10,9 +11,11 @@ from qcelemental.util import safe_version, which_import
 from ..exceptions import InputError
 from ..units import ureg
 from .model import ProgramHarness
+from .util.model_cache import ModelCache
 
 if TYPE_CHECKING:
-    from qcelemental.models.v2 import AtomicInput
+    import numpy as np
+    from qcelemental.models.v2 import AtomicInput, Molecule
 
     from ..config import TaskConfig
 
@@ -31,6 +34,10 @@ class RDKitHarness(ProgramHarness):
 
     version_cache: Dict[str, str] = {}
 
+    # Sanitized molecules and their force fields, see `_force_field`
+    _CACHE: ClassVar[ModelCache] = ModelCache(max_entries=256, max_memory=None)
+    _MMFF_VARIANTS: ClassVar[Dict[str, str]] = {"mmff94": "MMFF94", "mmff94s": "MMFF94s"}
+
     @staticmethod
     def _process_molecule_rdkit(jmol):
         from rdkit import Chem
@@ -56,18 +63,14 @@ class RDKitHarness(ProgramHarness):
         mol = rw_mol.GetMol()
 
         # Write out the conformer
-        natom = len(jmol.symbols)
-        conf = Chem.Conformer(natom)
-        bohr2ang = ureg.conversion_factor("bohr", "angstrom")
-        for line in range(natom):
-            conf.SetAtomPosition(
-                line,
-                (
-                    bohr2ang * jmol.geometry[line, 0],
-                    bohr2ang * jmol.geometry[line, 1],
-                    bohr2ang * jmol.geometry[line, 2],
-                ),
-            )
+        positions = jmol.geometry.reshape(-1, 3) * ureg.conversion_factor("bohr", "angstrom")
+        conf = Chem.Conformer(len(jmol.symbols))
+        if hasattr(conf, "SetPositions"):
+            conf.SetPositions(positions)
+        else:
+            # RDKit before 2023.09 sets one atom at a time
+            for index, position in enumerate(positions.tolist()):
+                conf.SetAtomPosition(index, tuple(position))
 
         mol.AddConformer(conf)
         Chem.rdmolops.SanitizeMol(mol)
@@ -95,59 +98,124 @@ class RDKitHarness(ProgramHarness):
 
         return self.version_cache[which_prog]
 
-    def compute(self, input_data: "AtomicInput", config: "TaskConfig") -> "AtomicResult":
+    @classmethod
+    def _force_field(cls, jmol: "Molecule", method: str) -> Tuple[Any, threading.Lock]:
         """
-        Runs RDKit in FF typing
+        The initialized force field of `method` for the molecule, and a lock for evaluating it, built once per
+        symbols, connectivity, and charge. Geometries are passed on evaluation, so the force field is shared by
+        all conformers of a molecule. All nonbonded pairs are included, without a distance cutoff, so results do
+        not depend on the geometry the force field was built for. Within a session, the force field stays loaded
+        until the session closes.
         """
+        key = (
+            tuple(jmol.symbols),
+            tuple(tuple(bond) for bond in jmol.connectivity or ()),
+            float(jmol.molecular_charge),
+            method,
+        )
+        _, ff, lock = cls._resident(key, lambda: cls._CACHE.get(key, lambda: cls._build_force_field(jmol, method)))[0]
+        return ff, lock
 
-        self.found(raise_error=True)
-        import rdkit
+    @classmethod
+    def _build_force_field(cls, jmol: "Molecule", method: str) -> Tuple[Any, Any, threading.Lock]:
         from rdkit.Chem import AllChem
 
-        # Failure flag
-        ret_data = {"success": False}
-
         # Build the Molecule
-        jmol = input_data.molecule
-        mol = self._process_molecule_rdkit(jmol)
+        mol = cls._process_molecule_rdkit(jmol)
 
-        if input_data.specification.model.method.lower() == "uff":
-            ff = AllChem.UFFGetMoleculeForceField(mol)
+        # no nonbonded cutoff, as pairs would otherwise be selected by their distances in this geometry
+        if method == "uff":
+            ff = AllChem.UFFGetMoleculeForceField(mol, vdwThresh=float("inf"))
             all_params = AllChem.UFFHasAllMoleculeParams(mol)
-        elif input_data.specification.model.method.lower() in ["mmff94", "mmff94s"]:
-            props = AllChem.MMFFGetMoleculeProperties(mol, mmffVariant=input_data.specification.model.method)
-            ff = AllChem.MMFFGetMoleculeForceField(mol, props)
-            all_params = AllChem.MMFFHasAllMoleculeParams(mol)
         else:
-            raise InputError("RDKit only supports the UFF, MMFF94, and MMFF94s methods currently.")
+            props = AllChem.MMFFGetMoleculeProperties(mol, mmffVariant=cls._MMFF_VARIANTS[method])
+            ff = AllChem.MMFFGetMoleculeForceField(mol, props, nonBondedThresh=float("inf"))
+            all_params = AllChem.MMFFHasAllMoleculeParams(mol)
 
         if all_params is False:
             raise InputError("RDKit parameters not found for all atom types in molecule.")
 
         ff.Initialize()
+        # the force field points into the molecule's conformer, so the molecule is kept with it
+        return mol, ff, threading.Lock()
 
-        ret_data["properties"] = {
-            "return_energy": ff.CalcEnergy() * ureg.conversion_factor("kJ / mol", "hartree"),
-            "calcinfo_natom": len(jmol.symbols),
-        }
-        if input_data.specification.driver == "gradient":
-            coef = ureg.conversion_factor("kJ / mol", "hartree") * ureg.conversion_factor("angstrom", "bohr")
-            ret_data["properties"]["return_gradient"] = [x * coef for x in ff.CalcGrad()]
-
-        if input_data.specification.driver == "energy":
-            ret_data["return_result"] = ret_data["properties"]["return_energy"]
-        elif input_data.specification.driver == "gradient":
-            ret_data["return_result"] = ret_data["properties"]["return_gradient"]
-        else:
-            raise InputError(f"Driver {input_data.specification.driver} not implemented for RDKit.")
+    def compute(self, input_data: "AtomicInput", config: "TaskConfig") -> "AtomicResult":
+        """
+        Runs RDKit in FF typing
+        """
+        return self.compute_batch([input_data], config)[0]
+
+    def compute_batch(
+        self,
+        inputs: Sequence["AtomicInput"],
+        config: "TaskConfig",
+        *,
+        geometries: Optional["np.ndarray"] = None,
+    ) -> List["AtomicResult"]:
+        """
+        Runs many inputs, evaluating conformers of the same molecule and method with one force field.
+
+        Parameters
+        ----------
+        inputs
+            The inputs to run.
+        config
+            The TaskConfig, as for :meth:`compute`.
+        geometries
+            Many geometries of the molecule of a single input, of shape ``(n, natom, 3)`` in bohr. The results
+            carry copies of the molecule with these geometries.
+        """
+        self.found(raise_error=True)
+        self._CACHE.resize(config.model_cache_size)
+        import numpy as np
+        import rdkit
 
-        ret_data["provenance"] = Provenance(
+        provenance = Provenance(
             creator="rdkit", version=rdkit.__version__, routine="rdkit.Chem.AllChem.UFFGetMoleculeForceField"
         )
+        energy_coef = ureg.conversion_factor("kJ / mol", "hartree")
+        gradient_coef = energy_coef * ureg.conversion_factor("angstrom", "bohr")
+        bohr2ang = ureg.conversion_factor("bohr", "angstrom")
+
+        results = []
+        for input_data in self._geometry_inputs(inputs, geometries):
+            method = input_data.specification.model.method.lower()
+            if method != "uff" and method not in self._MMFF_VARIANTS:
+                raise InputError("RDKit only supports the UFF, MMFF94, and MMFF94s methods currently.")
+            if input_data.specification.driver not in ["energy", "gradient"]:
+                raise InputError(f"Driver {input_data.specification.driver} not implemented for RDKit.")
+
+            # Failure flag
+            ret_data = {"success": False}
+
+            jmol = input_data.molecule
+            ff, lock = self._force_field(jmol, method)
+            positions = (jmol.geometry * bohr2ang).ravel().tolist()
+
+            with lock:
+                energy = ff.CalcEnergy(positions)
+                if input_data.specification.driver == "gradient":
+                    gradient = ff.CalcGrad(positions)
+
+            ret_data["properties"] = {
+                "return_energy": energy * energy_coef,
+                "calcinfo_natom": len(jmol.symbols),
+            }
+            if input_data.specification.driver == "gradient":
+                ret_data["properties"]["return_gradient"] = np.asarray(gradient) * gradient_coef
+
+            if input_data.specification.driver == "energy":
+                ret_data["return_result"] = ret_data["properties"]["return_energy"]
+            else:
+                ret_data["return_result"] = ret_data["properties"]["return_gradient"]
+
+            ret_data["provenance"] = provenance
+
+            ret_data["success"] = True
+            ret_data["input_data"] = input_data
+            ret_data["molecule"] = jmol
 
-        ret_data["success"] = True
-        ret_data["input_data"] = input_data
-        ret_data["molecule"] = jmol
+            # Form up a dict first, then sent to BaseModel to avoid repeat kwargs which don't override each other
+            results.append(AtomicResult(**ret_data))
 
-        # Form up a dict first, then sent to BaseModel to avoid repeat kwargs which don't override each other
-        return AtomicResult(**ret_data)
+        return results
@@ -0,0 +1,116 @@
+"""
+Tests the model cache of the machine-learned potential harnesses
+"""
+
+import os
+
+from qcengine.programs.util.model_cache import ModelCache, model_memory
+
+
+class FakeTensor:
+    def __init__(self, numel):
+        self._numel = numel
+
+    def numel(self):
+        return self._numel
+
+    def element_size(self):
+        return 8
+
+
+class FakeModel:
+    def __init__(self, name, numel=10):
+        self.name = name
+        self._params = [FakeTensor(numel)]
+
+    def parameters(self):
+        return iter(self._params)
+
+    def buffers(self):
+        return iter([FakeTensor(1)])
+
+
+def test_model_memory():
+    assert model_memory(FakeModel("a", 10)) == 88
+    assert model_memory((FakeModel("a", 10), 5.0, [1, 6])) == 88
+    assert model_memory("not a model") == 0
+
+
+def test_model_cache_lru():
+    cache = ModelCache(max_entries=2)
+    loads = []
+
+    def loader(name):
+        def load():
+            loads.append(name)
+            return FakeModel(name)
+
+        return load
+
+    a, hit = cache.get("a", loader("a"))
+    assert hit is False
+    assert cache.get("a", loader("a")) == (a, True)
+
+    cache.get("b", loader("b"))
+    cache.get("a", loader("a"))
+    cache.get("c", loader("c"))
+
+    # b was the least recently used
+    assert cache.get("a", loader("a"))[1] is True
+    assert cache.get("b", loader("b"))[1] is False
+    assert loads == ["a", "b", "c", "b"]
+    assert cache.stats() == {"hits": 3, "misses": 4, "evictions": 2, "entries": 2, "memory": 176}
+    assert cache.annotation(True) == {"hit": True, "hits": 3, "misses": 4}
+
+
+def test_model_cache_memory():
+    cache = ModelCache(max_entries=10, max_memory=200)
+
+    cache.get("a", lambda: FakeModel("a"))
+    cache.get("b", lambda: FakeModel("b"))
+    cache.get("c", lambda: FakeModel("c"))
+    assert cache.stats()["entries"] == 2
+
+    # a model larger than the limit is still held, alone
+    cache.get("big", lambda: FakeModel("big", 1000))
+    assert cache.stats()["entries"] == 1
+    assert cache.get("big", lambda: FakeModel("big", 1000))[1] is True
+
+
+def test_model_cache_resize():
+    cache = ModelCache(max_entries=4)
+    for name in "abcd":
+        cache.get(name, lambda: FakeModel(name), memory=lambda model: 1)
+    assert cache.stats()["memory"] == 4
+    assert len(cache) == 4
+
+    cache.resize(None)
+    assert cache.stats()["entries"] == 4
+
+    cache.resize(2)
+    assert cache.stats()["entries"] == 2
+    assert cache.get("d", lambda: FakeModel("d"))[1] is True
+    assert cache.get("a", lambda: FakeModel("a"))[1] is False
+
+    # a later computation without a size gets the default back
+    cache.resize(None)
+    assert cache.max_entries == 4
+    for name in "bcd":
+        cache.get(name, lambda: FakeModel(name), memory=lambda model: 1)
+    assert cache.stats()["entries"] == 4
+
+
+def test_model_cache_file(tmp_path):
+    path = tmp_path / "model.pt"
+    path.write_text("one")
+    cache = ModelCache()
+
+    first, _ = cache.get("model", lambda: FakeModel("one"), path=str(path))
+    assert cache.get("model", lambda: FakeModel("two"), path=str(path)) == (first, True)
+
+    path.write_text("two, longer")
+    os.utime(path, ns=(0, 10**9))
+    second, hit = cache.get("model", lambda: FakeModel("two"), path=str(path))
+    assert hit is False
+    assert second.name == "two"
+    assert cache.stats()["entries"] == 1
@@ -2,6 +2,10 @@
 Tests the DQM compute dispatch module
 """
 
+import asyncio
+import importlib
+import threading
+import time
 
 import numpy as np
 import pytest
@@ -256,6 +260,95 @@ def test_rdkit_task(method, schema_versions, request):
     assert ret.success is True
 
 
+@uusing("rdkit")
+@pytest.mark.parametrize("method", ["UFF", "MMFF94s"])
+def test_rdkit_batch(method):
+    from qcelemental.models.v2 import AtomicInput, Molecule
+
+    harness = qcng.get_program("rdkit")
+    water = Molecule(**qcng.get_molecule("water", return_dict=True))
+    input_data = AtomicInput(molecule=water, specification={"driver": "gradient", "model": {"method": method}})
+    geometries = np.array([water.geometry * scale for scale in [0.97, 1.0, 1.03]])
+
+    harness._CACHE.clear()
+    batch = harness.compute_batch([input_data], qcng.get_config(), geometries=geometries)
+    assert harness._CACHE.stats()["entries"] == 1
+
+    # each conformer matches a force field built for it alone
+    for geom, ret in zip(geometries, batch):
+        harness._CACHE.clear()
+        molecule = Molecule(**{**qcng.get_molecule("water", return_dict=True), "geometry": geom})
+        single = harness.compute(
+            AtomicInput(molecule=molecule, specification=input_data.specification), qcng.get_config()
+        )
+        assert compare_values(single.return_result, ret.return_result, atol=1.0e-10)
+        assert compare_values(single.properties.return_energy, ret.properties.return_energy, atol=1.0e-10)
+
+
+@uusing("rdkit")
+@pytest.mark.parametrize("method", ["UFF", "MMFF94"])
+def test_rdkit_force_field_order(method):
+    from qcelemental.models.v2 import AtomicInput, Molecule
+
+    harness = qcng.get_program("rdkit")
+    propane = qcng.get_molecule("propane", return_dict=True)
+
+    def gradient(scale):
+        molecule = Molecule(**{**propane, "geometry": np.array(propane["geometry"]) * scale})
+        input_data = AtomicInput(molecule=molecule, specification={"driver": "gradient", "model": {"method": method}})
+        return harness.compute(input_data, qcng.get_config())
+
+    # far apart, the nonbonded pairs lie beyond the default cutoffs, so the force field must not drop them
+    # for the geometry it is built on
+    harness._CACHE.clear()
+    near, far = gradient(1.0), gradient(40.0)
+    harness._CACHE.clear()
+    far_first, near_second = gradient(40.0), gradient(1.0)
+
+    assert compare_values(near.return_result, near_second.return_result, atol=1.0e-12)
+    assert compare_values(far.return_result, far_first.return_result, atol=1.0e-12)
+    assert compare_values(near.properties.return_energy, near_second.properties.return_energy, atol=1.0e-12)
+    assert compare_values(far.properties.return_energy, far_first.properties.return_energy, atol=1.0e-12)
+
+
+@uusing("rdkit")
+def test_rdkit_conversion():
+    from qcelemental.models.v2 import AtomicInput, Molecule
+    from rdkit.Chem import AllChem
+
+    from qcengine.programs.rdkit import RDKitHarness
+    from qcengine.units import ureg
+
+    # a fragment from a grid of stock propane molecules 6 A apart
+    propane = qcng.get_molecule("propane", return_dict=True)
+    natom = len(propane["symbols"])
+    shifts = np.array([[x, y, z] for x in range(2) for y in range(2) for z in range(2)]) * 6.0 / 0.52917721
+    cluster = Molecule(
+        symbols=propane["symbols"] * len(shifts),
+        geometry=(np.reshape(propane["geometry"], (1, -1, 3)) + shifts[:, None, :]).reshape(-1, 3),
+        connectivity=[
+            (a + i * natom, b + i * natom, o) for i in range(len(shifts)) for a, b, o in propane["connectivity"]
+        ],
+        fix_com=True,
+        fix_orientation=True,
+    )
+    bohr2ang = ureg.conversion_factor("bohr", "angstrom")
+
+    # positions set in bulk match the geometry atom by atom
+    mol = RDKitHarness._process_molecule_rdkit(cluster)
+    assert compare_values(cluster.geometry * bohr2ang, mol.GetConformer().GetPositions(), atol=1.0e-12)
+
+    # the gradient converted as a whole array matches converting it element by element
+    ret = qcng.compute(
+        AtomicInput(molecule=cluster, specification={"driver": "gradient", "model": {"method": "UFF"}}),
+        "rdkit",
+        raise_error=True,
+    )
+    gradient_coef = ureg.conversion_factor("kJ / mol", "hartree") * ureg.conversion_factor("angstrom", "bohr")
+    reference = [x * gradient_coef for x in AllChem.UFFGetMoleculeForceField(mol).CalcGrad()]
+    assert compare_values(np.reshape(reference, (-1, 3)), ret.return_result, atol=1.0e-10)
+
+
 @uusing("rdkit")
 def test_rdkit_connectivity_error(schema_versions, request):
     models, retver, _ = schema_versions
@@ -313,6 +406,277 @@ def test_torchani_task(schema_versions, request):
         assert ret.driver == "gradient"
 
 
+@uusing("torchani")
+def test_torchani_batch():
+    from qcelemental.models.v2 import AtomicInput, Molecule
+
+    water = Molecule(**qcng.get_molecule("water", return_dict=True))
+    methane = Molecule(
+        symbols=["C", "H", "H", "H", "H"],
+        geometry=[0, 0, 0, 1.19, 1.19, 1.19, -1.19, -1.19, 1.19, -1.19, 1.19, -1.19, 1.19, -1.19, -1.19],
+    )
+    inputs = [
+        AtomicInput(molecule=mol, specification={"driver": driver, "model": {"method": method}})
+        for mol, driver, method in [
+            (water, "gradient", "ANI1x"),
+            (methane, "energy", "ANI1x"),
+            (methane, "gradient", "ANI1ccx"),
+            (water, "hessian", "ANI1x"),
+        ]
+    ]
+
+    harness = qcng.get_program("torchani")
+    config = qcng.get_config()
+    batch = harness.compute_batch(inputs, config)
+
+    for input_data, ret in zip(inputs, batch):
+        single = harness.compute(input_data, config)
+        assert single.extras["qcengine_model_cache"]["hit"] is True
+        assert ret.input_data is input_data
+        assert compare_values(single.return_result, ret.return_result, atol=1.0e-6)
+        assert compare_values(single.extras["ensemble_energies"], ret.extras["ensemble_energies"], atol=1.0e-6)
+        assert compare_values(
+            single.extras["ensemble_per_root_atom_disagreement"],
+            ret.extras["ensemble_per_root_atom_disagreement"],
+            atol=1.0e-6,
+        )
+
+    geometries = np.array([water.geometry * scale for scale in [0.98, 1.0, 1.02]])
+    rets = harness.compute_batch(inputs[:1], config, geometries=geometries)
+    assert len(rets) == 3
+    assert compare_values(geometries[1], rets[1].molecule.geometry)
+    assert compare_values(batch[0].return_result, rets[1].return_result, atol=1.0e-6)
+
+
+@uusing("torchani")
+@pytest.mark.parametrize("method", ["ANI1x", "ANI2x"])
+def test_torchani_ensemble_members(method):
+    import torch
+
+    harness = qcng.get_program("torchani")
+    model = harness.get_model(method)
+    names = ["hydrogen", "water", "ethane", "propane", "eneyne"]
+
+    # members of the ensemble share one AEV computation yet match each member run on its own
+    species, coordinates = harness.batch_tensors(model, [qcng.get_molecule(name, return_dict=False) for name in names])
+    with torch.no_grad():
+        shared = model((species, coordinates))[1]
+        looped = model.looped_members(species, coordinates)
+
+    assert shared.shape == (len(model.base), len(names))
+    assert compare_values(looped.numpy(), shared.numpy(), atol=1.0e-6)
+
+
+@uusing("torchani")
+def test_torch_threads():
+    import threading
+
+    import torch
+
+    from qcengine.programs.util.threads import torch_threads
+
+    # each thread scopes its own count, so overlapping tasks do not see each other's
+    barrier = threading.Barrier(2)
+    seen = {}
+
+    def task(ncores):
+        original = torch.get_num_threads()
+        with torch_threads(ncores):
+            barrier.wait()
+            seen[ncores] = torch.get_num_threads()
+            barrier.wait()
+        seen[ncores] = (seen[ncores], torch.get_num_threads() == original)
+
+    threads = [threading.Thread(target=task, args=(ncores,)) for ncores in [1, 3]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == {1: (1, True), 3: (3, True)}
+
+
+@uusing("openmm")
+def test_openmm_context_reuse():
+    from qcelemental.models.v2 import AtomicInput, Molecule
+
+    from qcengine.programs.openmm import OpenMMHarness
+
+    def water_input(scale):
+        water = qcng.get_molecule("water", return_dict=True)
+        water["geometry"] = np.array(water["geometry"]) * scale
+        return AtomicInput(
+            molecule=Molecule(**water),
+            specification={"driver": "gradient", "model": {"method": "openff-1.0.0", "basis": "smirnoff"}},
+        )
+
+    OpenMMHarness._CACHE.clear()
+    rets = [qcng.compute(water_input(scale), "openmm", raise_error=True) for scale in [1.0, 1.05]]
+
+    # one System and one Context
+    assert OpenMMHarness._CACHE.stats()["entries"] == 2
+    assert OpenMMHarness._CACHE.stats()["memory"] > 0
+    assert rets[0].extras["qcengine_model_cache"]["hit"] is False
+    assert rets[1].extras["qcengine_model_cache"]["hit"] is True
+
+    qcng.compute(water_input(1.0), "openmm", raise_error=True, task_config={"ncores": 1, "model_cache_size": 1})
+    assert OpenMMHarness._CACHE.stats()["entries"] == 1
+    qcng.compute(water_input(1.0), "openmm", raise_error=True)
+    assert OpenMMHarness._CACHE.max_entries == 20
+
+    OpenMMHarness._CACHE.clear()
+    fresh = qcng.compute(water_input(1.05), "openmm", raise_error=True)
+    assert compare_values(fresh.return_result, rets[1].return_result, atol=1.0e-10)
+    assert compare_values(fresh.properties.return_energy, rets[1].properties.return_energy, atol=1.0e-10)
+    assert not compare_values(rets[0].properties.return_energy, rets[1].properties.return_energy, quiet=True)
+
+
+def test_openmm_context_pool():
+    import threading
+
+    from qcengine.programs.openmm import _ContextPool
+
+    created = []
+
+    def create():
+        created.append(object())
+        return created[-1], None
+
+    pool = _ContextPool(create, size=2)
+    assert len(created) == 1
+
+    # an idle context is reused rather than another created
+    with pool.context() as first:
+        pass
+    with pool.context() as again:
+        assert again is first
+    assert len(created) == 1
+
+    # a busy pool grows to its size, after which computations wait for a context
+    entered, leave = threading.Barrier(3), threading.Event()
+    seen = []
+
+    def task(barrier):
+        with pool.context() as context:
+            seen.append(context)
+            if barrier:
+                entered.wait()
+            leave.wait()
+
+    threads = [threading.Thread(target=task, args=(True,)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    entered.wait()
+    assert len(created) == 2 and len(set(map(id, seen))) == 2
+
+    waiter = threading.Thread(target=task, args=(False,))
+    waiter.start()
+    time.sleep(0.05)
+    assert len(seen) == 2
+    leave.set()
+    for thread in threads + [waiter]:
+        thread.join()
+
+    assert len(created) == 2 and len(seen) == 3
+
+
+def test_openmm_context_pool_memory(monkeypatch):
+    from qcengine.programs.openmm import OpenMMHarness
+
+    class System:
+        def getNumParticles(self):
+            return 3
+
+    monkeypatch.setattr(OpenMMHarness, "_create_context", staticmethod(lambda system, nthreads: (object(), None)))
+    OpenMMHarness._CACHE.clear()
+
+    # charged for the Contexts the pool may hold, not for the System again
+    pool, hit = OpenMMHarness()._get_context("water", System(), 1)
+    assert not hit
+    assert OpenMMHarness._CACHE.stats()["memory"] == 3 * OpenMMHarness._CONTEXT_BYTES_PER_PARTICLE * pool.size
+    OpenMMHarness._CACHE.clear()
+
+
+def test_openmm_system_key():
+    from qcelemental.models.v2 import Molecule
+
+    from qcengine.programs.openmm import OpenMMHarness
+
+    water = qcng.get_molecule("water", return_dict=True)
+    water["connectivity"] = [(0, 1, 1), (0, 2, 1)]
+
+    def key(method="openff-1.0.0", keywords=None, **fields):
+        return OpenMMHarness._system_key(Molecule(**{**water, **fields}), method, keywords or {})
+
+    # independent of the geometry and of the order of bonds, but not of the graph or the force field
+    assert key() == key(geometry=np.array(water["geometry"]) * 1.05)
+    assert key() == key(connectivity=[(0, 2, 1), (0, 1, 1)])
+    assert key() != key(connectivity=[(0, 1, 1)])
+    assert key() != key(method="gaff-2.11")
+    assert key() != key(keywords={"constraints": "hbonds"})
+    assert key() != key(extras={"canonical_isomeric_explicit_hydrogen_mapped_smiles": "[H:2][O:1][H:3]"})
+
+
+def test_openmm_system_key_stereo():
+    from qcelemental.models.v2 import Molecule
+
+    from qcengine.programs.openmm import OpenMMHarness
+
+    def key(symbols, geometry, connectivity):
+        molecule = Molecule(symbols=symbols, geometry=geometry, connectivity=connectivity)
+        return OpenMMHarness._system_key(molecule, "openff-1.0.0", {})
+
+    # the enantiomers of bromochlorofluoromethane
+    symbols = ["C", "H", "F", "Cl", "Br"]
+    geometry = np.array([[0, 0, 0], [1, 1, 1], [1, -1, -1], [-1, 1, -1], [-1, -1, 1]]) * 1.2
+    connectivity = [(0, 1, 1), (0, 2, 1), (0, 3, 1), (0, 4, 1)]
+    rotation = np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]])
+    assert key(symbols, geometry, connectivity) == key(symbols, geometry @ rotation.T, connectivity)
+    assert key(symbols, geometry, connectivity) != key(symbols, geometry * [-1, 1, 1], connectivity)
+
+    # cis and trans 1,2-difluoroethene
+    symbols = ["C", "C", "F", "H", "F", "H"]
+    connectivity = [(0, 1, 2), (0, 2, 1), (0, 3, 1), (1, 4, 1), (1, 5, 1)]
+    cis = np.array([[0, 0, 0], [2.5, 0, 0], [-1.2, 2.0, 0], [-1.0, -1.8, 0], [3.7, 2.0, 0], [3.5, -1.8, 0]])
+    trans = cis[[0, 1, 2, 3, 5, 4]]
+    assert key(symbols, cis, connectivity) == key(symbols, cis * [1, 1.1, 1], connectivity)
+    assert key(symbols, cis, connectivity) != key(symbols, trans, connectivity)
+
+    # the hydrogens of a methylene give no stereoisomers
+    methylene = ["C", "H", "H", "F", "Cl"]
+    center = [(0, 1, 1), (0, 2, 1), (0, 3, 1), (0, 4, 1)]
+    assert key(methylene, geometry, center) == key(methylene, geometry * [-1, 1, 1], center)
+
+
+@uusing("openmm")
+def test_openmm_no_conversion_on_reuse(monkeypatch):
+    from qcelemental.models.v2 import AtomicInput, Molecule
+
+    from qcengine.programs.openmm import OpenMMHarness
+
+    conversions = []
+    openff_molecule = OpenMMHarness._openff_molecule
+
+    def counted(molecule):
+        conversions.append(molecule)
+        return openff_molecule(molecule)
+
+    monkeypatch.setattr(OpenMMHarness, "_openff_molecule", staticmethod(counted))
+    OpenMMHarness._CACHE.clear()
+
+    water = qcng.get_molecule("water", return_dict=True)
+    for scale in [1.0, 1.05, 1.1]:
+        water["geometry"] = np.array(qcng.get_molecule("water", return_dict=True)["geometry"]) * scale
+        inp = AtomicInput(
+            molecule=Molecule(**water),
+            specification={"driver": "energy", "model": {"method": "openff-1.0.0", "basis": "smirnoff"}},
+        )
+        ret = qcng.compute(inp, "openmm", raise_error=True)
+
+    assert len(conversions) == 1
+    assert ret.extras["qcengine_model_cache"]["hit"] is True
+
+
 @uusing("mopac")
 def test_mopac_task(schema_versions, request):
     _, retver, _ = schema_versions
@@ -451,6 +815,218 @@ def test_random_failure_with_success(failure_engine, schema_versions, request):
     assert ret.extras["ncalls"] == 2
 
 
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_compute_many_ordered(failure_engine, max_workers):
+    failure_engine.iter_modes = ["pass"] * 4
+    jobs = []
+    for distance in [4.5, 5.0, 5.5, 6.0]:
+        failure_engine.start_distance = distance
+        jobs.append(failure_engine.get_job())
+
+    rets = qcng.compute_many(jobs, failure_engine.name, max_workers=max_workers, return_version=2)
+
+    assert len(rets) == 4
+    for distance, ret in zip([4.5, 5.0, 5.5, 6.0], rets):
+        assert ret.success, ret.error.error_message
+        assert ret.properties.return_energy == pytest.approx(abs(distance - 4.0))
+        # not thread_parallel, so each worker gets a single core
+        assert ret.provenance.ncores == 1
+
+
+def test_compute_many_as_completed(failure_engine):
+    failure_engine.iter_modes = ["pass", "input_error", "pass"]
+    jobs = [failure_engine.get_job() for _ in range(3)]
+
+    rets = dict(qcng.compute_many(jobs, failure_engine.name, max_workers=1, as_completed=True, return_version=2))
+
+    assert rets.keys() == {0, 1, 2}
+    assert rets[0].success
+    assert rets[1].error.error_type == "input_error"
+    assert rets[2].success
+
+
+def test_compute_async(failure_engine):
+    failure_engine.iter_modes = ["pass", "random_error", "pass"]
+
+    async def run():
+        first = await qcng.compute_async(failure_engine.get_job(), failure_engine.name, return_version=2)
+        second = await qcng.compute_async(
+            failure_engine.get_job(), failure_engine.name, task_config={"retries": 1}, return_version=2
+        )
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first.success, first.error.error_message
+    assert second.success, second.error.error_message
+    assert second.provenance.retries == 1
+
+
+def test_compute_async_not_thread_safe(failure_engine, monkeypatch):
+    failure_engine.iter_modes = ["pass"] * 4
+    failure_engine.thread_safe = False
+    running, overlaps = [], []
+    compute = type(failure_engine).compute
+
+    def slow_compute(self, input_data, config):
+        running.append(1)
+        overlaps.append(len(running))
+        time.sleep(0.05)
+        running.pop()
+        return compute(self, input_data, config)
+
+    monkeypatch.setattr(type(failure_engine), "compute", slow_compute)
+
+    async def run():
+        jobs = [qcng.compute_async(failure_engine.get_job(), failure_engine.name, return_version=2) for _ in range(4)]
+        return await asyncio.gather(*jobs)
+
+    rets = asyncio.run(run())
+
+    assert all(ret.success for ret in rets)
+    assert overlaps == [1, 1, 1, 1]
+
+
+def test_nwchem_compute_async_off_loop(monkeypatch):
+    from qcengine.programs.nwchem.runner import NWChemHarness
+
+    loop_thread, threads = threading.get_ident(), {}
+
+    def record(name, value):
+        def method(*args, **kwargs):
+            threads[name] = threading.get_ident()
+            return value
+
+        return method
+
+    async def execute_async(self, job_inputs):
+        return True, {}
+
+    monkeypatch.setattr(NWChemHarness, "found", staticmethod(lambda raise_error=False: True))
+    monkeypatch.setattr(NWChemHarness, "build_input", record("build_input", {"infiles": {}}))
+    monkeypatch.setattr(NWChemHarness, "get_version", record("get_version", "7.2.0"))
+    monkeypatch.setattr(NWChemHarness, "execute_async", execute_async)
+    monkeypatch.setattr(NWChemHarness, "_collect_output", record("_collect_output", "result"))
+
+    assert asyncio.run(NWChemHarness()._compute_async(None, qcng.get_config())) == "result"
+    assert threads["build_input"] != loop_thread
+    assert threads["get_version"] != loop_thread
+
+
+def test_compute_validated_fast_path(failure_engine):
+    from qcelemental.models.v2 import AtomicInput, Molecule
+
+    failure_engine.iter_modes = ["pass"]
+    extras = {"_qcengine_local_config": {"ncores": 1}, "keep": True}
+    inp = AtomicInput(
+        molecule=failure_engine.get_job()["molecule"],
+        specification={"driver": "gradient", "model": {"method": "x"}, "extras": extras},
+    )
+
+    assert failure_engine.build_input_model(inp) is inp
+
+    ret = qcng.compute(inp, failure_engine.name)
+
+    assert ret.success, ret.error.error_message
+    assert ret.provenance.ncores == 1
+    assert ret.input_data.specification.extras == {"keep": True}
+    # the caller's model is left alone
+    assert inp.specification.extras == extras
+
+
+def test_compute_overhead(failure_engine):
+    from qcelemental.models.v2 import AtomicInput, Molecule
+
+    ncalls = 50
+    failure_engine.iter_modes = ["pass"] * (ncalls + 1)
+    job = failure_engine.get_job()
+    inp = AtomicInput(molecule=job["molecule"], specification={"driver": "gradient", "model": {"method": "x"}})
+    qcng.compute(inp, failure_engine.name)
+
+    start = time.perf_counter()
+    for _ in range(ncalls):
+        ret = qcng.compute(inp, failure_engine.name)
+    overhead = (time.perf_counter() - start) / ncalls
+
+    assert ret.success, ret.error.error_message
+    # generous bound to catch regressions to per-call conversion and re-validation, not a benchmark of the host
+    assert overhead < 0.05, f"compute overhead {overhead * 1e3:.2f} ms/call"
+
+
+def test_compute_many_bad_program():
+    rets = qcng.compute_many([{}, {}], "bad_program")
+
+    assert len(rets) == 2
+    assert all("not registered" in ret.error.error_message for ret in rets)
+
+
+def test_compute_many_program_resolution(failure_engine, monkeypatch):
+    compute = importlib.import_module("qcengine.compute")
+
+    def get_procedure(name):
+        raise AssertionError(f"{name} is not a procedure")
+
+    # programs are told apart from procedures by name, as in `compute`, without trying get_procedure first
+    monkeypatch.setattr(compute, "get_procedure", get_procedure)
+    failure_engine.iter_modes = ["pass"] * 2
+    rets = qcng.compute_many([failure_engine.get_job()] * 2, failure_engine.name, max_workers=2, return_version=2)
+
+    assert all(ret.success for ret in rets)
+
+
+def test_compute_batch(failure_engine):
+    failure_engine.iter_modes = ["pass"] * 5
+    jobs = []
+    for distance in [4.5, 5.0, 5.5]:
+        failure_engine.start_distance = distance
+        jobs.append(failure_engine.get_job())
+    bad = {**jobs[0]}
+    bad.pop("molecule")
+
+    rets = qcng.compute_batch([jobs[0], bad, jobs[1], jobs[2]], failure_engine.name, return_version=2)
+
+    assert [ret.success for ret in rets] == [True, False, True, True]
+    assert rets[1].error.error_type == "input_error"
+    for distance, ret in zip([4.5, 5.0, 5.5], rets[:1] + rets[2:]):
+        assert ret.properties.return_energy == pytest.approx(abs(distance - 4.0))
+        assert ret.provenance.creator == "failure_engine"
+        assert ret.provenance.wall_time == rets[0].provenance.wall_time
+
+    # many geometries of one input
+    geometries = np.array([[[0, 0, 0], [0, 0, distance]] for distance in [4.25, 3.5]])
+    rets = qcng.compute_batch([jobs[0]], failure_engine.name, return_version=2, geometries=geometries)
+
+    assert [ret.properties.return_energy for ret in rets] == pytest.approx([0.25, 0.5])
+    assert compare_values(geometries[1], rets[1].molecule.geometry)
+
+    ret = qcng.compute_batch([jobs[0]], failure_engine.name, return_version=2, geometries=geometries[0])[0]
+    assert "shape (n, 2, 3)" in ret.error.error_message
+    with pytest.raises(qcng.exceptions.InputError):
+        qcng.compute_batch(jobs[:2], failure_engine.name, geometries=geometries)
+
+
+def test_compute_batch_signature(failure_engine):
+    import inspect
+
+    from qcengine.programs.aimnet2 import AIMNET2Harness
+    from qcengine.programs.mace import MACEHarness
+    from qcengine.programs.model import ProgramHarness
+    from qcengine.programs.rdkit import RDKitHarness
+    from qcengine.programs.torchani import TorchANIHarness
+
+    # any harness can be handed geometries, whether it batches natively or not
+    expected = inspect.signature(ProgramHarness.compute_batch).parameters
+    for harness in [AIMNET2Harness, MACEHarness, RDKitHarness, TorchANIHarness]:
+        parameters = inspect.signature(harness.compute_batch).parameters
+        assert [(p.name, p.kind) for p in parameters.values()] == [(p.name, p.kind) for p in expected.values()]
+
+    failure_engine.iter_modes = ["pass"] * 2
+    inp = failure_engine.build_input_model(failure_engine.get_job())
+    geometries = np.array([[[0, 0, 0], [0, 0, distance]] for distance in [4.25, 3.5]])
+    rets = failure_engine.compute_batch([inp], qcng.get_config(), geometries=geometries)
+    assert [ret.properties.return_energy for ret in rets] == pytest.approx([0.25, 0.5])
+
+
 @uusing("openmm")
 def test_openmm_task_smirnoff(schema_versions, request):
     models, retver, _ = schema_versions
@@ -708,6 +1284,43 @@ def test_mace_gradient(schema_versions, request):
     assert pytest.approx(result.return_result) == expected_result
 
 
+@uusing("mace")
+def test_mace_batch():
+    import torch
+    from qcelemental.models.v2 import AtomicInput
+
+    inputs = [
+        AtomicInput(
+            molecule=qcng.get_molecule(name, return_dict=True),
+            specification={"driver": driver, "model": {"method": "small"}, "keywords": keywords},
+        )
+        for name, driver, keywords in [
+            ("water", "gradient", {}),
+            ("ethane", "energy", {}),
+            ("propane", "gradient", {}),
+            ("water", "energy", {"dtype": "float32"}),
+        ]
+    ]
+
+    harness = qcng.get_program("mace")
+    config = qcng.get_config()
+    batch = harness.compute_batch(inputs, config)
+
+    # the batch is cast to each model's dtype, leaving the process-wide default alone
+    assert torch.get_default_dtype() == torch.float32
+    assert pytest.approx(batch[0].properties.return_energy) == -76.47683956098838
+    assert batch[2].return_result.shape == (11, 3)
+    for input_data, ret in zip(inputs[:3], batch):
+        single = harness.compute(input_data, config)
+        assert compare_values(single.return_result, ret.return_result, atol=1.0e-8)
+
+    # float32 screening is close to, not at, double precision
+    assert compare_values(batch[0].properties.return_energy, batch[3].return_result, atol=1.0e-4)
+
+    with pytest.raises(qcng.exceptions.InputError):
+        harness.load_model("small", "float16")
+
+
 @uusing("aimnet2")
 @pytest.mark.parametrize(
     "model, expected_energy",
@@ -736,7 +1349,8 @@ def test_aimnet2_energy(model, expected_energy, schema_versions, request):
     assert pytest.approx(result.return_result) == expected_energy
     assert "charges" in result.extras["aimnet2"]
     assert "ensemble_charges_std" in result.extras["aimnet2"]
-    assert "ensemble_forces_std" in result.extras["aimnet2"]
+    # forces are not evaluated for energies
+    assert result.properties.return_gradient is None
 
 
 @uusing("aimnet2")
@@ -773,6 +1387,42 @@ def test_aimnet2_gradient(schema_versions, request):
     assert pytest.approx(result.properties.return_energy) == -76.47412023758551
     # make sure the other properties were also saved
     assert "charges" in result.extras["aimnet2"]
+    assert "ensemble_forces_std" in result.extras["aimnet2"]
+
+
+@uusing("aimnet2")
+def test_aimnet2_batch():
+    from qcelemental.models.v2 import AtomicInput, Molecule
+
+    water = qcng.get_molecule("water", return_dict=True)
+    hydroxide = Molecule(symbols=["O", "H"], geometry=[0, 0, 0, 0, 0, 1.83], molecular_charge=-1)
+    inputs = [
+        AtomicInput(molecule=mol, specification={"driver": driver, "model": {"method": "wb97m-d3"}})
+        for mol, driver in [
+            (water, "gradient"),
+            (hydroxide, "gradient"),
+            (water, "energy"),
+            (hydroxide, "energy"),
+            (qcng.get_molecule("ethane", return_dict=True), "energy"),
+        ]
+    ]
+
+    harness = qcng.get_program("aimnet2")
+    config = qcng.get_config()
+    batch = harness.compute_batch(inputs, config)
+
+    assert pytest.approx(batch[0].properties.return_energy) == -76.47412023758551
+    assert pytest.approx(batch[2].return_result) == -76.47412023758551
+    assert batch[2].properties.return_gradient is None
+    assert batch[1].return_result.shape == (2, 3)
+    assert batch[1].extras["aimnet2"]["charges"].shape == (2,)
+    assert batch[4].extras["aimnet2"]["ensemble_charges_std"].shape == (8,)
+    # each molecule keeps its own charge
+    assert pytest.approx(sum(batch[3].extras["aimnet2"]["charges"]), abs=1.0e-3) == -1.0
+
+    for input_data, ret in zip(inputs, batch):
+        single = harness.compute(input_data, config)
+        assert compare_values(single.return_result, ret.return_result, atol=1.0e-8)
 
 
 @uusing("psi4")
@@ -2,7 +2,7 @@
 Calls the TorchANI package.
 """
 
-from typing import TYPE_CHECKING, Any, ClassVar, Dict
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Sequence, Tuple
 
 from qcelemental.models.v2 import AtomicResult, Provenance
 from qcelemental.util import parse_version, safe_version, which_import
@@ -10,23 +10,28 @@ from qcelemental.util import parse_version, safe_version, which_import
 from ..exceptions import InputError, ResourceError
 from ..units import ureg
 from .model import ProgramHarness
+from .util.model_cache import ModelCache
+from .util.threads import torch_threads
 
 if TYPE_CHECKING:
-    from qcelemental.models.v2 import AtomicInput
+    import numpy as np
+    import torch
+    from qcelemental.models.v2 import AtomicInput, Molecule
 
     from ..config import TaskConfig
+    from ..session import Session
 
 
 class TorchANIHarness(ProgramHarness):
     """Interface for TorchANI project."""
 
-    _CACHE = {}
+    _CACHE: ClassVar[ModelCache] = ModelCache()
 
     _defaults: ClassVar[Dict[str, Any]] = {
         "name": "TorchANI",
         "scratch": False,
         "thread_safe": True,
-        "thread_parallel": False,
+        "thread_parallel": True,
         "node_parallel": False,
         "managed_memory": False,
     }
@@ -53,11 +58,14 @@ class TorchANIHarness(ProgramHarness):
         return self.version_cache[which_prog]
 
     def get_model(self, name: str) -> "torchani.models.BuiltinModels":
-        name = name.lower()
+        return self._get_model(name)[0]
 
-        if name in self._CACHE:
-            return self._CACHE[name]
+    def _get_model(self, name: str) -> Tuple["torchani.models.BuiltinModels", bool]:
+        """The model for `name` and whether it was cached."""
+        name = name.lower()
+        return self._resident(("model", name), lambda: self._CACHE.get(name, lambda: self._build_model(name)))
 
+    def _build_model(self, name: str) -> "torchani.models.BuiltinModels":
         import torch
         import torch.nn as nn
         import torchani
@@ -105,6 +113,16 @@ class TorchANIHarness(ProgramHarness):
             def forward(self, first, *rest, **kwargs):
                 species, coords, extra = self._normalize_call_args(first, rest)
 
+                members_energies = getattr(self.base, "members_energies", None)
+                if members_energies is None:
+                    return species, self.looped_members(species, coords, *extra, **kwargs)
+
+                # the AEVs are computed once and shared by the member networks
+                outputs = self._extract_energies(members_energies((species, coords), *extra, **kwargs))
+                return species, outputs
+
+            def looped_members(self, species, coords, *extra, **kwargs):
+                """(n_members, n_molecules) energies, calling each member on its own as TorchANI before 2.1 needs."""
                 member_energies = []
                 n_members = len(self.base)
                 for i in range(n_members):
@@ -113,9 +131,7 @@ class TorchANIHarness(ProgramHarness):
                     e = self._extract_energies(out)
                     member_energies.append(e)
 
-                # keep old flat vector pattern using torch.cat([...])
-                outputs = torch.cat(member_energies, dim=0)
-                return species, outputs
+                return torch.stack(member_energies, dim=0)
 
         ani_models = {
             "ani1x": torchani.models.ANI1x,
@@ -128,42 +144,100 @@ class TorchANIHarness(ProgramHarness):
             raise InputError(f"TorchANI only accepts methods: {list(ani_models.keys())}")
 
         base = ani_models[name]()  # the actual TorchANI model
-        wrapped = EnsembleEnergies(base)  # your compatibility wrapper
-        self._CACHE[name] = wrapped
+        return EnsembleEnergies(base)  # your compatibility wrapper
 
-        return self._CACHE[name]
+    def open_session(self, session: "Session") -> None:
+        # load the model up front, so the first computation is as quick as the rest
+        self.get_model(session.specification.model.method)
 
     def compute(self, input_data: "AtomicInput", config: "TaskConfig") -> "AtomicResult":
         """
         Runs TorchANI in FF typing
         """
+        return self.compute_batch([input_data], config)[0]
+
+    def compute_batch(
+        self,
+        inputs: Sequence["AtomicInput"],
+        config: "TaskConfig",
+        *,
+        geometries: Optional["np.ndarray"] = None,
+    ) -> List["AtomicResult"]:
+        """
+        Runs many inputs with one forward pass of the ensemble per method. Molecules of different sizes are
+        padded, so any mix of molecules, methods, and drivers may be batched.
+
+        Parameters
+        ----------
+        inputs
+            The inputs to run.
+        config
+            The TaskConfig, as for :meth:`compute`.
+        geometries
+            Many geometries of the molecule of a single input, of shape ``(n, natom, 3)`` in bohr. The results
+            carry copies of the molecule with these geometries.
+        """
         # Check if exists and version
         self.found(raise_error=True)
+        self._CACHE.resize(config.model_cache_size)
         if parse_version(self.get_version()) < parse_version("0.9"):
             raise ResourceError("QCEngine's TorchANI wrapper requires version 0.9 or greater.")
 
+        inputs = self._geometry_inputs(inputs, geometries)
+
+        # One forward pass for each method, keeping the input order in the results
+        groups = {}
+        for index, input_data in enumerate(inputs):
+            self._check_input(input_data)
+            groups.setdefault(input_data.specification.model.method.lower(), []).append(index)
+
+        results = [None] * len(inputs)
+        with torch_threads(config.ncores):
+            for indices in groups.values():
+                batch = [inputs[index] for index in indices]
+                for index, result in zip(indices, self._compute_group(batch)):
+                    results[index] = result
+        return results
+
+    @staticmethod
+    def _check_input(input_data: "AtomicInput") -> None:
+        method = input_data.specification.model.method
+
+        known_sym = {"H", "C", "N", "O"}
+        if method.lower() == "ani2x":
+            known_sym.update({"S", "F", "Cl"})
+        unknown_sym = set(input_data.molecule.symbols) - known_sym
+        if unknown_sym:
+            raise InputError(f"TorchANI model '{method}' does not support symbols: {unknown_sym}.")
+
+        if input_data.specification.driver not in ["energy", "gradient", "hessian"]:
+            raise InputError(
+                f"TorchANI can only compute energy, gradient, and hessian driver methods. Found {input_data.specification.driver}."
+            )
+
+    @staticmethod
+    def batch_tensors(
+        model: "torch.nn.Module", molecules: Sequence["Molecule"], device: Optional["torch.device"] = None
+    ) -> Tuple["torch.Tensor", "torch.Tensor"]:
+        """
+        The padded species and coordinates (in Angstrom) tensors for `model` of a batch of molecules.
+        Species are padded with -1, which TorchANI skips, and coordinates with zeros.
+        """
         import numpy as np
         import torch
         import torchani
 
-        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-
-        # Failure flag
-        ret_data = {"success": False}
-
         # helpers functions for version compatibility
-        def species_tensor_from_symbols(symbols, model, device):
+        def species_converter(model):
             """
-            Returns a (1, A) LongTensor species tensor compatible with both:
+            Returns a converter of symbols into a (A,) LongTensor species tensor compatible with both:
               - torchani 2.7+ (atomic numbers input)
               - torchani 2.2.x (model-index input via model.species)
             """
-            symbols = list(symbols)
-
             # Newer TorchANI (e.g., 2.7+) supports atomic-number conversion in torchani.utils
             to_Z = getattr(torchani.utils, "ChemicalSymbolsToAtomicNumbers", None)
             if to_Z is not None:
-                return to_Z()(symbols).to(device).unsqueeze(0)
+                return to_Z()
 
             # Older TorchANI (e.g., 2.2.4): convert to model indices using model.species
             from torchani.utils import ChemicalSymbolsToInts
@@ -173,113 +247,133 @@ class TorchANIHarness(ProgramHarness):
                     "TorchANI version lacks ChemicalSymbolsToAtomicNumbers, and model has no .species; "
                     "cannot build species tensor."
                 )
-            return ChemicalSymbolsToInts(model.species)(symbols).to(device).unsqueeze(0)
+            return ChemicalSymbolsToInts(model.species)
+
+        to_species = species_converter(model)
+
+        num_atoms = [len(molecule.symbols) for molecule in molecules]
+        max_atoms = max(num_atoms)
+        species = torch.full((len(molecules), max_atoms), -1, dtype=torch.long)
+        geom_array = np.zeros((len(molecules), max_atoms, 3))
+        for i, molecule in enumerate(molecules):
+            species[i, : num_atoms[i]] = to_species(list(molecule.symbols))
+            geom_array[i, : num_atoms[i]] = molecule.geometry.reshape(-1, 3)
+        geom_array *= ureg.conversion_factor("bohr", "angstrom")
+
+        # Keep gradients enabled for gradient/hessian drivers
+        coordinates = torch.tensor(geom_array, dtype=torch.get_default_dtype(), device=device, requires_grad=True)
+        return species.to(device), coordinates
+
+    def _compute_group(self, inputs: List["AtomicInput"]) -> List["AtomicResult"]:
+        """Runs inputs with the same method as one padded batch."""
+        import torch
+        import torchani
+
+        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
         def get_ensemble_energies(model_result):
             """
-            Return a 1D tensor of ensemble member energies for a single geometry.
+            Return a (n_members, n_molecules) tensor of ensemble member energies.
             Works with:
               - TorchANI result objects: result.energies
               - old style tuples: (species, energies)
               - your current wrapper tuple output
             """
             if hasattr(model_result, "energies"):
-                return model_result.energies
-            if isinstance(model_result, (tuple, list)) and len(model_result) >= 2:
-                return model_result[1]
-            raise TypeError(f"Unrecognized TorchANI model output: {type(model_result)!r}")
+                energies = model_result.energies
+            elif isinstance(model_result, (tuple, list)) and len(model_result) >= 2:
+                energies = model_result[1]
+            else:
+                raise TypeError(f"Unrecognized TorchANI model output: {type(model_result)!r}")
+            return energies.reshape(-1, len(inputs))
 
         # Build model
-        method = input_data.specification.model.method
-        model = self.get_model(method).to(device)
-
-        # Validate and build species tensor
-        symbols = list(input_data.molecule.symbols)
-
-        known_sym = {"H", "C", "N", "O"}
-        if method.lower() == "ani2x":
-            known_sym.update({"S", "F", "Cl"})
-        unknown_sym = set(symbols) - known_sym
-        if unknown_sym:
-            raise InputError(f"TorchANI model '{method}' does not support symbols: {unknown_sym}.")
+        method = inputs[0].specification.model.method
+        model, cache_hit = self._get_model(method)
+        model = model.to(device)
 
-        num_atoms = len(symbols)
-        species = species_tensor_from_symbols(symbols, model, device)
+        num_atoms = [len(input_data.molecule.symbols) for input_data in inputs]
+        species, coordinates = self.batch_tensors(model, [input_data.molecule for input_data in inputs], device)
 
-        # Build coord array -- single geometry, batch dim = 1
-        geom_array = input_data.molecule.geometry.reshape(1, -1, 3) * ureg.conversion_factor("bohr", "angstrom")
-
-        # Keep gradients enabled for gradient/hessian drivers
-        coordinates = torch.tensor(geom_array.tolist(), device=device, requires_grad=True)
-
-        # Run model
+        # Run model, all ensemble members and molecules at once
         result = model((species, coordinates))
         ensemble_energies = get_ensemble_energies(result)
 
-        # Ensure 1D member energies for "no batching" usage.
-        # Some paths might return shape (n_members, 1) or (n_members,) — normalize to (n_members,)
-        if ensemble_energies.ndim == 2 and ensemble_energies.shape[-1] == 1:
-            ensemble_energies = ensemble_energies[:, 0]
-
-        # Scalar energy used for derivatives: mean across ensemble members
-        energy = ensemble_energies.mean()
-
-        ensemble_std = ensemble_energies.std(unbiased=False)
-        ensemble_scaled_std = ensemble_std / np.sqrt(num_atoms)
-
-        ret_data["properties"] = {"return_energy": energy.item()}
-
-        if input_data.specification.driver == "energy":
-            ret_data["return_result"] = ret_data["properties"]["return_energy"]
-        elif input_data.specification.driver == "gradient":
-            derivative = torch.autograd.grad(energy, coordinates, create_graph=False, retain_graph=False)[0].squeeze()
-            ret_data["return_result"] = (
-                np.asarray(derivative.cpu() * ureg.conversion_factor("angstrom", "bohr")).ravel().tolist()
-            )
-        elif input_data.specification.driver == "hessian":
-            # torchani.utils.hessian expects coordinates and energies (scalar or (batch,))
-            hessian = torchani.utils.hessian(coordinates, energies=energy)
-            ret_data["return_result"] = np.asarray(hessian.cpu())
-        else:
-            raise InputError(
-                f"TorchANI can only compute energy, gradient, and hessian driver methods. Found {input_data.specification.driver}."
-            )
-
-        #######################################################################
-        # Description of the quantities stored in `extras`
-        #
-        # ensemble_energies:
-        #   An energy array of all members (models) in an ensemble of models
-        #
-        # ensemble_energy_avg:
-        #   The average value of energy array which is also recorded with as
-        #   `energy` in QCEngine
-        #
-        # ensemble_energy_std:
-        #   The standard deviation of energy array
-        #
-        # ensemble_per_root_atom_disagreement:
-        #   The standard deviation scaled by the square root of N, with N being
-        #   the number of atoms in the molecule. This is the quantity used in
-        #   the query-by-committee (QBC) process in active learning to infer
-        #   the reliability of the models in an ensemble, and produce more data
-        #   points in the regions where this quantity is below a certain
-        #   threshold (inclusion criteria)
-        ret_data["input_data"] = input_data
-        ret_data["molecule"] = input_data.molecule
-        ret_data["extras"] = {
-            # keep 1D array of ensemble member energies (no batching)
-            "ensemble_energies": ensemble_energies.detach().cpu().numpy(),
-            "ensemble_energy_avg": energy.item(),
-            "ensemble_energy_std": ensemble_std.item(),
-            "ensemble_per_root_atom_disagreement": ensemble_scaled_std.item(),
-        }
+        # Scalar energy of each molecule used for derivatives: mean across ensemble members
+        energies = ensemble_energies.mean(dim=0)
 
-        ret_data["provenance"] = Provenance(
-            creator="torchani", version="unknown", routine="torchani.builtin.aev_computer"
+        ensemble_std = ensemble_energies.std(dim=0, unbiased=False)
+        ensemble_scaled_std = ensemble_std / torch.sqrt(
+            torch.tensor(num_atoms, dtype=ensemble_std.dtype, device=device)
         )
 
-        ret_data["schema_name"] = "qcschema_atomic_result"
-        ret_data["success"] = True
-
-        return AtomicResult(**ret_data)
+        drivers = {input_data.specification.driver for input_data in inputs}
+        gradients = hessians = None
+        if "gradient" in drivers:
+            # molecules are independent, so the gradient of the sum is that of each molecule
+            gradients = torch.autograd.grad(
+                energies.sum(), coordinates, create_graph=False, retain_graph="hessian" in drivers
+            )[0]
+            gradients = gradients.detach().cpu().numpy() * ureg.conversion_factor("angstrom", "bohr")
+        if "hessian" in drivers:
+            # torchani.utils.hessian expects coordinates and energies (scalar or (batch,))
+            hessians = torchani.utils.hessian(coordinates, energies=energies).detach().cpu().numpy()
+
+        energies_np = energies.detach().cpu().numpy()
+        ensemble_np = ensemble_energies.detach().cpu().numpy()
+        ensemble_std_np = ensemble_std.detach().cpu().numpy()
+        ensemble_scaled_std_np = ensemble_scaled_std.detach().cpu().numpy()
+
+        provenance = Provenance(creator="torchani", version="unknown", routine="torchani.builtin.aev_computer")
+        model_cache = self._CACHE.annotation(cache_hit)
+
+        results = []
+        for i, input_data in enumerate(inputs):
+            ret_data = {"properties": {"return_energy": float(energies_np[i])}}
+
+            natom = num_atoms[i]
+            if input_data.specification.driver == "energy":
+                ret_data["return_result"] = ret_data["properties"]["return_energy"]
+            elif input_data.specification.driver == "gradient":
+                ret_data["return_result"] = gradients[i, :natom].ravel().tolist()
+            else:
+                ret_data["return_result"] = hessians[i, : 3 * natom, : 3 * natom]
+
+            #######################################################################
+            # Description of the quantities stored in `extras`
+            #
+            # ensemble_energies:
+            #   An energy array of all members (models) in an ensemble of models
+            #
+            # ensemble_energy_avg:
+            #   The average value of energy array which is also recorded with as
+            #   `energy` in QCEngine
+            #
+            # ensemble_energy_std:
+            #   The standard deviation of energy array
+            #
+            # ensemble_per_root_atom_disagreement:
+            #   The standard deviation scaled by the square root of N, with N being
+            #   the number of atoms in the molecule. This is the quantity used in
+            #   the query-by-committee (QBC) process in active learning to infer
+            #   the reliability of the models in an ensemble, and produce more data
+            #   points in the regions where this quantity is below a certain
+            #   threshold (inclusion criteria)
+            ret_data["input_data"] = input_data
+            ret_data["molecule"] = input_data.molecule
+            ret_data["extras"] = {
+                # 1D array of the ensemble member energies of this molecule
+                "ensemble_energies": ensemble_np[:, i].copy(),
+                "ensemble_energy_avg": float(energies_np[i]),
+                "ensemble_energy_std": float(ensemble_std_np[i]),
+                "ensemble_per_root_atom_disagreement": float(ensemble_scaled_std_np[i]),
+                "qcengine_model_cache": model_cache,
+            }
+
+            ret_data["provenance"] = provenance
+            ret_data["schema_name"] = "qcschema_atomic_result"
+            ret_data["success"] = True
+
+            results.append(AtomicResult(**ret_data))
+
+        return results
@@ -44,7 +44,8 @@ class TurbomoleHarness(ProgramHarness):
 
     def get_version(self) -> str:
         which_prog = which("define")
-        if which_prog not in self.version_cache:
+
+        def probe():
             # We use basically a dummy stdin as we dont want to pipe any real
             # input into define. We only want to parse the version number from
             # the string.
@@ -54,9 +55,10 @@ class TurbomoleHarness(ProgramHarness):
             # Tested with V7.3 and V7.4.0
             version_re = re.compile(r"TURBOMOLE (?:rev\. )?(V.+?)\s+")
             mobj = version_re.search(stdout)
-            version = mobj[1]
-            self.version_cache[which_prog] = safe_version(version)
-        return self.version_cache[which_prog]
+            return safe_version(mobj[1])
+
+        # define may be a wrapper that runs the installation in $TURBODIR
+        return self._cached_version(which_prog, probe, {"TURBODIR": os.environ.get("TURBODIR")})
 
     def compute(self, input_model: "AtomicInput", config: "TaskConfig") -> "AtomicResult":
         self.found(raise_error=True)
@@ -0,0 +1,151 @@
+"""
+A bounded cache of loaded models for the harnesses of machine-learned potentials
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+__all__ = ["ModelCache", "model_memory"]
+
+
+def model_memory(model: Any) -> int:
+    """Estimated bytes held by the parameters and buffers of `model`, or of the modules in a tuple or list."""
+    if isinstance(model, (tuple, list)):
+        return sum(model_memory(item) for item in model)
+
+    nbytes = 0
+    for attribute in ["parameters", "buffers"]:
+        tensors = getattr(model, attribute, None)
+        if callable(tensors):
+            nbytes += sum(tensor.numel() * tensor.element_size() for tensor in tensors())
+    return nbytes
+
+
+def _file_stamp(path: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class ModelCache:
+    """LRU cache of loaded models, bounded by count and by the estimated memory of their parameters.
+
+    Models loaded from a file are reloaded once the file is replaced or modified, as seen from its
+    inode, mtime, and size. Hashing the contents would cost as much as loading large models.
+
+    Parameters
+    ----------
+    max_entries
+        Maximum number of models held, and the default that :meth:`resize` restores.
+    max_memory
+        Maximum estimated bytes of parameters held, see :func:`model_memory`, 4 GiB by default. If ``None``,
+        only the count is bounded. The most recently loaded model is kept even if it alone is larger.
+    """
+
+    def __init__(self, max_entries: int = 8, max_memory: Optional[int] = 4 * 1024**3):
+        self.default_entries = max_entries
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # key -> (model, file stamp, estimated bytes)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[Tuple[int, int, int]], int]]" = OrderedDict()
+        self._memory = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        path: Optional[str] = None,
+        memory: Callable[[Any], int] = model_memory,
+    ) -> Tuple[Any, bool]:
+        """The model for `key` and whether it was cached, calling `loader` on a miss.
+
+        Parameters
+        ----------
+        key
+            Identifies the model, e.g., its name and dtype.
+        loader
+            Loads the model, called without the lock held.
+        path
+            File that the model is loaded from, if any, to reload it when the file changes.
+        memory
+            Estimates the bytes held by a loaded model, :func:`model_memory` by default.
+        """
+        stamp = _file_stamp(path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], True
+            if entry is not None:
+                self._drop(key)
+            self.misses += 1
+
+        model = loader()
+        nbytes = memory(model)
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (model, stamp, nbytes)
+            self._memory += nbytes
+            self._evict()
+        return model, False
+
+    def _drop(self, key: Hashable) -> None:
+        _, _, nbytes = self._entries.pop(key)
+        self._memory -= nbytes
+
+    def _evict(self) -> None:
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or (self.max_memory is not None and self._memory > self.max_memory)
+        ):
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def resize(self, max_entries: Optional[int]) -> None:
+        """Sets `max_entries`, evicting models beyond it. ``None`` restores the size the cache was built with.
+
+        The cache is shared by all computations of a harness, so each sets the size it asks for.
+        """
+        if max_entries is None:
+            max_entries = self.default_entries
+        with self._lock:
+            self.max_entries = max_entries
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._memory = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "memory": self._memory,
+            }
+
+    def annotation(self, hit: bool) -> Dict[str, Any]:
+        """The ``qcengine_model_cache`` entry of result extras for a computation that found its model as `hit`."""
+        with self._lock:
+            return {"hit": hit, "hits": self.hits, "misses": self.misses}
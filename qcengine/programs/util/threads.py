@@ -0,0 +1,54 @@
+"""
+Scoping of the thread pools of in-process libraries to a task's cores
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+__all__ = ["torch_threads"]
+
+_lock = threading.Lock()
+
+# whether the inter-op pool was sized, which PyTorch allows once per process
+_interop_set = False
+
+
+def _set_intraop(torch, nthreads: int) -> None:
+    if torch.get_num_threads() != nthreads:
+        torch.set_num_threads(nthreads)
+
+
+def _set_interop_once(torch, nthreads: int) -> None:
+    global _interop_set
+    with _lock:
+        if _interop_set:
+            return
+        _interop_set = True
+        try:
+            torch.set_num_interop_threads(nthreads)
+        except RuntimeError:
+            # the pool has already started or been sized by the caller
+            pass
+
+
+@contextmanager
+def torch_threads(ncores: int) -> Iterator[None]:
+    """Runs PyTorch on `ncores` threads within the context, restoring the previous count afterwards.
+
+    PyTorch sizes its intra-op pool to the whole machine, so concurrent jobs would oversubscribe the node.
+    The intra-op thread count is held per calling thread, so it is set and restored in this thread only
+    and concurrent tasks in other threads keep their own. The inter-op pool can only be sized once per
+    process, so it is set to the `ncores` of the first task and never restored.
+    """
+    import torch
+
+    ncores = max(1, int(ncores))
+    _set_interop_once(torch, ncores)
+
+    previous = torch.get_num_threads()
+    _set_intraop(torch, ncores)
+    try:
+        yield
+    finally:
+        _set_intraop(torch, previous)
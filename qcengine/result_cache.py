@@ -0,0 +1,284 @@
+"""
+An opt-in cache of successful atomic results, keyed on the canonical content of the input
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+from .config import LOGGER
+
+if TYPE_CHECKING:
+    from qcelemental.models.v2 import AtomicInput, AtomicResult, FailedOperation
+
+    from .config import TaskConfig
+    from .programs.model import ProgramHarness
+
+__all__ = ["ResultCache", "enable_result_cache", "disable_result_cache", "get_result_cache"]
+
+_result_cache = None
+
+
+class ResultCache:
+    """Two-tier cache of successful ``AtomicResult`` objects.
+
+    Results are keyed on a hash of the validated QCSchema v2 ``AtomicInput`` (with the molecule
+    represented by ``Molecule.get_hash()``) together with the program name and version. The memory
+    tier is an LRU bounded by ``max_entries``. The optional disk tier is an SQLite database that is
+    safe to share between processes and is bounded by ``max_disk_size``. Entries older than
+    ``max_age`` are never served from either tier.
+
+    Parameters
+    ----------
+    path
+        File for the SQLite disk tier. If ``None``, only the memory tier is used.
+    max_entries
+        Maximum number of results held in memory.
+    max_disk_size
+        Maximum size in bytes of the serialized results on disk. Least recently used results are evicted first.
+    max_age
+        Maximum age in seconds of a served result. If ``None``, results do not expire.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        *,
+        max_entries: int = 1024,
+        max_disk_size: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ):
+        self.path = None if path is None else Path(path).expanduser()
+        self.max_entries = max_entries
+        self.max_disk_size = max_disk_size
+        self.max_age = max_age
+
+        self.hits = 0
+        self.misses = 0
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS results "
+                    "(key TEXT PRIMARY KEY, created REAL, accessed REAL, size INTEGER, data TEXT)"
+                )
+
+    @contextmanager
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _expired(self, created: float) -> bool:
+        return (self.max_age is not None) and (time.time() - created > self.max_age)
+
+    @staticmethod
+    def key(input_data: "AtomicInput", program: str, version: str) -> str:
+        """Canonical hash of a validated QCSchema v2 ``AtomicInput`` run by ``program`` at ``version``."""
+        payload = {
+            "molecule": input_data.molecule.get_hash(),
+            "specification": input_data.specification.model_dump(mode="json"),
+            "program": program.lower(),
+            "version": version,
+        }
+        blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def get(self, key: str) -> Tuple[Optional["AtomicResult"], Optional[str]]:
+        """Returns the result for `key` and the tier (``"memory"`` or ``"disk"``) it was found in."""
+        from qcelemental.models.v2 import AtomicResult
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created, result = entry
+                if self._expired(created):
+                    del self._memory[key]
+                else:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return result, "memory"
+
+        if self.path is not None:
+            with self._connect() as conn:
+                row = conn.execute("SELECT created, data FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    created, data = row
+                    if self._expired(created):
+                        conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                    else:
+                        conn.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+                        result = AtomicResult.model_validate_json(data)
+                        self._put_memory(key, created, result)
+                        with self._lock:
+                            self.hits += 1
+                        return result, "disk"
+
+        with self._lock:
+            self.misses += 1
+        return None, None
+
+    def _put_memory(self, key: str, created: float, result: "AtomicResult") -> None:
+        with self._lock:
+            self._memory[key] = (created, result)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def put(self, key: str, result: "AtomicResult") -> None:
+        """Stores a successful `result` under `key` in all tiers."""
+        now = time.time()
+        self._put_memory(key, now, result)
+
+        if self.path is not None:
+            data = result.model_dump_json()
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, created, accessed, size, data) VALUES (?, ?, ?, ?, ?)",
+                    (key, now, now, len(data), data),
+                )
+                self._evict_disk(conn)
+
+    def _evict_disk(self, conn: sqlite3.Connection) -> None:
+        if self.max_age is not None:
+            conn.execute("DELETE FROM results WHERE created < ?", (time.time() - self.max_age,))
+
+        if self.max_disk_size is not None:
+            (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()
+            if total > self.max_disk_size:
+                for key, size in conn.execute("SELECT key, size FROM results ORDER BY accessed ASC").fetchall():
+                    conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                    total -= size
+                    if total <= self.max_disk_size:
+                        break
+
+    def clear(self) -> None:
+        """Removes all results from all tiers and resets the counters."""
+        with self._lock:
+            self._memory.clear()
+            self.hits = 0
+            self.misses = 0
+
+        if self.path is not None:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM results")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "memory_entries": len(self._memory)}
+
+    def wrap(self, harness: "ProgramHarness") -> Union["ProgramHarness", "_CachedHarness"]:
+        """Returns `harness` fronted by this cache if it computes ``AtomicInput``, else `harness` unchanged."""
+        from .programs.model import ProgramHarness
+
+        if isinstance(harness, ProgramHarness):
+            return _CachedHarness(harness, self)
+        return harness
+
+
+class _CachedHarness:
+    """Stand-in for a ProgramHarness within `compute` that consults a ResultCache first."""
+
+    def __init__(self, harness: "ProgramHarness", cache: ResultCache):
+        self.harness = harness
+        self.cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.harness, name)
+
+    def _key(self, input_data: "AtomicInput") -> Optional[str]:
+        try:
+            version = self.harness.get_version()
+        except Exception as exc:
+            LOGGER.info(f"Result cache skipped, no version for {self.harness.name}: {exc}")
+            return None
+        if not version:
+            return None
+        return self.cache.key(input_data, self.harness.name, version)
+
+    def _annotate(self, result: "AtomicResult", input_data: "AtomicInput", tier: Optional[str]) -> "AtomicResult":
+        stats = self.cache.stats()
+        extras = {
+            **result.extras,
+            "qcengine_result_cache": {
+                "hit": tier is not None,
+                "tier": tier,
+                "hits": stats["hits"],
+                "misses": stats["misses"],
+            },
+        }
+        return result.model_copy(update={"input_data": input_data, "extras": extras})
+
+    def _store(self, key: Optional[str], result: Union["AtomicResult", "FailedOperation"]) -> None:
+        if key is not None and getattr(result, "success", False) and result.schema_name == "qcschema_atomic_result":
+            self.cache.put(key, result)
+
+    def compute(self, input_data: "AtomicInput", config: "TaskConfig") -> Union["AtomicResult", "FailedOperation"]:
+        key = self._key(input_data)
+        if key is not None:
+            cached, tier = self.cache.get(key)
+            if cached is not None:
+                return self._annotate(cached, input_data, tier)
+
+        result = self.harness.compute(input_data, config)
+        self._store(key, result)
+        return self._annotate(result, input_data, None) if key is not None and result.success else result
+
+    async def compute_async(
+        self, input_data: "AtomicInput", config: "TaskConfig"
+    ) -> Union["AtomicResult", "FailedOperation"]:
+        key = self._key(input_data)
+        if key is not None:
+            cached, tier = self.cache.get(key)
+            if cached is not None:
+                return self._annotate(cached, input_data, tier)
+
+        result = await self.harness.compute_async(input_data, config)
+        self._store(key, result)
+        return self._annotate(result, input_data, None) if key is not None and result.success else result
+
+
+def enable_result_cache(
+    path: Optional[Union[str, Path]] = None,
+    *,
+    max_entries: int = 1024,
+    max_disk_size: Optional[int] = None,
+    max_age: Optional[float] = None,
+) -> ResultCache:
+    """Turns on result caching for all subsequent atomic computations in this process.
+
+    Parameters are as for :class:`ResultCache`. Hit and miss counts are reported in
+    ``AtomicResult.extras["qcengine_result_cache"]``.
+
+    Returns
+    -------
+    ResultCache
+        The active cache.
+    """
+    global _result_cache
+    _result_cache = ResultCache(path, max_entries=max_entries, max_disk_size=max_disk_size, max_age=max_age)
+    return _result_cache
+
+
+def disable_result_cache() -> None:
+    """Turns off result caching. A disk tier is left in place for later use."""
+    global _result_cache
+    _result_cache = None
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Returns the active ResultCache or ``None`` if caching is off."""
+    return _result_cache
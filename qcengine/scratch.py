@@ -0,0 +1,268 @@
+"""
+Reusable scratch directories that are emptied in the background, with RAM-backed scratch for small jobs
+"""
+
+import atexit
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from .config import LOGGER
+
+if TYPE_CHECKING:
+    from .config import TaskConfig
+
+__all__ = [
+    "ScratchPool",
+    "ScratchManager",
+    "scratch_context",
+    "get_scratch_manager",
+    "directory_usage",
+    "scratch_annotation",
+]
+
+# The manager for the task running in this context, see `scratch_context`
+_active_manager: ContextVar[Optional["ScratchManager"]] = ContextVar("qcengine_scratch_manager", default=None)
+
+# The scratch directories measured for the task running in this context
+_task_jobs: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar("qcengine_scratch_jobs", default=None)
+
+# Managers are shared by all tasks in the process with the same settings
+_managers: Dict[Tuple[int, Optional[str], float], "ScratchManager"] = {}
+_managers_lock = threading.Lock()
+
+
+def directory_usage(path: os.PathLike) -> int:
+    """Total size in bytes of the files under `path`."""
+    total = 0
+    for entry in os.scandir(path):
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                total += directory_usage(entry.path)
+            else:
+                total += entry.stat(follow_symlinks=False).st_size
+        except FileNotFoundError:
+            pass
+    return total
+
+
+def _empty_directory(path: Path) -> None:
+    for entry in os.scandir(path):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+
+class ScratchPool:
+    """Scratch directories under one parent that are emptied in a background thread and reused.
+
+    Parameters
+    ----------
+    parent
+        Directory in which to create scratch directories. If ``None``, the TMP default.
+    size
+        Number of empty directories to keep ready. They are created up front, in the background.
+    """
+
+    def __init__(self, parent: Optional[str] = None, size: int = 4):
+        self.parent = Path(tempfile.gettempdir() if parent is None else parent)
+        self.size = size
+
+        self._free: List[Path] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._dirty = queue.Queue()
+
+        self._cleaner = threading.Thread(target=self._clean, name=f"qcengine-scratch-{self.parent}", daemon=True)
+        self._cleaner.start()
+        atexit.register(self.close)
+
+    def _mkdtemp(self) -> Path:
+        return Path(tempfile.mkdtemp(dir=self.parent, prefix="qcng_"))
+
+    def _clean(self) -> None:
+        try:
+            for _ in range(self.size):
+                self._return(self._mkdtemp())
+        except OSError as exc:
+            # acquire will raise the error in the job's own thread
+            LOGGER.info(f"Could not create scratch directories in {self.parent}: {exc}")
+
+        while True:
+            path = self._dirty.get()
+            if path is None:
+                break
+
+            try:
+                _empty_directory(path)
+            except OSError as exc:
+                LOGGER.info(f"... Removing {path}, could not empty it for reuse: {exc}")
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                self._return(path)
+
+    def _return(self, path: Path) -> None:
+        with self._lock:
+            if not self._closed and len(self._free) < self.size:
+                self._free.append(path)
+                return
+        shutil.rmtree(path, ignore_errors=True)
+
+    def acquire(self) -> Path:
+        """An empty scratch directory, from the pool if one is ready."""
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+        return self._mkdtemp()
+
+    def release(self, path: Path) -> None:
+        """Hands `path` back to be emptied in the background and then reused or removed."""
+        with self._lock:
+            closed = self._closed
+        if closed:
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            self._dirty.put(path)
+
+    def close(self) -> None:
+        """Finishes pending cleanup and removes the idle directories."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            free, self._free = self._free, []
+
+        self._dirty.put(None)
+        self._cleaner.join()
+        for path in free:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+class ScratchManager:
+    """Chooses a ScratchPool for each job and records how much scratch each program uses.
+
+    Jobs run on the RAM-backed `tmpfs` once their program's largest recorded scratch usage is known
+    to be below `tmpfs_max`, and while the tmpfs has that much space free. All other jobs run under
+    the requested parent directory.
+
+    Parameters
+    ----------
+    size
+        Number of empty directories each pool keeps ready.
+    tmpfs
+        RAM-backed directory for the scratch of small jobs, ``"auto"`` for ``/dev/shm`` if writable,
+        or ``None`` to not use one.
+    tmpfs_max
+        Largest scratch usage in GiB for a program's jobs to run on the `tmpfs`.
+    """
+
+    def __init__(self, size: int = 4, tmpfs: Optional[str] = None, tmpfs_max: float = 0.25):
+        if tmpfs == "auto":
+            tmpfs = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+        self.size = size
+        self.tmpfs = tmpfs
+        self.tmpfs_max = int(tmpfs_max * 1024**3)
+        self.usage: Dict[str, int] = {}
+
+        self._pools: Dict[Optional[str], ScratchPool] = {}
+        self._lock = threading.Lock()
+
+    def _pool(self, parent: Optional[str]) -> ScratchPool:
+        with self._lock:
+            if parent not in self._pools:
+                self._pools[parent] = ScratchPool(parent, self.size)
+            return self._pools[parent]
+
+    def _fits_tmpfs(self, program: Optional[str]) -> bool:
+        if self.tmpfs is None or program is None:
+            return False
+        with self._lock:
+            usage = self.usage.get(program)
+        if usage is None or usage > self.tmpfs_max:
+            return False
+        return shutil.disk_usage(self.tmpfs).free > self.tmpfs_max
+
+    @contextmanager
+    def directory(
+        self, parent: Optional[str] = None, *, program: Optional[str] = None, messy: bool = False
+    ) -> Iterator[Path]:
+        """Scratch directory for one job of `program`, as :func:`~qcengine.util.temporary_directory`."""
+        pool = self._pool(self.tmpfs if self._fits_tmpfs(program) else parent)
+        path = pool.acquire()
+        try:
+            yield path
+        finally:
+            if not messy:
+                pool.release(path)
+                LOGGER.info(f"... Releasing {path}")
+
+    def record(self, program: Optional[str], nbytes: int) -> None:
+        """Notes that a job of `program` used `nbytes` of scratch."""
+        if program is None:
+            return
+        with self._lock:
+            self.usage[program] = max(nbytes, self.usage.get(program, 0))
+
+    def measure(self, program: Optional[str], path: os.PathLike) -> int:
+        """Records the bytes left in the scratch directory `path` of a job of `program` and returns them.
+
+        The usage, and whether the directory was on the `tmpfs`, are also noted for the running task's
+        :func:`scratch_annotation`.
+        """
+        nbytes = directory_usage(path)
+        self.record(program, nbytes)
+
+        jobs = _task_jobs.get()
+        if jobs is not None:
+            tmpfs = self.tmpfs is not None and Path(path).parent == Path(self.tmpfs)
+            jobs.append({"program": program, "usage": nbytes, "tmpfs": tmpfs})
+        return nbytes
+
+
+def get_scratch_manager(config: "TaskConfig") -> Optional[ScratchManager]:
+    """The process-wide ScratchManager for the scratch settings of `config`, if any are enabled."""
+    if not config.scratch_pool and config.scratch_tmpfs is None:
+        return None
+
+    key = (config.scratch_pool, config.scratch_tmpfs, config.scratch_tmpfs_max)
+    with _managers_lock:
+        if key not in _managers:
+            _managers[key] = ScratchManager(config.scratch_pool, config.scratch_tmpfs, config.scratch_tmpfs_max)
+        return _managers[key]
+
+
+@contextmanager
+def scratch_context(config: Optional["TaskConfig"]) -> Iterator[Optional[ScratchManager]]:
+    """Makes the ScratchManager for `config` serve :func:`~qcengine.util.execute` within the context."""
+    manager = None if config is None else get_scratch_manager(config)
+    token = _active_manager.set(manager)
+    jobs_token = _task_jobs.set(None if manager is None else [])
+    try:
+        yield manager
+    finally:
+        _task_jobs.reset(jobs_token)
+        _active_manager.reset(token)
+
+
+def active_scratch_manager() -> Optional[ScratchManager]:
+    return _active_manager.get()
+
+
+def scratch_annotation() -> Optional[Dict[str, Any]]:
+    """The ``qcengine_scratch`` entry of result extras for the task running in this context.
+
+    Lists each scratch directory the task's processes ran in with its program, the bytes left in it, and
+    whether it was on the tmpfs, and the total of the bytes. ``None`` if no directory was measured.
+    """
+    jobs = _task_jobs.get()
+    if not jobs:
+        return None
+    return {"usage": sum(job["usage"] for job in jobs), "jobs": [dict(job) for job in jobs]}
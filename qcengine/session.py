@@ -0,0 +1,199 @@
+"""
+Warm sessions that keep a harness and its resident state between computations with one specification
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Union
+
+from .compute import compute, compute_async
+from .programs import get_program
+
+if TYPE_CHECKING:
+    from pydantic.main import BaseModel
+    from qcelemental.models.v2 import AtomicInput, AtomicResult, AtomicSpecification, FailedOperation, Molecule
+
+    from .programs.model import ProgramHarness
+
+__all__ = ["Session", "open_session", "active_session"]
+
+# The session whose computation is running in this context, see `Session.compute`
+_active_session: ContextVar[Optional["Session"]] = ContextVar("qcengine_session", default=None)
+
+
+class Session:
+    """A program harness held open for many computations with one model, keywords, and task configuration.
+
+    The harness is looked up and its ``open_session`` hook run once, so harnesses can load what they
+    need (models, force fields, contexts) up front. What the hook and the computations load is pinned
+    in :attr:`state` until the session closes, so it is not evicted from the harness's cache between
+    computations. Use :func:`open_session` to create one, preferably as a context manager so that
+    :meth:`close` releases the state.
+
+    Parameters
+    ----------
+    program
+        The program to run, e.g., ``"rdkit"`` or ``"torchani"``.
+    specification
+        The ``AtomicSpecification``, as a model or a dictionary, shared by all computations.
+    task_config
+        A dictionary of local configuration options corresponding to a TaskConfig object.
+    raise_error
+        As for :func:`~qcengine.compute`.
+    return_dict
+        As for :func:`~qcengine.compute`.
+    """
+
+    def __init__(
+        self,
+        program: str,
+        specification: Union[Dict[str, Any], "AtomicSpecification"],
+        task_config: Optional[Dict[str, Any]] = None,
+        *,
+        raise_error: bool = False,
+        return_dict: bool = False,
+    ):
+        from qcelemental.models.v2 import AtomicSpecification
+
+        if not isinstance(specification, AtomicSpecification):
+            specification = AtomicSpecification(**{"program": program, **specification})
+
+        self.program = program
+        self.specification = specification
+        self.task_config = task_config
+        self.raise_error = raise_error
+        self.return_dict = return_dict
+
+        # Whatever the harness keeps resident for this session
+        self.state: Dict[str, Any] = {}
+        self.ncomputes = 0
+
+        self._specifications = {specification.driver.value: specification}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.harness: "ProgramHarness" = get_program(program)
+        with self._activate():
+            self.harness.open_session(self)
+
+    def __enter__(self) -> "Session":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _input(self, molecule: Union[Dict[str, Any], "Molecule"], driver: Optional[str]) -> "AtomicInput":
+        from qcelemental.models.v2 import AtomicInput
+
+        if self._closed:
+            raise RuntimeError(f"The {self.program} session is closed.")
+
+        driver = self.specification.driver.value if driver is None else getattr(driver, "value", driver)
+        with self._lock:
+            if driver not in self._specifications:
+                self._specifications[driver] = type(self.specification).model_validate(
+                    {**self.specification.model_dump(), "driver": driver}
+                )
+            specification = self._specifications[driver]
+
+        # validated models are taken as they are, so this only costs validation for dictionaries
+        return AtomicInput(molecule=molecule, specification=specification)
+
+    @contextmanager
+    def _activate(self) -> Iterator[None]:
+        token = _active_session.set(self)
+        try:
+            yield
+        finally:
+            _active_session.reset(token)
+
+    def compute(
+        self, molecule: Union[Dict[str, Any], "Molecule"], driver: Optional[str] = None
+    ) -> Union["AtomicResult", "FailedOperation", Dict[str, Any]]:
+        """Runs the session's specification on `molecule`, with the session's driver unless `driver` is given."""
+        input_data = self._input(molecule, driver)
+        with self._activate():
+            ret = compute(
+                input_data,
+                self.program,
+                raise_error=self.raise_error,
+                task_config=self.task_config,
+                return_dict=self.return_dict,
+            )
+        with self._lock:
+            self.ncomputes += 1
+        return ret
+
+    async def compute_async(
+        self, molecule: Union[Dict[str, Any], "Molecule"], driver: Optional[str] = None
+    ) -> Union["AtomicResult", "FailedOperation", Dict[str, Any]]:
+        """Awaitable form of :meth:`compute`."""
+        input_data = self._input(molecule, driver)
+        with self._activate():
+            ret = await compute_async(
+                input_data,
+                self.program,
+                raise_error=self.raise_error,
+                task_config=self.task_config,
+                return_dict=self.return_dict,
+            )
+        with self._lock:
+            self.ncomputes += 1
+        return ret
+
+    def close(self) -> None:
+        """Runs the harness's ``close_session`` hook and drops the session's state."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.harness.close_session(self)
+        finally:
+            self.state.clear()
+
+
+def open_session(
+    program: str,
+    model: Union[Dict[str, Any], "BaseModel"],
+    task_config: Optional[Dict[str, Any]] = None,
+    *,
+    driver: str = "energy",
+    keywords: Optional[Dict[str, Any]] = None,
+    protocols: Optional[Dict[str, Any]] = None,
+    extras: Optional[Dict[str, Any]] = None,
+    raise_error: bool = False,
+    return_dict: bool = False,
+) -> Session:
+    """Opens a :class:`Session` that keeps `program` warm for repeated computations with `model`.
+
+    .. code-block:: python
+
+        with qcng.open_session("rdkit", {"method": "uff"}, driver="gradient") as session:
+            for molecule in trajectory:
+                result = session.compute(molecule)
+
+    Parameters
+    ----------
+    program
+        The program to run.
+    model
+        The method and basis, as a ``Model`` or a dictionary.
+    task_config
+        A dictionary of local configuration options corresponding to a TaskConfig object.
+    driver
+        The default driver of :meth:`Session.compute`.
+    keywords, protocols, extras
+        The remaining fields of the ``AtomicSpecification``.
+    raise_error, return_dict
+        As for :func:`~qcengine.compute`.
+    """
+    specification = {"model": model, "driver": driver, "keywords": keywords or {}, "extras": extras or {}}
+    if protocols is not None:
+        specification["protocols"] = protocols
+    return Session(program, specification, task_config, raise_error=raise_error, return_dict=return_dict)
+
+
+def active_session() -> Optional[Session]:
+    """The session whose computation is running in this context, if any."""
+    return _active_session.get()
@@ -4,6 +4,7 @@ Tests the QCEngine compute module configuration
 
 import copy
 import os
+import time
 
 import pydantic
 import pytest
@@ -240,6 +241,104 @@ def test_config_validation(opt_state_basic):
     with pytest.raises(pydantic.ValidationError):
         config = qcng.config.get_config(hostname="something", task_config={"bad": 10})
 
+    with pytest.raises(pydantic.ValidationError):
+        qcng.config.get_config(hostname="something", task_config={"model_cache_size": 0})
+
+
+def test_config_cache(opt_state_basic):
+    config = qcng.config.get_config(hostname="something", task_config={"ncores": 2})
+    again = qcng.config.get_config(hostname="something", task_config={"ncores": 2})
+    assert again == config
+    assert again is not config
+
+    # Callers may modify their copy
+    again.ncores = 1
+    assert qcng.config.get_config(hostname="something", task_config={"ncores": 2}).ncores == 2
+
+    with environ_context(env={"QCENGINE_RETRIES": "2"}):
+        assert qcng.config.get_config(hostname="something", task_config={"ncores": 2}).retries == 2
+    assert qcng.config.get_config(hostname="something", task_config={"ncores": 2}).retries == 0
+
+    qcng.config.NODE_DESCRIPTORS["default"] = NodeDescriptor(name="default", hostname_pattern="*", ncores=3)
+    assert qcng.config.get_node_descriptor("something").ncores == 3
+    assert qcng.config.get_config(hostname="something").ncores == 3
+
+    # Changes in place are picked up too
+    qcng.config.NODE_DESCRIPTORS["default"].memory_safety_factor = 0
+    qcng.config.NODE_DESCRIPTORS["default"].memory = 7
+    assert qcng.config.get_config(hostname="something").memory == 7
+
+    qcng.config.NODE_DESCRIPTORS["default"].hostname_pattern = "other*"
+    assert qcng.config.get_node_descriptor("something") is not qcng.config.NODE_DESCRIPTORS["default"]
+    assert qcng.config.get_node_descriptor("otherthing") is qcng.config.NODE_DESCRIPTORS["default"]
+
+
+def test_config_cache_speed():
+    qcng.config.get_config()
+    qcng.config.clear_config_cache()
+
+    start = time.perf_counter()
+    qcng.config.get_config()
+    cold = time.perf_counter() - start
+
+    nrepeats = 100
+    start = time.perf_counter()
+    for _ in range(nrepeats):
+        qcng.config.get_config()
+    warm = (time.perf_counter() - start) / nrepeats
+
+    assert warm < cold
+
+
+@pytest.fixture(scope="function")
+def fresh_globals(monkeypatch, tmp_path):
+    import cpuinfo
+
+    calls = []
+
+    def get_cpu_info():
+        calls.append(1)
+        return {"brand_raw": "Test CPU", "flags": ["fpu"]}
+
+    monkeypatch.setenv("QCNG_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(cpuinfo, "get_cpu_info", get_cpu_info)
+    monkeypatch.setattr(qcng.config, "_global_values", None)
+    monkeypatch.setattr(qcng.config, "_cpu_values", {})
+    yield calls
+
+
+def test_global_cpu_lazy(fresh_globals):
+    qcng.config.get_config()
+    assert qcng.config.get_global("ncores") >= 1
+    assert fresh_globals == []
+
+    assert qcng.config.get_global("cpuinfo")["brand_raw"] == "Test CPU"
+    assert isinstance(qcng.config.get_global("cpu_brand"), str)
+    assert set(qcng.config._CPU_GLOBALS) <= qcng.config.get_global().keys()
+    assert len(fresh_globals) == 1
+
+
+def test_global_no_key_eager(fresh_globals):
+    # all globals include cpuinfo, so it is collected even when only other keys are used
+    assert qcng.config.get_global()["ncores"] >= 1
+    assert len(fresh_globals) == 1
+
+
+def test_global_cpu_disk_cache(fresh_globals, tmp_path, monkeypatch):
+    qcng.config.get_global("cpuinfo")
+    assert (tmp_path / "qcengine_cpuinfo.json").exists()
+
+    # A new process on the same boot reads the cache
+    monkeypatch.setattr(qcng.config, "_cpu_values", {})
+    assert qcng.config.get_global("cpuinfo")["flags"] == ["fpu"]
+    assert len(fresh_globals) == 1
+
+    # A reboot does not
+    monkeypatch.setattr(qcng.config, "_cpu_values", {})
+    monkeypatch.setattr(qcng.config, "_boot_id", lambda: "another-boot")
+    qcng.config.get_global("cpuinfo")
+    assert len(fresh_globals) == 2
+
 
 def test_global_repr():
     assert isinstance(qcng.config.global_repr(), str)
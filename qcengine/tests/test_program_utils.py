@@ -2,10 +2,14 @@
 Tests the DQM compute dispatch module
 """
 
+import subprocess
+import sys
+
 import pytest
 
 import qcengine as qcng
-from qcengine.testing import using
+from qcengine.discovery import load_version, store_version
+from qcengine.testing import failure_engine, schema_versions, using
 
 
 def test_list_programs():
@@ -14,6 +18,44 @@ def test_list_programs():
     assert r >= {"psi4", "rdkit", "molpro", "dftd3"}
 
 
+def test_program_names():
+    for name in qcng.list_all_programs():
+        assert qcng.get_program(name, check=False).name.lower() == name
+
+    for name in qcng.list_all_procedures():
+        qcng.procedures.base._load_procedure(name)
+        assert qcng.procedures.base.procedures[name].name.lower() == name
+
+
+def test_register_program_lazy_name(monkeypatch):
+    from qcengine.programs.xtb import XTBHarness
+
+    # Names are taken before their harness is imported
+    monkeypatch.delitem(qcng.programs.base.programs, "xtb", raising=False)
+    monkeypatch.setitem(qcng.programs.base._lazy_programs, "xtb", ".xtb:XTBHarness")
+
+    with pytest.raises(ValueError) as exc:
+        qcng.register_program(XTBHarness())
+
+    assert "already a registered program" in str(exc.value)
+
+
+def test_import_time():
+    # Harnesses are imported on first use, so importing QCEngine only pays for its dependencies
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import qcengine"], capture_output=True, text=True, check=True
+    ).stderr
+    modules = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "cumulative" not in line:
+            _, cumulative, name = line.split("|")
+            modules[name.strip()] = int(cumulative)
+
+    assert not {"qcengine.programs.psi4", "qcengine.programs.nwchem", "qcengine.mdi_server"} & modules.keys()
+    assert not any(name.startswith("qcengine.procedures.geometric") for name in modules)
+    assert modules["qcengine"] < 3e6  # microseconds
+
+
 @pytest.mark.parametrize(
     "program",
     [
@@ -27,6 +69,127 @@ def test_check_program_avail(program):
     assert program in qcng.list_available_programs()
 
 
+@pytest.fixture(scope="function")
+def probed_engine(failure_engine, monkeypatch):
+    calls = []
+    state = {"found": True}
+
+    def found(raise_error=False):
+        calls.append(raise_error)
+        if not state["found"] and raise_error:
+            raise ModuleNotFoundError("Probe engine is not installed")
+        return state["found"]
+
+    monkeypatch.setattr(type(failure_engine), "found", staticmethod(found))
+    qcng.discovery.clear_discovery_cache()
+    yield failure_engine.name, calls, state
+    qcng.discovery.set_discovery_ttl(found=600, missing=5)
+
+
+def test_discovery_cache(probed_engine):
+    name, calls, state = probed_engine
+
+    for _ in range(5):
+        qcng.get_program(name)
+    assert name in qcng.list_available_programs()
+    assert len(calls) == 1
+
+    # A program that goes missing is only noticed once the cache is cleared or expires
+    state["found"] = False
+    qcng.get_program(name)
+    qcng.discovery.clear_discovery_cache()
+    for _ in range(3):
+        with pytest.raises(qcng.exceptions.ResourceError) as exc:
+            qcng.get_program(name)
+        assert "cannot be found" in str(exc.value)
+    assert name not in qcng.list_available_programs()
+    assert len(calls) == 2
+
+
+def test_discovery_ttl(probed_engine):
+    name, calls, state = probed_engine
+    state["found"] = False
+    qcng.discovery.set_discovery_ttl(missing=0)
+
+    # Failures are retried once their TTL is up
+    assert qcng.discovery.found(qcng.get_program(name, check=False)) is False
+    state["found"] = True
+    assert qcng.discovery.found(qcng.get_program(name, check=False)) is True
+    assert len(calls) == 2
+
+
+def test_version_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("QCNG_CACHE_DIR", str(tmp_path / "cache"))
+    program = tmp_path / "rungms"
+    program.write_text("#!/bin/sh\n")
+
+    assert load_version(str(program)) is None
+    store_version(str(program), "2023.1")
+    assert load_version(str(program)) == "2023.1"
+    assert load_version(str(program), {"QC": "/opt/qchem"}) is None
+    assert load_version(None) is None
+
+    # A rebuilt program is probed again
+    program.write_text("#!/bin/sh\n# rebuilt\n")
+    assert load_version(str(program)) is None
+
+    # A link on PATH is keyed on the file it resolves to, so repointing it probes again
+    store_version(str(program), "2023.1")
+    link = tmp_path / "bin" / "rungms"
+    link.parent.mkdir()
+    link.symlink_to(program)
+    store_version(str(link), "2023.1")
+    assert load_version(str(link)) == "2023.1"
+
+    other = tmp_path / "rungms-2024"
+    other.write_text("#!/bin/sh\n")
+    link.unlink()
+    link.symlink_to(other)
+    assert load_version(str(link)) is None
+    assert load_version(str(program)) == "2023.1"
+
+    monkeypatch.setenv("QCNG_CACHE_DIR", "")
+    store_version(str(program), "2024.1")
+    assert load_version(str(program)) is None
+
+
+def test_version_cache_harness(tmp_path, monkeypatch):
+    from qcengine.programs.gamess import runner
+
+    monkeypatch.setenv("QCNG_CACHE_DIR", str(tmp_path / "cache"))
+    program = tmp_path / "rungms"
+    program.write_text("#!/bin/sh\n")
+
+    calls = []
+
+    def execute(command, infiles, **kwargs):
+        calls.append(command)
+        return True, {"stdout": " *         GAMESS VERSION = 30 JUN 2023 (R2)          *"}
+
+    monkeypatch.setattr(runner, "which", lambda name: str(program))
+    monkeypatch.setattr(runner, "execute", execute)
+    monkeypatch.setattr(runner.GAMESSHarness, "found", staticmethod(lambda raise_error=False: True))
+
+    version = runner.GAMESSHarness().get_version()
+
+    # As in a new worker process
+    harness = runner.GAMESSHarness()
+    harness.version_cache.clear()
+    assert harness.get_version() == version
+    assert len(calls) == 1
+
+    # Neither a failed probe nor an unknown version is cached
+    def failed():
+        raise qcng.exceptions.UnknownError("rungms failed")
+
+    installation = {"GMSPATH": "/elsewhere"}
+    harness.version_cache.clear()
+    with pytest.raises(qcng.exceptions.UnknownError):
+        harness._cached_version(str(program), failed, installation)
+    assert harness._cached_version(str(program), lambda: None, installation) is None
+    assert load_version(str(program), installation) is None
+
+
 def test_program_avail_bounce():
 
     with pytest.raises(qcng.exceptions.InputError) as exc:
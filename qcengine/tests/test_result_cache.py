@@ -0,0 +1,136 @@
+"""
+Tests the opt-in result cache in front of compute
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+import qcengine as qcng
+from qcengine.result_cache import ResultCache, disable_result_cache, enable_result_cache, get_result_cache
+from qcengine.testing import failure_engine, schema_versions
+
+
+@pytest.fixture(scope="function")
+def versioned_engine(failure_engine, monkeypatch):
+    # the failure engine reports no version, which bypasses the cache
+    monkeypatch.setattr(type(failure_engine), "get_version", lambda self: "1.0")
+    yield failure_engine
+    disable_result_cache()
+
+
+def test_result_cache_memory_hit(versioned_engine):
+    cache = enable_result_cache()
+    assert get_result_cache() is cache
+
+    versioned_engine.iter_modes = ["pass"]
+    first = qcng.compute(versioned_engine.get_job(), versioned_engine.name, return_version=2)
+    second = qcng.compute(versioned_engine.get_job(), versioned_engine.name, return_version=2)
+
+    assert versioned_engine.ncalls == 1
+    assert first.extras["qcengine_result_cache"] == {"hit": False, "tier": None, "hits": 0, "misses": 1}
+    assert second.extras["qcengine_result_cache"] == {"hit": True, "tier": "memory", "hits": 1, "misses": 1}
+    assert np.array_equal(second.return_result, first.return_result)
+
+
+def test_result_cache_not_thread_safe(versioned_engine, monkeypatch):
+    enable_result_cache()
+    versioned_engine.thread_safe = False
+    versioned_engine.iter_modes = ["pass"] * 4
+    running, overlaps = [], []
+    compute = type(versioned_engine).compute
+
+    def slow_compute(self, input_data, config):
+        running.append(1)
+        overlaps.append(len(running))
+        time.sleep(0.05)
+        running.pop()
+        return compute(self, input_data, config)
+
+    monkeypatch.setattr(type(versioned_engine), "compute", slow_compute)
+
+    jobs = []
+    for distance in [4.5, 5.0, 5.5, 6.0]:
+        versioned_engine.start_distance = distance
+        jobs.append(versioned_engine.get_job())
+
+    # the cached harness is entered directly by compute and through the harness itself by compute_async
+    async def run():
+        name = versioned_engine.name
+        return await asyncio.gather(
+            asyncio.to_thread(qcng.compute, jobs[0], name, return_version=2),
+            qcng.compute_async(jobs[1], name, return_version=2),
+            asyncio.to_thread(qcng.compute, jobs[2], name, return_version=2),
+            qcng.compute_async(jobs[3], name, return_version=2),
+        )
+
+    rets = asyncio.run(run())
+
+    assert all(ret.success for ret in rets)
+    assert overlaps == [1, 1, 1, 1]
+
+
+def test_result_cache_key_changes(versioned_engine):
+    enable_result_cache()
+
+    versioned_engine.iter_modes = ["pass", "pass"]
+    qcng.compute(versioned_engine.get_job(), versioned_engine.name, return_version=2)
+    versioned_engine.start_distance = 6.0
+    ret = qcng.compute(versioned_engine.get_job(), versioned_engine.name, return_version=2)
+
+    assert versioned_engine.ncalls == 2
+    assert ret.extras["qcengine_result_cache"]["hit"] is False
+
+
+def test_result_cache_skips_failures(versioned_engine):
+    enable_result_cache()
+
+    versioned_engine.iter_modes = ["input_error", "pass"]
+    ret = qcng.compute(versioned_engine.get_job(), versioned_engine.name, raise_error=False, return_version=2)
+    assert ret.success is False
+
+    ret = qcng.compute(versioned_engine.get_job(), versioned_engine.name, return_version=2)
+    assert ret.success
+    assert versioned_engine.ncalls == 2
+
+
+def test_result_cache_disk_tier(versioned_engine, tmp_path):
+    path = tmp_path / "results.sqlite"
+    enable_result_cache(path)
+
+    versioned_engine.iter_modes = ["pass"]
+    first = qcng.compute(versioned_engine.get_job(), versioned_engine.name, return_version=2)
+
+    # a fresh cache, as in a new process, only has the disk tier to go on
+    enable_result_cache(path)
+    second = qcng.compute(versioned_engine.get_job(), versioned_engine.name, return_version=2)
+
+    assert versioned_engine.ncalls == 1
+    assert second.extras["qcengine_result_cache"]["tier"] == "disk"
+    assert np.array_equal(second.return_result, first.return_result)
+
+
+def test_result_cache_max_age(versioned_engine, tmp_path):
+    enable_result_cache(tmp_path / "results.sqlite", max_age=0.05)
+
+    versioned_engine.iter_modes = ["pass", "pass"]
+    qcng.compute(versioned_engine.get_job(), versioned_engine.name, return_version=2)
+    time.sleep(0.1)
+    ret = qcng.compute(versioned_engine.get_job(), versioned_engine.name, return_version=2)
+
+    assert versioned_engine.ncalls == 2
+    assert ret.extras["qcengine_result_cache"]["hit"] is False
+
+
+def test_result_cache_max_disk_size(versioned_engine, tmp_path):
+    versioned_engine.iter_modes = ["pass"]
+    ret = qcng.compute(versioned_engine.get_job(), versioned_engine.name, return_version=2)
+
+    cache = ResultCache(tmp_path / "results.sqlite", max_entries=0, max_disk_size=len(ret.model_dump_json()) + 1)
+    cache.put("a", ret)
+    cache.put("b", ret)
+
+    assert cache.get("a") == (None, None)
+    assert cache.get("b")[1] == "disk"
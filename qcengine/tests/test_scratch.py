@@ -0,0 +1,120 @@
+"""
+Tests the pooled scratch directories
+"""
+
+import os
+import time
+
+import qcengine as qcng
+from qcengine import util
+from qcengine.config import get_config
+from qcengine.scratch import ScratchManager, ScratchPool, get_scratch_manager, scratch_annotation, scratch_context
+from qcengine.testing import failure_engine, schema_versions
+
+
+def _wait_for(condition, timeout=10):
+    end = time.time() + timeout
+    while not condition():
+        if time.time() > end:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_scratch_pool_reuse(tmp_path):
+    pool = ScratchPool(tmp_path, size=2)
+    assert _wait_for(lambda: len(pool._free) == 2)
+
+    path = pool.acquire()
+    (path / "file").write_text("junk")
+    (path / "dir").mkdir()
+    pool.release(path)
+
+    assert _wait_for(lambda: path in pool._free)
+    assert os.listdir(path) == []
+
+    pool.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_scratch_pool_messy(tmp_path):
+    manager = ScratchManager(size=1)
+    with manager.directory(str(tmp_path), messy=True) as path:
+        (path / "file").write_text("keep")
+
+    assert (path / "file").read_text() == "keep"
+
+
+def test_scratch_manager_tmpfs(tmp_path):
+    disk, tmpfs = tmp_path / "disk", tmp_path / "tmpfs"
+    disk.mkdir()
+    tmpfs.mkdir()
+    manager = ScratchManager(size=0, tmpfs=str(tmpfs), tmpfs_max=1e-6)
+
+    # usage is unknown until the program has run once
+    with manager.directory(str(disk), program="small") as path:
+        assert path.parent == disk
+    manager.record("small", 10)
+
+    with manager.directory(str(disk), program="small") as path:
+        assert path.parent == tmpfs
+
+    manager.record("big", 10**6)
+    with manager.directory(str(disk), program="big") as path:
+        assert path.parent == disk
+
+
+def test_get_scratch_manager():
+    assert get_scratch_manager(get_config()) is None
+
+    config = get_config(task_config={"scratch_pool": 2})
+    assert get_scratch_manager(config) is get_scratch_manager(config)
+
+
+def test_execute_scratch_usage(tmp_path):
+    config = get_config(task_config={"scratch_pool": 1, "scratch_directory": str(tmp_path)})
+
+    success, dexe = util.execute(["cat", "infile"], {"infile": "hello"})
+    assert "scratch_usage" not in dexe
+
+    with scratch_context(config) as manager:
+        success, dexe = util.execute(["cat", "infile"], {"infile": "hello"}, scratch_directory=str(tmp_path))
+
+    assert success
+    assert dexe["stdout"] == "hello"
+    assert dexe["scratch_usage"] == 5
+    assert manager.usage["cat"] == 5
+    assert dexe["scratch_directory"].parent == tmp_path
+
+
+def test_compute_scratch_annotation(failure_engine, tmp_path, monkeypatch):
+    compute = type(failure_engine).compute
+
+    def compute_in_scratch(self, input_data, config):
+        util.execute(["cat", "infile"], {"infile": "hello"}, scratch_directory=config.scratch_directory)
+        return compute(self, input_data, config)
+
+    monkeypatch.setattr(type(failure_engine), "compute", compute_in_scratch)
+    failure_engine.iter_modes = ["pass", "pass"]
+    input_data = failure_engine.build_input_model(failure_engine.get_job())
+
+    ret = qcng.compute(input_data, failure_engine.name, raise_error=True)
+    assert "qcengine_scratch" not in ret.extras
+
+    task_config = {"scratch_pool": 1, "scratch_directory": str(tmp_path)}
+    ret = qcng.compute(input_data, failure_engine.name, task_config=task_config, raise_error=True)
+    assert ret.extras["ncalls"] == 2
+    assert ret.extras["qcengine_scratch"] == {"usage": 5, "jobs": [{"program": "cat", "usage": 5, "tmpfs": False}]}
+
+
+def test_scratch_annotation_tmpfs(tmp_path):
+    tmpfs = tmp_path / "tmpfs"
+    tmpfs.mkdir()
+    config = get_config(task_config={"scratch_tmpfs": str(tmpfs), "scratch_tmpfs_max": 1e-6})
+
+    with scratch_context(config) as manager:
+        manager.record("cat", 5)
+        util.execute(["cat", "infile"], {"infile": "hello"})
+        assert scratch_annotation()["jobs"] == [{"program": "cat", "usage": 5, "tmpfs": True}]
+
+    assert scratch_annotation() is None
@@ -0,0 +1,142 @@
+"""
+Tests the warm harness sessions
+"""
+
+import pytest
+from qcelemental.models.v2 import AtomicInput, Molecule
+
+import qcengine as qcng
+from qcengine.programs.util.model_cache import ModelCache
+from qcengine.session import active_session, open_session
+from qcengine.testing import failure_engine, schema_versions, uusing
+
+
+@pytest.fixture(scope="function")
+def session_engine(failure_engine, monkeypatch):
+    engine_type = type(failure_engine)
+    events = []
+
+    def open_hook(self, session):
+        events.append("open")
+        session.state["model"] = session.specification.model.method
+
+    def close_hook(self, session):
+        events.append("close")
+
+    compute = engine_type.compute
+
+    def compute_in_session(self, input_data, config):
+        events.append(active_session())
+        return compute(self, input_data, config)
+
+    monkeypatch.setattr(engine_type, "open_session", open_hook)
+    monkeypatch.setattr(engine_type, "close_session", close_hook)
+    monkeypatch.setattr(engine_type, "compute", compute_in_session)
+    yield failure_engine, events
+
+
+def test_session_compute(session_engine):
+    engine, events = session_engine
+    engine.iter_modes = ["pass", "pass", "pass"]
+    molecule = Molecule(symbols=["He", "He"], geometry=[0, 0, 0, 0, 0, 5])
+
+    with open_session(engine.name, {"method": "something"}, driver="gradient") as session:
+        assert session.state == {"model": "something"}
+
+        first = session.compute(molecule)
+        second = session.compute({"symbols": ["He", "He"], "geometry": [0, 0, 0, 0, 0, 6]})
+        third = session.compute(molecule, driver="energy")
+
+    assert events == ["open", session, session, session, "close"]
+    assert session.ncomputes == 3
+    assert session.state == {}
+    assert active_session() is None
+
+    assert first.success and second.success and third.success
+    assert first.molecule is molecule
+    assert first.input_data.specification.driver == "gradient"
+    assert third.input_data.specification.driver == "energy"
+    assert second.return_result[-1, -1] == pytest.approx(2.0)
+
+
+def test_session_closed(session_engine):
+    engine, events = session_engine
+    session = open_session(engine.name, {"method": "something"})
+    session.close()
+    session.close()
+
+    assert events == ["open", "close"]
+    with pytest.raises(RuntimeError) as exc:
+        session.compute(Molecule(symbols=["He", "He"], geometry=[0, 0, 0, 0, 0, 5]))
+    assert "session is closed" in str(exc.value)
+
+
+def test_session_failure(session_engine):
+    engine, events = session_engine
+    engine.iter_modes = ["input_error"]
+
+    with open_session(engine.name, {"method": "something"}, driver="gradient") as session:
+        ret = session.compute(Molecule(symbols=["He", "He"], geometry=[0, 0, 0, 0, 0, 5]))
+
+    assert ret.success is False
+    assert ret.error.error_type == "input_error"
+
+
+def test_session_pins_resident(failure_engine, monkeypatch):
+    engine_type = type(failure_engine)
+    failure_engine.iter_modes = ["pass"] * 4
+    cache = ModelCache(max_entries=1)
+    loads, hits = [], []
+
+    def load_model(name):
+        return engine_type._resident(("model", name), lambda: cache.get(name, lambda: loads.append(name) or name))
+
+    def open_hook(self, session):
+        load_model(session.specification.model.method)
+
+    compute = engine_type.compute
+
+    def compute_with_model(self, input_data, config):
+        hits.append(load_model(input_data.specification.model.method)[1])
+        # another model pushes this one out of the cache
+        cache.get("other", lambda: "other")
+        return compute(self, input_data, config)
+
+    monkeypatch.setattr(engine_type, "open_session", open_hook)
+    monkeypatch.setattr(engine_type, "compute", compute_with_model)
+    molecule = Molecule(symbols=["He", "He"], geometry=[0, 0, 0, 0, 0, 5])
+
+    with open_session(failure_engine.name, {"method": "something"}) as session:
+        for _ in range(3):
+            assert session.compute(molecule).success
+
+        assert session.state == {("model", "something"): "something"}
+        assert loads == ["something"]
+        assert hits == [True, True, True]
+
+    # outside of the session, the evicted model is loaded again
+    qcng.compute(AtomicInput(molecule=molecule, specification=session.specification), failure_engine.name)
+    assert loads == ["something", "something"]
+    assert session.state == {}
+
+
+def test_session_unknown_program():
+    with pytest.raises(qcng.exceptions.InputError):
+        open_session("bad_program", {"method": "something"})
+
+
+@uusing("rdkit")
+def test_session_rdkit():
+    from qcengine.programs.rdkit import RDKitHarness
+
+    molecule = Molecule(**qcng.get_molecule("water", return_dict=True))
+
+    with open_session("rdkit", {"method": "UFF"}, driver="gradient", raise_error=True) as session:
+        ret = session.compute(molecule)
+        # the force field is pinned, even once evicted from the harness's cache
+        RDKitHarness._CACHE.clear()
+        assert len(session.state) == 1
+        assert session.compute(molecule).return_result.shape == (3, 3)
+
+    assert ret.success
+    assert ret.return_result.shape == (3, 3)
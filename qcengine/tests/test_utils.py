@@ -1,5 +1,10 @@
+import asyncio
+import logging
 import os
+import shutil
+import subprocess
 import sys
+import threading
 import time
 
 import pytest
@@ -51,6 +56,48 @@ def test_terminate():
     assert (time.time() - t) < 1
 
 
+def test_terminate_ignores_sigint():
+    script = "import signal, time; signal.signal(signal.SIGINT, signal.SIG_IGN); print(flush=True); time.sleep(30)"
+
+    started = threading.Event()
+
+    t = time.time()
+    with util.popen([sys.executable, "-c", script], output_callback=lambda name, text: started.set()) as proc:
+        assert started.wait(10)  # the handler is in place
+        util.terminate_process(proc["proc"], timeout=0.5)
+
+    assert proc["proc"].returncode is not None
+    assert (time.time() - t) < 5
+
+
+def test_execute_interupt_after_early_exit():
+    t = time.time()
+    success, dexe = util.execute(["true"], interupt_after=30)
+
+    assert success
+    assert (time.time() - t) < 5
+
+
+def test_execute_timeout():
+    t = time.time()
+    with pytest.raises(subprocess.TimeoutExpired):
+        util.execute(["sleep", "30"], timeout=0.5)
+
+    assert (time.time() - t) < 5
+
+
+@pytest.mark.parametrize("waiter", ["wait_process", "_wait_thread"])
+def test_wait_process(waiter):
+    wait = getattr(util, waiter)
+    proc = subprocess.Popen(["sleep", "0.2"])
+
+    assert wait(proc, 0.01) is False
+    t = time.time()
+    assert wait(proc, 30) is True
+    assert (time.time() - t) < 5
+    assert proc.returncode == 0
+
+
 def test_tmpdir():
 
     with util.temporary_directory(child="this") as tmpdir:
@@ -90,3 +137,207 @@ def test_popen_tee_output(capsys):
     assert proc["stdout"] == "hello\n"
     captured = capsys.readouterr()
     assert captured.out == "hello\n"
+
+
+def test_popen_large_output():
+    # far more than a pipe holds, on both streams, so the pump must keep draining them together
+    script = "import sys; sys.stdout.write('x' * 2**22); sys.stderr.write('y' * 2**22)"
+    with util.popen([sys.executable, "-c", script]) as proc:
+        proc["proc"].wait(timeout=30)
+
+    assert proc["stdout"] == "x" * 2**22
+    assert proc["stderr"] == "y" * 2**22
+
+
+def test_popen_tee_output_multibyte(capsys):
+    with util.popen([sys.executable, "-c", "print('\u00e9' * 100000)"], pass_output_forward=True) as proc:
+        proc["proc"].wait()
+
+    assert proc["stdout"].strip() == "\u00e9" * 100000
+    assert capsys.readouterr().out.strip() == "\u00e9" * 100000
+
+
+def test_execute_spill_output():
+    success, dexe = util.execute(["sh", "-c", "echo hello; echo world >&2"], spill_output=True)
+
+    assert success
+    # the output is left unread in files that outlive the scratch directory
+    assert dexe["stdout"] is None
+    assert not os.path.exists(dexe["scratch_directory"])
+    with open(dexe["stdout_path"], "rb") as handle:
+        assert handle.read() == b"hello\n"
+    with open(dexe["stderr_path"], "rb") as handle:
+        assert handle.read() == b"world\n"
+    os.remove(dexe["stdout_path"])
+    os.remove(dexe["stderr_path"])
+
+    success, dexe = util.execute(["true"], spill_output=True, scratch_messy=True)
+    assert os.path.dirname(dexe["stdout_path"]) == str(dexe["scratch_directory"])
+    assert os.path.getsize(dexe["stdout_path"]) == 0
+    shutil.rmtree(dexe["scratch_directory"])
+
+
+def test_execute_async_spill_output():
+    success, dexe = asyncio.run(util.execute_async(["cat", "infile"], {"infile": "hello"}, spill_output=True))
+
+    assert success
+    assert dexe["stdout"] is None and dexe["stderr"] is None
+    with open(dexe["stdout_path"], "rb") as handle:
+        assert handle.read() == b"hello"
+    assert os.path.getsize(dexe["stderr_path"]) == 0
+    os.remove(dexe["stdout_path"])
+    os.remove(dexe["stderr_path"])
+
+
+@pytest.mark.parametrize(
+    "policy,expected",
+    [
+        ("full", "0123456789"),
+        ("tail", "\n[... 6 bytes of output omitted ...]\n6789"),
+        ("head_tail", "0123\n[... 2 bytes of output omitted ...]\n6789"),
+        ("discard_on_success", "\n[... 6 bytes of output omitted ...]\n6789"),
+    ],
+)
+def test_output_capture(policy, expected):
+    capture = util.OutputCapture(policy, 4)
+    for c in "0123456789":
+        capture.write(c.encode())
+
+    assert capture.nbytes == 10
+    assert capture.getvalue() == expected
+
+
+def test_execute_capture_policy():
+    script = "import sys; [print(i) for i in range(100000)]; sys.exit(int(sys.argv[1]))"
+    chunks = []
+
+    success, dexe = util.execute(
+        [sys.executable, "-c", script, "0"],
+        capture_policy="tail",
+        capture_size=7,
+        output_callback=lambda name, text: chunks.append((name, text)),
+    )
+
+    assert success
+    assert dexe["stdout"].endswith("\n99999\n")
+    assert len(dexe["stdout"]) < 100
+    # the callback saw everything, as it happened
+    assert "".join(text for name, text in chunks if name == "stdout") == "".join(f"{i}\n" for i in range(100000))
+
+    success, dexe = util.execute([sys.executable, "-c", script, "0"], capture_policy="discard_on_success")
+    assert success
+    assert dexe["stdout"] == ""
+
+    success, dexe = util.execute([sys.executable, "-c", script, "1"], capture_policy="discard_on_success")
+    assert not success
+    assert dexe["stdout"].endswith("\n99999\n")
+
+
+def test_execute_output_callback_raises(caplog):
+    caplog.set_level(logging.ERROR, logger="QCEngine")
+    script = "[print(i) for i in range(100000)]"
+    calls = []
+
+    def callback(name, text):
+        calls.append(name)
+        raise RuntimeError("parser failed")
+
+    success, dexe = util.execute([sys.executable, "-c", script], output_callback=callback, timeout=60)
+
+    # the output was still drained and captured in full
+    assert success
+    assert dexe["stdout"] == "".join(f"{i}\n" for i in range(100000))
+    assert len(calls) == 1
+    assert "parser failed" in caplog.text
+
+    success, dexe = asyncio.run(util.execute_async(["cat", "infile"], {"infile": "hello"}, output_callback=callback))
+    assert success
+    assert dexe["stdout"] == "hello"
+
+
+def test_execute_async_capture_policy():
+    chunks = []
+    success, dexe = asyncio.run(
+        util.execute_async(
+            ["cat", "infile"],
+            {"infile": "hello world"},
+            capture_policy="tail",
+            capture_size=5,
+            output_callback=lambda name, text: chunks.append(text),
+        )
+    )
+
+    assert success
+    assert dexe["stdout"].endswith("world")
+    assert "".join(chunks) == "hello world"
+
+
+def test_apply_capture_policy():
+    from qcelemental.models.v2 import AtomicResult
+
+    from qcengine.config import get_config
+
+    result = AtomicResult(
+        input_data={
+            "molecule": {"symbols": ["He"], "geometry": [0, 0, 0]},
+            "specification": {"driver": "energy", "model": {"method": "x"}},
+        },
+        molecule={"symbols": ["He"], "geometry": [0, 0, 0]},
+        return_result=0.0,
+        properties={},
+        provenance={"creator": "test"},
+        stdout="0123456789",
+        success=True,
+    )
+
+    assert util.apply_capture_policy(result, get_config()) is result
+
+    trimmed = util.apply_capture_policy(result, get_config(task_config={"capture_policy": "tail", "capture_size": 3}))
+    assert trimmed.stdout.endswith("\n789")
+
+    trimmed = util.apply_capture_policy(result, get_config(task_config={"capture_policy": "discard_on_success"}))
+    assert trimmed.stdout is None
+
+
+def test_execute_async():
+    success, dexe = asyncio.run(util.execute_async(["cat", "infile"], {"infile": "hello"}, ["infile"]))
+
+    assert success
+    assert dexe["stdout"] == "hello"
+    assert dexe["outfiles"]["infile"] == "hello"
+
+
+def test_execute_async_timeout():
+    t = time.time()
+    with pytest.raises(subprocess.TimeoutExpired):
+        asyncio.run(util.execute_async(["sleep", "30"], timeout=0.5))
+
+    assert (time.time() - t) < 5
+
+
+def test_execute_async_concurrent():
+    async def many():
+        return await asyncio.gather(*[util.execute_async(["sleep", "0.5"]) for _ in range(10)])
+
+    t = time.time()
+    rets = asyncio.run(many())
+
+    assert all(success for success, _ in rets)
+    assert (time.time() - t) < 4
+
+
+def test_task_environ_context():
+    def omp_threads(environment=None):
+        return util.execute(["sh", "-c", "echo $OMP_NUM_THREADS"], environment=environment)[1]["stdout"].strip()
+
+    assert omp_threads({"OMP_NUM_THREADS": "7"}) == "7"
+
+    with util.task_environ_context(env={"OMP_NUM_THREADS": "3"}):
+        assert os.environ.get("OMP_NUM_THREADS") != "3"
+        assert omp_threads() == "3"
+        assert omp_threads({"PATH": os.environ["PATH"]}) == "3"
+
+        # an explicit environment is final
+        assert omp_threads({"OMP_NUM_THREADS": "7"}) == "7"
+
+    assert omp_threads({"OMP_NUM_THREADS": "7"}) == "7"
@@ -2,9 +2,12 @@
 Several import utilities
 """
 
+import asyncio
+import codecs
 import io
 import json
 import os
+import selectors
 import shutil
 import signal
 import subprocess
@@ -13,10 +16,11 @@ import tempfile
 import time
 import traceback
 from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import partial
 from pathlib import Path
-from threading import Thread
-from typing import Any, BinaryIO, Dict, List, Optional, TextIO, Tuple, Union
+from threading import Event, Thread
+from typing import Any, BinaryIO, Callable, ContextManager, Dict, List, Optional, TextIO, Tuple, Union
 
 import pydantic
 
@@ -24,12 +28,32 @@ from qcengine.config import TaskConfig
 
 from .config import LOGGER, get_provenance_augments
 from .exceptions import InputError, QCEngineException
-
-__all__ = ["compute_wrapper", "model_wrapper", "handle_output_metadata", "create_mpi_invocation", "execute"]
+from .scratch import ScratchManager, active_scratch_manager, scratch_annotation
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+__all__ = [
+    "compute_wrapper",
+    "model_wrapper",
+    "handle_output_metadata",
+    "create_mpi_invocation",
+    "execute",
+    "execute_async",
+    "apply_capture_policy",
+    "apply_scratch_annotation",
+    "OutputCapture",
+]
 
 
 from qcelemental.models import QCEL_V1V2_SHIM_CODE
 
+# Environment overrides for child processes of the current task. Unlike `environ_context`, this does not
+#   touch os.environ, so concurrent asyncio tasks (or threads given a copied context) do not trample each other.
+_task_environ: ContextVar[Optional[Dict[str, str]]] = ContextVar("qcengine_task_environ", default=None)
+
 
 def create_mpi_invocation(executable: str, task_config: TaskConfig) -> List[str]:
     """Create the launch command for an MPI-parallel task
@@ -178,6 +202,17 @@ def handle_output_metadata(
         Output type depends on return_dict or a dict if an error was generated in model construction
     """
 
+    from qcelemental.models.v2 import ProtoModel as PrMdl_v2
+
+    if (
+        metadata["success"] is True
+        and isinstance(output_data, PrMdl_v2)
+        and getattr(output_data, "success", False) is True
+        and "provenance" in type(output_data).model_fields
+    ):
+        # validated output needs no round trip through a dict
+        return _finalize_output(_fuse_validated_output(output_data, metadata), return_dict, convert_version)
+
     if isinstance(output_data, dict):
         output_fusion = output_data  # Error handling
     else:
@@ -260,6 +295,75 @@ def handle_output_metadata(
             inp_ret = output_fusion
         ret = model(success=success_ret, error=error_ret, input_data=inp_ret)
 
+    return _finalize_output(ret, return_dict, convert_version)
+
+
+def apply_capture_policy(
+    output_data: Union["AtomicResult", "OptimizationResult", "FailedOperation"], config: TaskConfig
+) -> Union["AtomicResult", "OptimizationResult", "FailedOperation"]:
+    """Trims the stdout and stderr of a successful result to the ``capture_policy`` of `config`.
+
+    Harnesses harvest from the full output, so the policy applies only to what is returned.
+    """
+
+    if config.capture_policy == "full" or getattr(output_data, "success", False) is not True:
+        return output_data
+
+    update = {}
+    for val in ["stdout", "stderr"]:
+        text = getattr(output_data, val, None)
+        if text is None:
+            continue
+
+        if config.capture_policy == "discard_on_success":
+            update[val] = None
+        else:
+            capture = OutputCapture(config.capture_policy, config.capture_size)
+            capture.write(text.encode())
+            if capture.truncated:
+                update[val] = capture.getvalue()
+
+    return output_data.model_copy(update=update) if update else output_data
+
+
+def apply_scratch_annotation(
+    output_data: Union["AtomicResult", "OptimizationResult", "FailedOperation"]
+) -> Union["AtomicResult", "OptimizationResult", "FailedOperation"]:
+    """Adds the scratch usage of the running task to the extras of a successful result.
+
+    See :func:`~qcengine.scratch.scratch_annotation`; results of tasks that measured no scratch are unchanged.
+    """
+
+    annotation = scratch_annotation()
+    if annotation is None or getattr(output_data, "success", False) is not True:
+        return output_data
+
+    extras = {**(output_data.extras or {}), "qcengine_scratch": annotation}
+    return output_data.model_copy(update={"extras": extras})
+
+
+def _fuse_validated_output(output_data: pydantic.BaseModel, metadata: Dict[str, Any]) -> pydantic.BaseModel:
+    """Fuses metadata onto a successful QCSchema v2 result, as in `handle_output_metadata`, without re-validation."""
+
+    update = {}
+    for val in ["stdout", "stderr"]:
+        if not getattr(output_data, val, None) and metadata[val] is not None:
+            update[val] = metadata[val]
+
+    provenance_augments = get_provenance_augments()
+    provenance_augments["wall_time"] = metadata["wall_time"]
+    if metadata["retries"] != 0:
+        provenance_augments["retries"] = metadata["retries"]
+    update["provenance"] = output_data.provenance.model_copy(update=provenance_augments)
+
+    return output_data.model_copy(update=update)
+
+
+def _finalize_output(
+    ret: pydantic.BaseModel, return_dict: bool, convert_version: int
+) -> Union[Dict[str, Any], pydantic.BaseModel]:
+    """Converts a fused output to the requested schema version and representation."""
+
     # temp while ManyBody has no v2. empty string for FailedOp
     if getattr(ret, "schema_name", "") == "qcschema_manybodyresult":
         if return_dict:
@@ -281,6 +385,73 @@ def handle_output_metadata(
         return ret
 
 
+def _wait_pidfd(proc: subprocess.Popen, timeout: Optional[float]) -> Optional[bool]:
+    """Waits on a Linux process file descriptor, which becomes readable when the process exits.
+
+    Returns whether the process exited, or ``None`` if pidfds are unavailable.
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        pidfd = os.pidfd_open(proc.pid)
+    except OSError:
+        # kernel older than 5.3, or a seccomp sandbox
+        return None
+
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(pidfd, selectors.EVENT_READ)
+            if not selector.select(timeout):
+                return False
+    finally:
+        os.close(pidfd)
+
+    proc.wait()  # reaps at once, the process has exited
+    return True
+
+
+def _wait_thread(proc: subprocess.Popen, timeout: Optional[float]) -> bool:
+    """Waits for the process from a helper thread blocked in ``waitpid``, without polling."""
+    done = Event()
+
+    def reap():
+        proc.wait()
+        done.set()
+
+    Thread(target=reap, daemon=True).start()
+    return done.wait(timeout)
+
+
+def wait_process(proc: subprocess.Popen, timeout: Optional[float] = None) -> bool:
+    """Blocks until `proc` exits or `timeout` seconds pass, whichever is first.
+
+    Unlike ``Popen.wait`` with a timeout, which sleep-polls on POSIX, this is woken by the exit itself:
+    through a pidfd on Linux, the native wait on Windows, and otherwise a helper thread in ``waitpid``.
+
+    Returns
+    -------
+    bool
+        Whether the process has exited.
+    """
+    if proc.returncode is not None:
+        return True
+    if timeout is None:
+        proc.wait()
+        return True
+
+    if sys.platform.startswith("win"):
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return False
+        return True
+
+    exited = _wait_pidfd(proc, timeout)
+    if exited is None:
+        exited = _wait_thread(proc, timeout)
+    return exited
+
+
 def terminate_process(proc: Any, timeout: int = 15) -> None:
     if proc.poll() is None:
 
@@ -291,13 +462,174 @@ def terminate_process(proc: Any, timeout: int = 15) -> None:
             proc.send_signal(signal.SIGINT)
 
         try:
-            start = time.time()
-            while (proc.poll() is None) and (time.time() < (start + timeout)):
-                time.sleep(0.02)
+            wait_process(proc, timeout)
 
         # Flat kill
         finally:
             proc.kill()
+            proc.wait()
+
+
+# Bounds on a single read from a child's pipe. A read that fills the buffer doubles it (and, where the
+#   OS allows, the pipe capacity) so chatty programs are drained in fewer, larger reads.
+_PUMP_MIN_READ = 64 * 1024
+_PUMP_MAX_READ = 1024 * 1024
+
+# File names of the standard output and error of a spilled process, within its spill directory
+_SPILL_NAMES = {"stdout": "qcengine.stdout", "stderr": "qcengine.stderr"}
+
+
+CAPTURE_POLICIES = ("full", "tail", "head_tail", "discard_on_success")
+
+
+class OutputCapture:
+    """Bounded in-memory store for the output of a child process.
+
+    Parameters
+    ----------
+    policy
+        ``"full"`` keeps everything. ``"tail"`` keeps the last `size` bytes and ``"head_tail"`` the first
+        and last `size` bytes. ``"discard_on_success"`` keeps the last `size` bytes so that a failure can be
+        diagnosed; the caller drops them if the process succeeds.
+    size
+        Bytes kept at each retained end.
+    """
+
+    def __init__(self, policy: str = "full", size: int = 2**20):
+        if policy not in CAPTURE_POLICIES:
+            raise ValueError(f"Capture policy must be one of {CAPTURE_POLICIES}, not {policy!r}.")
+
+        self.policy = policy
+        self.size = size
+        self.nbytes = 0
+        self._head = bytearray()
+        self._tail = bytearray()
+
+    def write(self, chunk: bytes) -> None:
+        self.nbytes += len(chunk)
+        if self.policy == "full":
+            self._tail += chunk
+            return
+
+        if self.policy == "head_tail" and len(self._head) < self.size:
+            take = self.size - len(self._head)
+            self._head += chunk[:take]
+            chunk = chunk[take:]
+
+        self._tail += chunk
+        # trim only once double the bound so each byte is moved about once
+        if len(self._tail) > 2 * self.size:
+            del self._tail[: len(self._tail) - self.size]
+
+    @property
+    def truncated(self) -> bool:
+        if self.policy == "full":
+            return False
+        return self.nbytes > len(self._head) + min(len(self._tail), self.size)
+
+    def getvalue(self) -> str:
+        """The retained output as text, with a note on how much was omitted, if any."""
+        if not self.truncated:
+            return (self._head + self._tail).decode()
+
+        tail = self._tail[len(self._tail) - self.size :] if self.size else b""
+        omitted = self.nbytes - len(self._head) - len(tail)
+        marker = f"\n[... {omitted} bytes of output omitted ...]\n".encode()
+        # a multibyte character may have been cut at either edge
+        return (self._head + marker + tail).decode(errors="replace")
+
+
+def _pump_output(pipes: Dict[int, Tuple["OutputCapture", Optional[Callable[[str], Any]]]]) -> None:
+    """Drains the pipes of a child process from a single thread until all reach EOF.
+
+    Parameters
+    ----------
+    pipes
+        Map of a pipe's file descriptor to the capture collecting its bytes and a callable that is
+        handed the decoded text as it arrives, or ``None`` if the text is not wanted.
+    """
+
+    with selectors.DefaultSelector() as selector:
+        for fd, (storage, sink) in pipes.items():
+            decoder = None if sink is None else codecs.getincrementaldecoder("utf-8")(errors="replace")
+            selector.register(fd, selectors.EVENT_READ, [storage, sink, decoder, _PUMP_MIN_READ])
+
+        while selector.get_map():
+            for key, _ in selector.select():
+                state = key.data
+                storage, sink, decoder, size = state
+
+                chunk = os.read(key.fd, size)
+                if not chunk:
+                    selector.unregister(key.fd)
+                    if decoder is not None:
+                        tail = decoder.decode(b"", final=True)
+                        if tail:
+                            sink(tail)
+                    continue
+
+                storage.write(chunk)
+                if decoder is not None:
+                    # incremental so multibyte characters split across reads are not mangled
+                    sink(decoder.decode(chunk))
+
+                if len(chunk) == size and size < _PUMP_MAX_READ:
+                    state[3] = size * 2
+                    _grow_pipe(key.fd, state[3])
+
+
+def _grow_pipe(fd: int, size: int) -> None:
+    """Asks the OS for a pipe capacity of `size` bytes, where supported. Failure is harmless."""
+    if fcntl is None or not hasattr(fcntl, "F_SETPIPE_SZ"):
+        return
+    try:
+        fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, size)
+    except OSError:
+        pass
+
+
+def _spilled_output(ret: Dict[str, Any], paths: Dict[str, str], move_to: Optional[str] = None) -> None:
+    """Places the paths of the spilled output files at `paths` in `ret`, with stdout and stderr as ``None``.
+
+    The files are not read, so output of any size costs no memory. Given `move_to`, they are first moved
+    there, a rename within one file system, so that they outlive the scratch directory they were written in.
+    """
+    for k, path in paths.items():
+        if move_to is not None:
+            handle, destination = tempfile.mkstemp(prefix="qcengine_", suffix=f".{k}", dir=move_to)
+            os.close(handle)
+            path = shutil.move(path, destination)
+        ret[k] = None
+        ret[f"{k}_path"] = path
+
+
+def _output_sinks(
+    pass_output_forward: bool, output_callback: Optional[Callable[[str, str], Any]]
+) -> Dict[str, Optional[Callable[[str], Any]]]:
+    """Per-stream callables handed the text of a child's stdout and stderr as it arrives.
+
+    An exception from `output_callback` is logged and the callback is not called again, so the pipes
+    are still drained and captured rather than left to fill and stall the child.
+    """
+    failed = []
+
+    def sink(name: str, sysio: TextIO) -> Optional[Callable[[str], Any]]:
+        if not pass_output_forward and output_callback is None:
+            return None
+
+        def write(text: str) -> None:
+            if pass_output_forward:
+                sysio.write(text)
+            if output_callback is not None and not failed:
+                try:
+                    output_callback(name, text)
+                except Exception:
+                    failed.append(name)
+                    LOGGER.exception("Output callback raised, no further output is passed to it.")
+
+        return write
+
+    return {"stdout": sink("stdout", sys.stdout), "stderr": sink("stderr", sys.stderr)}
 
 
 @contextmanager
@@ -306,6 +638,10 @@ def popen(
     append_prefix: bool = False,
     popen_kwargs: Optional[Dict[str, Any]] = None,
     pass_output_forward: bool = False,
+    spill_directory: Optional[str] = None,
+    capture_policy: str = "full",
+    capture_size: int = 2**20,
+    output_callback: Optional[Callable[[str, str], Any]] = None,
 ) -> Dict[str, Any]:
     """
     Opens a background task
@@ -323,6 +659,16 @@ def popen(
             Any keyword arguments to use when launching the process
         pass_output_forward: bool
             Whether to pass the stdout and stderr forward to the system's stdout and stderr
+        spill_directory: str, optional
+            Write the stdout and stderr of the task straight to files in this directory rather than
+            collecting them in memory. Cannot be combined with `pass_output_forward` or `output_callback`.
+        capture_policy: str
+            How much of the stdout and stderr to hold in memory, see :class:`OutputCapture`.
+        capture_size: int
+            Bytes kept at each retained end under a bounded `capture_policy`.
+        output_callback: Callable[[str, str], Any], optional
+            Called from a reader thread with the stream name ("stdout" or "stderr") and each piece of
+            its text as the task produces it, whatever the `capture_policy`.
     Returns
     -------
         exe: dict
@@ -332,6 +678,8 @@ def popen(
                 <li>stdout: String value of the standard output of the task</li>
                 <li>stdeer: String value of the standard error of the task</li>
             </ul>
+            With `spill_directory`, stdout and stderr are instead ``None`` and the output is left in the
+            files, whose paths are under the additional keys stdout_path and stderr_path.
     """
     args = list(args)
     if popen_kwargs is None:
@@ -339,6 +687,9 @@ def popen(
     else:
         popen_kwargs = popen_kwargs.copy()
 
+    if spill_directory is not None and (pass_output_forward or output_callback is not None):
+        raise ValueError("Output spilled to disk cannot also be passed forward or streamed to a callback.")
+
     # Bin prefix
     if sys.platform.startswith("win"):
         bin_prefix = os.path.join(sys.prefix, "Scripts")
@@ -353,36 +704,65 @@ def popen(
         # Allow using CTRL_C_EVENT / CTRL_BREAK_EVENT
         popen_kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
 
+    # Launch the process
+    LOGGER.info("Popen", args, popen_kwargs)
+
+    if spill_directory is not None:
+        # The child writes to the files itself, so there is nothing to pump
+        paths = {k: os.path.join(spill_directory, v) for k, v in _SPILL_NAMES.items()}
+        with open(paths["stdout"], "wb") as stdout, open(paths["stderr"], "wb") as stderr:
+            ret = {"proc": subprocess.Popen(args, stdout=stdout, stderr=stderr, **popen_kwargs)}
+
+        try:
+            yield ret
+        finally:
+            try:
+                terminate_process(ret["proc"])
+            finally:
+                # the directory belongs to the caller, so the files are left in it
+                _spilled_output(ret, paths)
+        return
+
     # Route the standard error and output
     popen_kwargs["stdout"] = subprocess.PIPE
     popen_kwargs["stderr"] = subprocess.PIPE
 
-    # Prepare StringIO objects to store the stdout and stderr
-    stdout = io.BytesIO()
-    stderr = io.BytesIO()
-
-    # Launch the process
-    LOGGER.info("Popen", args, popen_kwargs)
+    # Prepare buffers to store the stdout and stderr
+    stdout = OutputCapture(capture_policy, capture_size)
+    stderr = OutputCapture(capture_policy, capture_size)
+    sinks = _output_sinks(pass_output_forward, output_callback)
 
     # Ready the output
     ret = {"proc": subprocess.Popen(args, **popen_kwargs)}
 
-    # Spawn threads that will read from the stderr/stdout
-    #  The PIPE uses a buffer with finite capacity. The underlying
+    # The PIPE uses a buffer with finite capacity. The underlying
     #  process will stall if it is unable to write to the buffer
-    #  because the buffer is full. These threads continuously read
-    #  from the buffers to ensure that they do not fill.
-    #
-    def read_from_buffer(buffer: BinaryIO, storage: io.BytesIO, sysio: TextIO):
-        for r in iter(partial(buffer.read, 1024), b""):
-            storage.write(r)
-            if pass_output_forward:
-                sysio.write(r.decode())
+    #  because the buffer is full. A single pump thread continuously
+    #  reads from both pipes to ensure that they do not fill.
+    #  Selectors cannot wait on pipes on Windows, so there a thread
+    #  reads each pipe.
+    if sys.platform.startswith("win"):
+
+        def read_from_buffer(buffer: BinaryIO, storage: OutputCapture, sink: Optional[Callable[[str], Any]]):
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            for r in iter(partial(buffer.read, _PUMP_MIN_READ), b""):
+                storage.write(r)
+                if sink is not None:
+                    sink(decoder.decode(r))
+
+        readers = [
+            Thread(target=read_from_buffer, args=(ret["proc"].stdout, stdout, sinks["stdout"])),
+            Thread(target=read_from_buffer, args=(ret["proc"].stderr, stderr, sinks["stderr"])),
+        ]
+    else:
+        pipes = {
+            ret["proc"].stdout.fileno(): (stdout, sinks["stdout"]),
+            ret["proc"].stderr.fileno(): (stderr, sinks["stderr"]),
+        }
+        readers = [Thread(target=_pump_output, args=(pipes,))]
 
-    stdout_reader = Thread(target=read_from_buffer, args=(ret["proc"].stdout, stdout, sys.stdout))
-    stdout_reader.start()
-    stderr_reader = Thread(target=read_from_buffer, args=(ret["proc"].stderr, stderr, sys.stderr))
-    stderr_reader.start()
+    for reader in readers:
+        reader.start()
 
     # Yield control back to the main thread
     try:
@@ -395,17 +775,67 @@ def popen(
         try:
             terminate_process(ret["proc"])
         finally:
-            # Wait for the reader threads to finish
-            stdout_reader.join()
-            stderr_reader.join()
+            # Wait for the readers to finish
+            for reader in readers:
+                reader.join()
 
             # Retrieve the standard output for the process
-            ret["stdout"] = stdout.getvalue().decode()
-            ret["stderr"] = stderr.getvalue().decode()
+            ret["stdout"] = stdout.getvalue()
+            ret["stderr"] = stderr.getvalue()
             ret["proc"].stdout.close()
             ret["proc"].stderr.close()
 
 
+def _config_environ(config: Optional["TaskConfig"]) -> Dict[str, str]:
+    """Environment variables that pass the threading of `config` on to child programs."""
+    if config is None:
+        return {}
+    return {"OMP_NUM_THREADS": str(config.ncores), "MKL_NUM_THREADS": str(config.ncores)}
+
+
+@contextmanager
+def task_environ_context(config: Optional["TaskConfig"] = None, env: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Set environment variables for processes launched by :func:`execute` and :func:`execute_async`
+    within the current context only. ``os.environ`` itself is left untouched.
+
+    Parameters
+    ----------
+    config : Optional[TaskConfig], optional
+        Automatically sets MKL/OMP num threads based off the input config.
+    env : Optional[Dict[str, str]], optional
+        A dictionary of environment variables to update.
+
+    Yields
+    ------
+    Dict[str, str]
+        The environment variables set for child processes.
+    """
+
+    temporary_env = {**(_task_environ.get() or {}), **_config_environ(config), **(env or {})}
+    token = _task_environ.set(temporary_env)
+    try:
+        yield temporary_env
+    finally:
+        _task_environ.reset(token)
+
+
+def _child_environment(environment: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    """Form the environment of a child process from `environment` and any task overrides.
+
+    The task overrides apply on top of ``os.environ``, but an explicit `environment` is final, as for
+    :func:`execute` outside of a task.
+    """
+    task_env = _task_environ.get()
+    if environment is None:
+        if not task_env:
+            return None
+        merged = {**os.environ, **task_env}
+    else:
+        merged = {**(task_env or {}), **environment}
+
+    return {k: v for k, v in merged.items() if v is not None}
+
+
 @contextmanager
 def environ_context(config: Optional["TaskConfig"] = None, env: Optional[Dict[str, str]] = None) -> Dict[str, str]:
     """Temporarily set environment variables inside the context manager and
@@ -424,11 +854,7 @@ def environ_context(config: Optional["TaskConfig"] = None, env: Optional[Dict[st
         The updated environment variables.
     """
 
-    temporary_env = {}
-    if config:
-        temporary_env["OMP_NUM_THREADS"] = str(config.ncores)
-        temporary_env["MKL_NUM_THREADS"] = str(config.ncores)
-
+    temporary_env = _config_environ(config)
     if env:
         temporary_env.update(env)
 
@@ -461,12 +887,20 @@ def execute(
     environment: Optional[Dict[str, str]] = None,
     shell: Optional[bool] = False,
     exit_code: Optional[int] = 0,
+    spill_output: bool = False,
+    capture_policy: str = "full",
+    capture_size: int = 2**20,
+    output_callback: Optional[Callable[[str, str], Any]] = None,
 ) -> Tuple[bool, Dict[str, Any]]:
     """
     Runs a process in the background until complete.
 
     Returns True if exit code <= exit_code (default 0)
 
+    Within a task whose TaskConfig enables ``scratch_pool`` or ``scratch_tmpfs``, an unnamed scratch
+    directory comes from :mod:`qcengine.scratch` and the bytes left in it are returned as scratch_usage.
+    :func:`~qcengine.compute` also reports them in the result's ``extras["qcengine_scratch"]``.
+
     Parameters
     ----------
     command : list of str
@@ -500,6 +934,19 @@ def execute(
         Run command through the shell.
     exit_code: int, optional
         The exit code above which the process is considered failure.
+    spill_output: bool, optional
+        Write stdout and stderr straight to files in the scratch directory rather than memory while the
+        process runs. The returned stdout and stderr are then ``None`` and the output is left unread in the
+        files at stdout_path and stderr_path, which belong to the caller to read and remove. Unless
+        `scratch_messy`, the files are moved beside the scratch directory so that they outlive it.
+    capture_policy: str, optional
+        How much of the stdout and stderr to keep: "full", "tail", "head_tail", or "discard_on_success".
+        See :class:`OutputCapture`. Has no effect on spilled output.
+    capture_size: int, optional
+        Bytes kept at each retained end under a bounded `capture_policy`.
+    output_callback: Callable[[str, str], Any], optional
+        Called with the stream name ("stdout" or "stderr") and each piece of its text while the process
+        runs, so output can be parsed incrementally rather than once it has all been captured.
 
     Raises
     ------
@@ -514,6 +961,88 @@ def execute(
 
     """
 
+    infiles, outfiles = _format_execute_files(infiles, outfiles, blocking_files)
+
+    # Format popen
+    popen_kwargs = {}
+    env = _child_environment(environment)
+    if env is not None:
+        popen_kwargs["env"] = env
+
+    # Execute
+    manager, program, scratch = _job_directory(
+        command, scratch_name, scratch_directory, scratch_suffix, scratch_messy, scratch_exist_ok
+    )
+    with scratch as scrdir:
+        popen_kwargs["cwd"] = scrdir
+        popen_kwargs["shell"] = shell
+        with disk_files(infiles, outfiles, cwd=scrdir, as_binary=as_binary) as extrafiles:
+            with popen(
+                command,
+                popen_kwargs=popen_kwargs,
+                spill_directory=scrdir if spill_output else None,
+                capture_policy=capture_policy,
+                capture_size=capture_size,
+                output_callback=output_callback,
+            ) as proc:
+                # Wait for the subprocess to complete or the timeout to expire
+                if interupt_after is None:
+                    if not wait_process(proc["proc"], timeout):
+                        raise subprocess.TimeoutExpired(proc["proc"].args, timeout)
+                else:
+                    # returns as soon as the program finishes, if before the interrupt
+                    wait_process(proc["proc"], interupt_after)
+                    terminate_process(proc["proc"])
+            retcode = proc["proc"].poll()
+        if spill_output and not scratch_messy:
+            # moved out ahead of the directory's removal, or its return to a scratch pool
+            _spilled_output(proc, {k: proc[f"{k}_path"] for k in _SPILL_NAMES}, move_to=os.path.dirname(scrdir))
+        proc["outfiles"] = extrafiles
+        if manager is not None:
+            proc["scratch_usage"] = manager.measure(program, scrdir)
+    proc["scratch_directory"] = scrdir
+
+    success = retcode <= exit_code
+    if success and capture_policy == "discard_on_success" and not spill_output:
+        proc["stdout"] = proc["stderr"] = ""
+
+    return success, proc
+
+
+def _job_directory(
+    command: List[str],
+    scratch_name: Optional[str],
+    scratch_directory: Optional[str],
+    scratch_suffix: Optional[str],
+    scratch_messy: bool,
+    scratch_exist_ok: bool,
+) -> Tuple[Optional[ScratchManager], Optional[str], ContextManager[Path]]:
+    """Scratch directory context for :func:`execute` and :func:`execute_async`.
+
+    Jobs take their directory from the active ScratchManager unless the caller names or reuses it.
+    Returns the manager, if any, the program name it records usage under, and the context.
+    """
+
+    manager = active_scratch_manager()
+    if manager is None or scratch_name is not None or scratch_suffix is not None or scratch_exist_ok:
+        scratch = temporary_directory(
+            child=scratch_name,
+            parent=scratch_directory,
+            messy=scratch_messy,
+            exist_ok=scratch_exist_ok,
+            suffix=scratch_suffix,
+        )
+        return None, None, scratch
+
+    program = Path(str(command[0]).split()[0]).name if command else None
+    return manager, program, manager.directory(scratch_directory, program=program, messy=scratch_messy)
+
+
+def _format_execute_files(
+    infiles: Optional[Dict[str, str]], outfiles: Optional[List[str]], blocking_files: Optional[List[str]]
+) -> Tuple[Dict[str, str], Dict[str, None]]:
+    """Normalize the file arguments shared by :func:`execute` and :func:`execute_async`."""
+
     # Format inputs
     if infiles is None:
         infiles = {}
@@ -528,34 +1057,161 @@ def execute(
             if os.path.isfile(fl):
                 raise FileExistsError("Existing file can interfere with execute operation.", fl)
 
-    # Format popen
-    popen_kwargs = {}
-    if environment is not None:
-        popen_kwargs["env"] = {k: v for k, v in environment.items() if v is not None}
+    return infiles, outfiles
+
+
+async def _drain_async(
+    stream: asyncio.StreamReader, storage: OutputCapture, sink: Optional[Callable[[str], Any]]
+) -> None:
+    """Reads an asyncio subprocess pipe to EOF into `storage`, handing its text to `sink` as it arrives."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        chunk = await stream.read(_PUMP_MAX_READ)
+        if not chunk:
+            break
+        storage.write(chunk)
+        if sink is not None:
+            sink(decoder.decode(chunk))
+
+    if sink is not None:
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            sink(tail)
+
+
+async def _terminate_process_async(proc: "asyncio.subprocess.Process", timeout: int = 15) -> None:
+    if proc.returncode is None:
+
+        # Sigint (keyboard interupt)
+        if sys.platform.startswith("win"):
+            proc.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            proc.send_signal(signal.SIGINT)
+
+        try:
+            await asyncio.wait_for(proc.wait(), timeout)
+        except asyncio.TimeoutError:
+            # Flat kill
+            proc.kill()
+            await proc.wait()
+
+
+async def execute_async(
+    command: List[str],
+    infiles: Optional[Dict[str, str]] = None,
+    outfiles: Optional[List[str]] = None,
+    *,
+    as_binary: Optional[List[str]] = None,
+    scratch_name: Optional[str] = None,
+    scratch_directory: Optional[str] = None,
+    scratch_suffix: Optional[str] = None,
+    scratch_messy: bool = False,
+    scratch_exist_ok: bool = False,
+    blocking_files: Optional[List[str]] = None,
+    timeout: Optional[int] = None,
+    interupt_after: Optional[int] = None,
+    environment: Optional[Dict[str, str]] = None,
+    shell: Optional[bool] = False,
+    exit_code: Optional[int] = 0,
+    spill_output: bool = False,
+    capture_policy: str = "full",
+    capture_size: int = 2**20,
+    output_callback: Optional[Callable[[str, str], Any]] = None,
+) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Runs a process as an asyncio subprocess until complete.
+
+    Counterpart to :func:`execute` with the same parameters and return value. The child's
+    output is read without helper threads and the timeouts are awaited, so many processes
+    may be supervised from a single event loop. Output is not passed forward.
+
+    Raises
+    ------
+    FileExistsError
+        If any file in `blocking` is present
+    subprocess.TimeoutExpired
+        If the process has not finished after `timeout` seconds.
+
+    Examples
+    --------
+    >>> success, dexe = await qcng.util.execute_async(['command_1'], infiles, outfiles)
+
+    """
+
+    if spill_output and output_callback is not None:
+        raise ValueError("Output spilled to disk cannot also be streamed to a callback.")
+
+    infiles, outfiles = _format_execute_files(infiles, outfiles, blocking_files)
+
+    # Format the subprocess
+    subprocess_kwargs = {"env": _child_environment(environment)}
+    if sys.platform.startswith("win"):
+        # Allow using CTRL_C_EVENT / CTRL_BREAK_EVENT
+        subprocess_kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+
+    if shell:
+        if sys.platform.startswith("win"):
+            args = [subprocess.list2cmdline(command)]
+            create = asyncio.create_subprocess_shell
+        else:
+            # what subprocess.Popen does for a sequence and shell=True
+            args = ["/bin/sh", "-c", *command]
+            create = asyncio.create_subprocess_exec
+    else:
+        args = list(command)
+        create = asyncio.create_subprocess_exec
 
     # Execute
-    with temporary_directory(
-        child=scratch_name,
-        parent=scratch_directory,
-        messy=scratch_messy,
-        exist_ok=scratch_exist_ok,
-        suffix=scratch_suffix,
-    ) as scrdir:
-        popen_kwargs["cwd"] = scrdir
-        popen_kwargs["shell"] = shell
+    manager, program, scratch = _job_directory(
+        command, scratch_name, scratch_directory, scratch_suffix, scratch_messy, scratch_exist_ok
+    )
+    with scratch as scrdir:
         with disk_files(infiles, outfiles, cwd=scrdir, as_binary=as_binary) as extrafiles:
-            with popen(command, popen_kwargs=popen_kwargs) as proc:
+            LOGGER.info(f"Subprocess {args}")
+            if spill_output:
+                spill_paths = {k: os.path.join(scrdir, v) for k, v in _SPILL_NAMES.items()}
+                with open(spill_paths["stdout"], "wb") as stdout, open(spill_paths["stderr"], "wb") as stderr:
+                    proc = await create(*args, cwd=scrdir, stdout=stdout, stderr=stderr, **subprocess_kwargs)
+            else:
+                proc = await create(
+                    *args, cwd=scrdir, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **subprocess_kwargs
+                )
+
+            # drain both pipes as they fill so the child never stalls on a full buffer
+            captures = {k: OutputCapture(capture_policy, capture_size) for k in ["stdout", "stderr"]}
+            sinks = _output_sinks(False, output_callback)
+            pipes = {"stdout": proc.stdout, "stderr": proc.stderr}
+            drains = [_drain_async(pipes[k], captures[k], sinks[k]) for k in captures if pipes[k] is not None]
+            finished = asyncio.ensure_future(asyncio.gather(proc.wait(), *drains))
+            try:
                 # Wait for the subprocess to complete or the timeout to expire
-                if interupt_after is None:
-                    proc["proc"].wait(timeout=timeout)
-                else:
-                    time.sleep(interupt_after)
-                    terminate_process(proc["proc"])
-            retcode = proc["proc"].poll()
-        proc["outfiles"] = extrafiles
-    proc["scratch_directory"] = scrdir
+                try:
+                    await asyncio.wait_for(asyncio.shield(finished), interupt_after or timeout)
+                except asyncio.TimeoutError:
+                    if interupt_after is None:
+                        raise subprocess.TimeoutExpired(command, timeout) from None
+            finally:
+                # Executes on an exception (including cancellation) or once the process is done
+                await _terminate_process_async(proc)
+                await finished
+
+            retcode = proc.returncode
+
+        ret = {"proc": proc, "outfiles": extrafiles}
+        if spill_output:
+            _spilled_output(ret, spill_paths, move_to=None if scratch_messy else os.path.dirname(scrdir))
+        else:
+            for k, capture in captures.items():
+                ret[k] = capture.getvalue()
+        if manager is not None:
+            ret["scratch_usage"] = manager.measure(program, scrdir)
+    ret["scratch_directory"] = scrdir
+
+    success = retcode <= exit_code
+    if success and capture_policy == "discard_on_success" and not spill_output:
+        ret["stdout"] = ret["stderr"] = ""
 
-    return retcode <= exit_code, proc
+    return success, ret
 
 
 @contextmanager